@@ -0,0 +1,114 @@
+"""
+Compare l'import de documents et de variables entité par entité et par lots
+UNWIND, directement sur la base Neo4j configurée (NEO4J_URI).
+
+Le chemin entité par entité écrit une ligne par transaction, une à la fois
+par défaut (--concurrency 1, comme un appel de l'API par entité) ; une
+concurrence plus élevée est plafonnée à la taille du pool de connexions
+(NEO4J_MAX_CONNECTION_POOL_SIZE) pour ne pas mesurer l'attente d'une
+connexion libre.
+
+Les nœuds créés portent une description propre à l'exécution et sont
+supprimés à la fin.
+
+Usage:
+    python -m benchmarks.bulk_ingest --rows 5000 --batch-size 1000 --concurrency 1
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List
+
+from src.core.config import settings
+from src.db.neo4j_async import async_db
+from src.db.session import close_async_driver, get_async_driver
+
+
+def document_rows(count: int, marker: str) -> List[Dict[str, Any]]:
+    created_at = datetime.utcnow().isoformat()
+    return [
+        {"id": str(uuid.uuid4()), "name": f"Facture {i}", "description": marker,
+         "created_at": created_at, "status": "draft"}
+        for i in range(count)
+    ]
+
+
+def variable_rows(count: int, marker: str) -> List[Dict[str, Any]]:
+    return [
+        {"id": str(uuid.uuid4()), "name": f"bench_{marker}_{i}", "value": str(i),
+         "description": marker, "document_id": None}
+        for i in range(count)
+    ]
+
+
+async def measure(label: str, rows: int, run: Callable[[], Awaitable[None]]) -> float:
+    start = time.perf_counter()
+    await run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} lignes={rows:>7} total={elapsed:>7.2f}s lignes/s={rows / elapsed:>9.0f}")
+    return elapsed
+
+
+async def bounded(concurrency: int, calls: List[Callable[[], Awaitable[Any]]]) -> None:
+    """
+    Exécute les appels avec au plus concurrency appels en cours.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(call: Callable[[], Awaitable[Any]]) -> None:
+        async with semaphore:
+            await call()
+
+    await asyncio.gather(*(run(call) for call in calls))
+
+
+async def cleanup(marker: str) -> None:
+    async with get_async_driver().session() as session:
+        await session.run(
+            "MATCH (n) WHERE (n:Document OR n:Variable) AND n.description = $marker "
+            "CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS",
+            marker=marker
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="écritures entité par entité simultanées (plafonné à la taille du pool)")
+    args = parser.parse_args()
+    marker = f"benchmark-{uuid.uuid4()}"
+    concurrency = max(1, min(args.concurrency, settings.NEO4J_MAX_CONNECTION_POOL_SIZE))
+    print(f"entité par entité : {concurrency} écriture(s) simultanée(s)")
+
+    async def batches(write, rows):
+        for start in range(0, len(rows), args.batch_size):
+            await write(rows[start:start + args.batch_size])
+
+    try:
+        documents = document_rows(args.rows, marker)
+        single = await measure("documents, un par un", args.rows, lambda: bounded(concurrency, [
+            lambda row=row: async_db.create_document_draft(row) for row in documents
+        ]))
+        documents = document_rows(args.rows, marker)
+        bulk = await measure("documents, UNWIND", args.rows, lambda: batches(async_db.create_documents_bulk, documents))
+        print(f"accélération x{single / bulk:.1f}")
+
+        variables = variable_rows(args.rows, marker)
+        single = await measure("variables, une par une", args.rows, lambda: bounded(concurrency, [
+            lambda row=row: async_db.create_named_variable({key: row[key] for key in ("id", "name", "value", "description")})
+            for row in variables
+        ]))
+        variables = variable_rows(args.rows, marker)
+        bulk = await measure("variables, UNWIND", args.rows, lambda: batches(async_db.create_variables_bulk, variables))
+        print(f"accélération x{single / bulk:.1f}")
+    finally:
+        await cleanup(marker)
+        await close_async_driver()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
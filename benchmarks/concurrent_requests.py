@@ -0,0 +1,73 @@
+"""
+Mesure le débit d'un endpoint de l'API en fonction du niveau de concurrence.
+
+Avec une couche d'accès Neo4j asynchrone, le débit doit augmenter avec la
+concurrence au lieu de rester plafonné à celui d'une requête à la fois.
+
+Usage:
+    python -m benchmarks.concurrent_requests --url http://localhost:8000 \\
+        --path /variables/variables/ --requests 500 --concurrency 1 4 16 64
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+import httpx
+
+
+async def run_level(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> Dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one() -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": total / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", required=True)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = parser.parse_args()
+
+    limits = httpx.Limits(max_connections=max(args.concurrency))
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+        for level in args.concurrency:
+            stats = await run_level(client, args.path, args.requests, level)
+            print(
+                f"concurrency={stats['concurrency']:>4} "
+                f"rps={stats['throughput_rps']:>8.1f} "
+                f"p50={stats['p50_ms']:>7.1f}ms "
+                f"p95={stats['p95_ms']:>7.1f}ms "
+                f"errors={stats['errors']}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
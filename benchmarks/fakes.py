@@ -0,0 +1,283 @@
+"""
+Doublures en mémoire de Neo4j et MinIO pour les benchmarks (benchmarks.hot_paths).
+
+FakeMinio reproduit la partie du client minio utilisée par l'application
+(objets, lectures par plage, ETag, NoSuchKey). FakeNeo4jDatabase remplace les
+méthodes de async_db utilisées par les chemins mesurés, avec la même
+pagination par curseur (created_at, id) décroissants.
+
+install_fake_minio() doit être appelé avant le premier import de src : le
+client MinIO est créé à l'import de src.db.minio_client.
+"""
+import bisect
+import hashlib
+import io
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import minio
+from minio.error import S3Error
+
+
+def _no_such_key(bucket_name: str, object_name: str) -> S3Error:
+    return S3Error(
+        "NoSuchKey", "The specified key does not exist.", object_name,
+        "fake-request", "fake-host", None, bucket_name=bucket_name, object_name=object_name
+    )
+
+
+class _FakeResponse:
+    def __init__(self, data: bytes, etag: str, content_type: str):
+        self._buffer = io.BytesIO(data)
+        self.headers = {"ETag": f'"{etag}"', "Content-Type": content_type, "Content-Length": str(len(data))}
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self._buffer.read(amt)
+
+    def stream(self, amt: int = 64 * 1024) -> Iterator[bytes]:
+        while True:
+            chunk = self._buffer.read(amt)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        pass
+
+
+class FakeMinio:
+    """
+    Stockage objet en mémoire compatible avec les appels minio.Minio de l'application.
+    """
+    def __init__(self, endpoint: str = "", *args: Any, **kwargs: Any):
+        self._buckets: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def bucket_exists(self, bucket_name: str) -> bool:
+        return bucket_name in self._buckets
+
+    def make_bucket(self, bucket_name: str, *args: Any, **kwargs: Any) -> None:
+        self._buckets.setdefault(bucket_name, {})
+
+    def _bucket(self, bucket_name: str) -> Dict[str, Dict[str, Any]]:
+        return self._buckets.setdefault(bucket_name, {})
+
+    def put_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: Any,
+        length: int,
+        content_type: str = "application/octet-stream",
+        **kwargs: Any
+    ) -> SimpleNamespace:
+        content = data.read() if length < 0 else data.read(length)
+        etag = hashlib.md5(content).hexdigest()
+        self._bucket(bucket_name)[object_name] = {
+            "data": content,
+            "etag": etag,
+            "content_type": content_type,
+            "last_modified": datetime.now(timezone.utc)
+        }
+        return SimpleNamespace(bucket_name=bucket_name, object_name=object_name, etag=etag)
+
+    def _get(self, bucket_name: str, object_name: str) -> Dict[str, Any]:
+        obj = self._bucket(bucket_name).get(object_name)
+        if obj is None:
+            raise _no_such_key(bucket_name, object_name)
+        return obj
+
+    def get_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        offset: int = 0,
+        length: int = 0,
+        **kwargs: Any
+    ) -> _FakeResponse:
+        obj = self._get(bucket_name, object_name)
+        end = offset + length if length else len(obj["data"])
+        return _FakeResponse(obj["data"][offset:end], obj["etag"], obj["content_type"])
+
+    def stat_object(self, bucket_name: str, object_name: str, **kwargs: Any) -> SimpleNamespace:
+        obj = self._get(bucket_name, object_name)
+        return SimpleNamespace(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            size=len(obj["data"]),
+            etag=obj["etag"],
+            content_type=obj["content_type"],
+            last_modified=obj["last_modified"]
+        )
+
+    def remove_object(self, bucket_name: str, object_name: str, **kwargs: Any) -> None:
+        self._bucket(bucket_name).pop(object_name, None)
+
+    def list_objects(
+        self,
+        bucket_name: str,
+        prefix: Optional[str] = None,
+        recursive: bool = False,
+        **kwargs: Any
+    ) -> Iterator[SimpleNamespace]:
+        prefix = prefix or ""
+        directories = set()
+        for name in sorted(self._bucket(bucket_name)):
+            if not name.startswith(prefix):
+                continue
+            rest = name[len(prefix):]
+            if not recursive and "/" in rest:
+                directory = prefix + rest.split("/", 1)[0] + "/"
+                if directory not in directories:
+                    directories.add(directory)
+                    yield SimpleNamespace(object_name=directory, is_dir=True, size=0)
+                continue
+            yield SimpleNamespace(
+                object_name=name, is_dir=False, size=len(self._bucket(bucket_name)[name]["data"])
+            )
+
+    def presigned_get_object(self, bucket_name: str, object_name: str, *args: Any, **kwargs: Any) -> str:
+        return f"http://fake-minio/{bucket_name}/{object_name}"
+
+
+def install_fake_minio() -> None:
+    """
+    Remplace minio.Minio par FakeMinio pour les modules importés ensuite.
+    """
+    minio.Minio = FakeMinio
+
+
+class _Collection:
+    """
+    Nœuds d'un label, paginés par (created_at, id) décroissants comme les
+    requêtes iter_* de AsyncNeo4jDatabase. indexed_by reproduit un index
+    Neo4j sur une propriété (lecture sans parcourir tout le label).
+    """
+    def __init__(self, indexed_by: Optional[str] = None):
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.indexed_by = indexed_by
+        self.index: Dict[Any, str] = {}
+        self._keys: List[Tuple[str, str]] = []
+        self._sorted = True
+
+    def put(self, item: Dict[str, Any]) -> None:
+        if item["id"] not in self.items:
+            self._sorted = False
+        self.items[item["id"]] = item
+        if self.indexed_by and item.get(self.indexed_by) is not None:
+            self.index[item[self.indexed_by]] = item["id"]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def page(
+        self,
+        limit: int,
+        after_created_at: Optional[str],
+        after_id: Optional[str],
+        fields: Optional[List[str]]
+    ) -> List[Dict[str, Any]]:
+        if not self._sorted:
+            self._keys = sorted((str(item.get("created_at") or ""), item_id) for item_id, item in self.items.items())
+            self._sorted = True
+        end = len(self._keys)
+        if after_created_at is not None:
+            end = bisect.bisect_left(self._keys, (after_created_at, after_id or ""))
+        rows = []
+        for created_at, item_id in reversed(self._keys[max(0, end - limit - 1):end]):
+            item = self.items[item_id]
+            rows.append({
+                "id": item_id,
+                "created_at": created_at,
+                "item": {key: item.get(key) for key in fields} if fields else dict(item)
+            })
+        return rows
+
+
+class FakeNeo4jDatabase:
+    """
+    Remplaçant en mémoire des méthodes de AsyncNeo4jDatabase utilisées par
+    les benchmarks.
+    """
+    def __init__(self):
+        self.documents = _Collection()
+        self.variables = _Collection(indexed_by="name")
+        self.scenarios = _Collection()
+        self.executions: Dict[str, Dict[str, Any]] = {}
+
+    # Documents
+
+    async def create_document_draft(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        self.documents.put(dict(document))
+        return dict(document)
+
+    async def create_documents_bulk(self, rows: List[Dict[str, Any]]) -> List[str]:
+        for row in rows:
+            self.documents.put(dict(row))
+        return [row["id"] for row in rows]
+
+    async def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
+        document = self.documents.items.get(document_id)
+        return dict(document) if document else None
+
+    async def update_document_file(self, document_id: str, file_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        document = self.documents.items.get(document_id)
+        if document is None:
+            return None
+        document.update(file_info)
+        return dict(document)
+
+    async def iter_documents(self, limit, after_created_at=None, after_id=None, fields=None) -> AsyncIterator[Dict[str, Any]]:
+        for row in self.documents.page(limit, after_created_at, after_id, fields):
+            yield row
+
+    # Variables
+
+    async def create_named_variable(self, variable: Dict[str, Any]) -> Dict[str, Any]:
+        self.variables.put(dict(variable))
+        return dict(variable)
+
+    async def create_variables_bulk(self, rows: List[Dict[str, Any]]) -> List[str]:
+        for row in rows:
+            self.variables.put(dict(row))
+        return [row["id"] for row in rows]
+
+    async def iter_variables(self, limit, after_created_at=None, after_id=None, fields=None) -> AsyncIterator[Dict[str, Any]]:
+        for row in self.variables.page(limit, after_created_at, after_id, fields):
+            yield row
+
+    async def get_variables_by_ids_or_names(self, ids: List[str], names: List[str]) -> List[Dict[str, Any]]:
+        found = {variable_id for variable_id in ids if variable_id in self.variables.items}
+        found.update(self.variables.index[name] for name in names if name in self.variables.index)
+        return [dict(self.variables.items[variable_id]) for variable_id in found]
+
+    # Catalogue des scénarios et historique des exécutions
+
+    async def upsert_scenario_summary(self, summary: Dict[str, Any]) -> None:
+        self.scenarios.put(dict(summary))
+
+    async def iter_scenarios(
+        self, limit, after_created_at=None, after_id=None, fields=None,
+        tag=None, status=None, created_by=None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # Les filtres ne sont pas utilisés par les benchmarks
+        for row in self.scenarios.page(limit, after_created_at, after_id, fields):
+            yield row
+
+    async def record_executions(self, rows: List[Dict[str, Any]]) -> int:
+        for row in rows:
+            self.executions[row["execution_id"]] = dict(row)
+        return len(rows)
+
+
+def install_fake_neo4j(database: Any, fake: FakeNeo4jDatabase) -> None:
+    """
+    Redirige les méthodes de l'instance async_db partagée vers fake : tous les
+    modules qui l'ont importée utilisent alors la base en mémoire.
+    """
+    for name in dir(fake):
+        if not name.startswith("_") and callable(getattr(fake, name)):
+            setattr(database, name, getattr(fake, name))
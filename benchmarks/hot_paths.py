@@ -0,0 +1,346 @@
+"""
+Mesure les chemins critiques de l'API sans Neo4j ni MinIO : la base est
+remplacée par FakeNeo4jDatabase et le stockage par FakeMinio (benchmarks.fakes).
+
+Chemins mesurés : connexion (get_user_by_email, POST /auth/token), envoi et
+téléchargement de documents, listes paginées à 1k/10k/100k entités,
+exécution de scénario, extraction PDF (à froid et depuis le cache) et rendu
+de templates. Les requêtes HTTP passent par l'application ASGI complète
+(middlewares, validation, sérialisation).
+
+Les résultats sont écrits en JSON (commit, durées p50/p95 par chemin) ;
+--baseline compare avec un fichier produit sur un autre commit.
+
+Usage:
+    python -m benchmarks.hot_paths --sizes 1000 10000 100000
+    python -m benchmarks.hot_paths --baseline benchmarks/results/hot_paths-abc1234.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+TEMPLATE = """
+<h1>Facture {{ number }} - client {{ client_code }}</h1>
+<table>
+{% for line in lines %}
+  <tr><td>{{ line.label }}</td><td>{{ "%.2f"|format(line.amount) }}</td></tr>
+{% endfor %}
+</table>
+<p>Total : {{ "%.2f"|format(lines|sum(attribute="amount")) }} €</p>
+"""
+
+CONTEXT = {
+    "number": "F-000042",
+    "client_code": "C42",
+    "lines": [{"label": f"Article {n}", "amount": n * 10.5} for n in range(1, 11)],
+}
+
+Operation = Callable[[int], Awaitable[Any]]
+
+
+def make_pdf(texts: List[str]) -> bytes:
+    """
+    PDF minimal d'une page par texte (police Helvetica, sans dépendance).
+    """
+    count = len(texts)
+    font = 3 + 2 * count
+    objects = [
+        "<</Type/Catalog/Pages 2 0 R>>",
+        f"<</Type/Pages/Kids[{' '.join(f'{3 + 2 * i} 0 R' for i in range(count))}]/Count {count}>>",
+    ]
+    for index, text in enumerate(texts):
+        stream = f"BT /F1 12 Tf 10 80 Td ({text}) Tj ET"
+        objects.append(
+            f"<</Type/Page/Parent 2 0 R/MediaBox[0 0 300 144]/Contents {4 + 2 * index} 0 R"
+            f"/Resources<</Font<</F1 {font} 0 R>>>>>>"
+        )
+        objects.append(f"<</Length {len(stream)}>>stream\n{stream}\nendstream\n")
+    objects.append("<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>")
+
+    out = "%PDF-1.1\n"
+    offsets = []
+    for index, body in enumerate(objects):
+        offsets.append(len(out))
+        out += f"{index + 1} 0 obj{body}endobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    out += f"trailer<</Size {len(objects) + 1}/Root 1 0 R>>\nstartxref\n{xref}\n%%EOF"
+    return out.encode("latin-1")
+
+
+def git_commit() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+def summarize(durations: List[float]) -> Dict[str, float]:
+    ordered = sorted(durations)
+
+    def percentile(percent: float) -> float:
+        return ordered[max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))]
+
+    total = sum(ordered)
+    return {
+        "iterations": len(ordered),
+        "mean_ms": total / len(ordered) * 1000,
+        "p50_ms": percentile(50) * 1000,
+        "p95_ms": percentile(95) * 1000,
+        "min_ms": ordered[0] * 1000,
+        "max_ms": ordered[-1] * 1000,
+        "ops_per_s": len(ordered) / total if total else 0.0,
+    }
+
+
+async def measure(results: Dict[str, Any], name: str, iterations: int, operation: Operation, warmup: int = 1) -> None:
+    for index in range(warmup):
+        await operation(-1 - index)
+    durations = []
+    for index in range(iterations):
+        start = time.perf_counter()
+        await operation(index)
+        durations.append(time.perf_counter() - start)
+    results[name] = summarize(durations)
+    stats = results[name]
+    print(f"{name:<34} n={stats['iterations']:>5} p50={stats['p50_ms']:>9.3f}ms "
+          f"p95={stats['p95_ms']:>9.3f}ms ops/s={stats['ops_per_s']:>9.0f}")
+
+
+def check(response: Any) -> Any:
+    if response.status_code >= 400:
+        raise RuntimeError(f"{response.request.method} {response.request.url} -> {response.status_code}: {response.text[:200]}")
+    return response
+
+
+def configure_environment(workdir: str) -> None:
+    # Les réglages sont lus à l'import de src : à fixer avant le premier import
+    defaults = {
+        "NEO4J_URI": "bolt://localhost:7687",
+        "NEO4J_USER": "neo4j",
+        "NEO4J_PASSWORD": "benchmark",
+        "MINIO_ENDPOINT": "localhost:9000",
+        "MINIO_ACCESS_KEY": "benchmark",
+        "MINIO_SECRET_KEY": "benchmark",
+        "MINIO_BUCKET": "documents",
+    }
+    for key, value in defaults.items():
+        os.environ.setdefault(key, value)
+    os.environ["TEMPLATE_DIR"] = os.path.join(workdir, "templates")
+    os.environ["TEMPLATE_BYTECODE_CACHE_DIR"] = os.path.join(workdir, "jinja")
+    os.environ["PDF_CACHE_DIR"] = os.path.join(workdir, "pdf-text")
+    os.makedirs(os.environ["TEMPLATE_DIR"])
+    with open(os.path.join(os.environ["TEMPLATE_DIR"], "bench_invoice.html"), "w", encoding="utf-8") as f:
+        f.write(TEMPLATE)
+
+
+def seed(collection: Any, size: int, prefix: str, extra: Callable[[int], Dict[str, Any]]) -> None:
+    base = datetime(2024, 1, 1)
+    for index in range(len(collection), size):
+        collection.put({
+            "id": f"{prefix}-{index:08d}",
+            "created_at": (base + timedelta(seconds=index)).isoformat(),
+            **extra(index),
+        })
+
+
+async def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    # Imports différés : configure_environment et install_fake_minio doivent
+    # précéder l'import de src, et les processus du pool PDF réimportent ce module
+    import httpx
+
+    from benchmarks.fakes import FakeNeo4jDatabase, install_fake_neo4j
+    from src.core.pagination import encode_cursor
+    from src.db.neo4j_async import async_db
+    from src.main import app
+    from src.services.auth import create_user, get_user_by_email
+    from src.services.pdf import PDFService, pdf_pool
+    from src.services.scenario import ScenarioService
+    from src.services.template import TemplateProcessor
+    from src.tasks.scenarios import ScenarioRunner
+
+    fake = FakeNeo4jDatabase()
+    install_fake_neo4j(async_db, fake)
+    results: Dict[str, Any] = {}
+    transport = httpx.ASGITransport(app=app)
+
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            # Connexion
+            email, password = "bench@example.com", "benchmark-password"
+            await create_user({"email": email, "password": password, "full_name": "Bench"})
+            await measure(results, "auth.get_user_by_email", 2000, lambda i: get_user_by_email(email))
+
+            async def login(i: int) -> str:
+                response = check(await client.post(app.url_path_for("login"), data={"username": email, "password": password}))
+                return response.json()["access_token"]
+            # Dominé par la vérification bcrypt du mot de passe
+            await measure(results, "http.login", 10, login)
+            headers = {"Authorization": f"Bearer {await login(0)}"}
+
+            # Documents : envoi et téléchargement d'un fichier de 1 Mio
+            document = check(await client.post(app.url_path_for("create_document"), json={"name": "Benchmark"})).json()
+            payload = os.urandom(1024 * 1024)
+            upload_path = app.url_path_for("upload_document_file", document_id=document["id"])
+            download_path = app.url_path_for("download_document_file", document_id=document["id"])
+
+            async def upload(i: int) -> None:
+                check(await client.post(upload_path, files={"file": ("bench.bin", payload, "application/octet-stream")}))
+
+            async def download(i: int) -> None:
+                response = check(await client.get(download_path))
+                if len(response.content) != len(payload):
+                    raise RuntimeError("Contenu téléchargé incomplet")
+
+            await measure(results, "http.document_upload_1mib", 30, upload)
+            await measure(results, "http.document_download_1mib", 30, download)
+
+            # Listes paginées : première page et page au milieu de la collection
+            lists = [
+                ("documents", fake.documents, "list_documents", lambda i: {"name": f"Document {i}", "status": "draft"}, {}),
+                ("variables", fake.variables, "list_variables", lambda i: {"name": f"var_{i}", "value": str(i)}, {}),
+                ("scenarios", fake.scenarios, "list_scenarios",
+                 lambda i: {"name": f"Scénario {i}", "status": "draft", "tags": [], "steps_count": 3}, headers),
+            ]
+            for size in sorted(args.sizes):
+                for label, collection, route, extra, list_headers in lists:
+                    seed(collection, size, label, extra)
+                    path = app.url_path_for(route)
+                    middle_key = sorted((item["created_at"], item_id) for item_id, item in collection.items.items())[len(collection) // 2]
+                    cursor = encode_cursor(*middle_key)
+
+                    async def first_page(i: int, path: str = path, list_headers: Dict[str, str] = list_headers) -> None:
+                        check(await client.get(path, params={"limit": 100}, headers=list_headers))
+
+                    async def middle_page(i: int, path: str = path, list_headers: Dict[str, str] = list_headers, cursor: str = cursor) -> None:
+                        check(await client.get(path, params={"limit": 100, "cursor": cursor}, headers=list_headers))
+
+                    await measure(results, f"http.list_{label}[{size}].first_page", 50, first_page)
+                    await measure(results, f"http.list_{label}[{size}].middle_page", 50, middle_page)
+
+            # Exécution d'un scénario : variables résolues puis trois étapes template
+            await fake.create_named_variable({"id": "bench-client-code", "name": "client_code", "value": "C42",
+                                              "created_at": datetime.utcnow().isoformat()})
+            scenario = await ScenarioService().create_scenario({
+                "name": "Benchmark",
+                "steps": [
+                    {"order": order, "type": "template", "template": "bench_invoice.html",
+                     "context": {"number": f"{{{{ client_code }}}}-{order}"}}
+                    for order in range(1, 4)
+                ],
+            })
+            runner = ScenarioRunner()
+
+            async def execute(i: int) -> None:
+                outcome = await runner.run(scenario["id"], {"lines": CONTEXT["lines"]})
+                if outcome["status"] != "success":
+                    raise RuntimeError(f"Exécution du scénario en échec: {outcome}")
+
+            await measure(results, "scenario.execute_3_template_steps", 200, execute)
+
+            # Extraction PDF : document inédit (pool de processus) puis depuis le cache
+            pages = 20
+
+            async def extract_cold(i: int) -> None:
+                await PDFService.extract_text_from_pdf(make_pdf([f"Run {i} page {n}" for n in range(pages)]))
+
+            cached_pdf = make_pdf([f"Cached page {n}" for n in range(pages)])
+            await measure(results, f"pdf.extract_{pages}_pages_cold", 5, extract_cold)
+            await measure(results, f"pdf.extract_{pages}_pages_cached", 50, lambda i: PDFService.extract_text_from_pdf(cached_pdf))
+
+            # Rendu de templates (fichier et chaîne, compilation en cache)
+            processor = TemplateProcessor()
+
+            async def render_file(i: int) -> None:
+                processor.process_template("bench_invoice.html", CONTEXT)
+
+            async def render_string(i: int) -> None:
+                processor.process_string(TEMPLATE, CONTEXT)
+
+            await measure(results, "template.render_file", 5000, render_file)
+            await measure(results, "template.render_string", 5000, render_string)
+    finally:
+        pdf_pool.shutdown()
+
+    return results
+
+
+def compare(results: Dict[str, Any], baseline_path: str, threshold: float) -> List[str]:
+    """
+    Affiche l'écart de p50 avec un fichier de référence et retourne les
+    chemins ralentis de plus de threshold %.
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\nComparaison avec {baseline_path} (commit {baseline['meta'].get('commit')})")
+    regressions = []
+    for name, stats in results.items():
+        previous = baseline["results"].get(name)
+        if not previous:
+            print(f"{name:<34} nouveau")
+            continue
+        delta = (stats["p50_ms"] - previous["p50_ms"]) / previous["p50_ms"] * 100 if previous["p50_ms"] else 0.0
+        marker = ""
+        if delta > threshold:
+            marker = "  <-- régression"
+            regressions.append(name)
+        print(f"{name:<34} p50 {previous['p50_ms']:>9.3f}ms -> {stats['p50_ms']:>9.3f}ms ({delta:+.1f}%){marker}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Tailles des collections pour les listes paginées")
+    parser.add_argument("--output", help="Fichier JSON des résultats (défaut : benchmarks/results/hot_paths-<commit>.json)")
+    parser.add_argument("--baseline", help="Résultats JSON d'un autre commit à comparer")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Ralentissement du p50 signalé (en %%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Code de sortie 1 en cas de régression")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="business-automation-bench-")
+    configure_environment(workdir)
+    from benchmarks.fakes import install_fake_minio
+    install_fake_minio()
+
+    results = asyncio.run(run_benchmarks(args))
+
+    meta = {
+        **git_commit(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "sizes": sorted(args.sizes),
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"hot_paths-{meta['commit'] or 'unknown'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+    print(f"\nRésultats écrits dans {output}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Mesure le débit de rendu HTML → PDF (pages par seconde) selon le nombre de
+processus WeasyPrint.
+
+Le cache MinIO est contourné : chaque document est mis en page.
+
+Usage:
+    python -m benchmarks.render_throughput --documents 40 --pages 5 --workers 1 2 4
+"""
+import argparse
+import asyncio
+import time
+
+from src.core.process_pool import ProcessPool
+from src.services.render_worker import html_to_pdf_worker
+from src.services.template import TemplateProcessor
+
+SOURCE = """
+<html><head><style>
+  @page { size: A4; margin: 2cm; }
+  section { page-break-after: always; }
+  table { width: 100%; border-collapse: collapse; }
+  td { border: 1px solid #999; padding: 4px; }
+</style></head><body>
+{% for page in range(pages) %}
+<section>
+  <h1>Facture {{ number }} — page {{ page + 1 }}</h1>
+  <table>
+  {% for line in range(30) %}
+    <tr><td>Article {{ line }}</td><td>{{ "%.2f"|format(line * 12.5) }} €</td></tr>
+  {% endfor %}
+  </table>
+</section>
+{% endfor %}
+</body></html>
+"""
+
+
+async def run_level(workers: int, documents: int, pages: int) -> None:
+    processor = TemplateProcessor()
+    pool = ProcessPool(workers)
+    html = [processor.process_string(SOURCE, {"number": i, "pages": pages}) for i in range(documents)]
+    try:
+        # Démarrer les processus et charger WeasyPrint avant la mesure
+        await asyncio.gather(*(pool.run(html_to_pdf_worker, html[0]) for _ in range(workers)))
+        start = time.perf_counter()
+        results = await asyncio.gather(*(pool.run(html_to_pdf_worker, document) for document in html))
+        elapsed = time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+    total_pages = sum(page_count for _, page_count in results)
+    print(
+        f"workers={workers:>2} documents={documents} pages={total_pages} "
+        f"total={elapsed:.2f}s pages/s={total_pages / elapsed:.1f} "
+        f"pages/s/worker={total_pages / elapsed / workers:.1f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=40)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    for workers in args.workers:
+        await run_level(workers, args.documents, args.pages)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,169 @@
+"""
+Vérifie et mesure les requêtes du graphe des scénarios sur un graphe de test.
+
+Le graphe contient des scénarios reliés à des centaines de documents et de
+variables. Le script compare les anciennes requêtes (UNWIND chaînés,
+OPTIONAL MATCH successifs) aux requêtes actuelles d'AsyncNeo4jDatabase :
+- création d'un scénario sans document ni variable (l'ancienne requête ne
+  retournait aucune ligne) ;
+- nombre de lignes produites avant agrégation et durée des lectures ;
+- exactitude des documents et variables retournés.
+
+Les nœuds créés portent un marqueur propre à l'exécution et sont supprimés à la fin.
+
+Usage:
+    python -m benchmarks.scenario_graph --scenarios 20 --documents 300 --variables 300
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from typing import Any, Dict, List
+
+from src.db.neo4j_async import async_db
+from src.db.session import close_async_driver, get_async_driver
+
+LEGACY_CREATE = """
+CREATE (s:Scenario {id: $id, name: $name, description: $description, steps: $steps,
+                    created_at: $created_at, updated_at: $updated_at})
+WITH s
+UNWIND $document_ids as doc_id
+MATCH (d:Document {id: doc_id})
+CREATE (s)-[:USES]->(d)
+WITH s
+UNWIND $variable_ids as var_id
+MATCH (v:Variable {id: var_id})
+CREATE (s)-[:USES]->(v)
+RETURN s.id
+"""
+
+LEGACY_GET = """
+MATCH (s:Scenario {id: $scenario_id})
+OPTIONAL MATCH (s)-[:USES]->(d:Document)
+OPTIONAL MATCH (s)-[:USES]->(v:Variable)
+RETURN s, collect(distinct d) as documents, collect(distinct v) as variables
+"""
+
+# Nombre de lignes avant agrégation de l'ancienne lecture
+LEGACY_GET_ROWS = """
+MATCH (s:Scenario {id: $scenario_id})
+OPTIONAL MATCH (s)-[:USES]->(d:Document)
+OPTIONAL MATCH (s)-[:USES]->(v:Variable)
+RETURN count(*) AS rows
+"""
+
+
+def scenario_row(marker: str, document_ids: List[str], variable_ids: List[str]) -> Dict[str, Any]:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"Scénario {marker}",
+        "description": marker,
+        "steps": json.dumps([]),
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:00:00",
+        "document_ids": document_ids,
+        "variable_ids": variable_ids,
+    }
+
+
+async def seed(marker: str, documents: int, variables: int) -> Dict[str, List[str]]:
+    document_ids = [str(uuid.uuid4()) for _ in range(documents)]
+    variable_ids = [str(uuid.uuid4()) for _ in range(variables)]
+    await async_db.create_documents_bulk([
+        {"id": i, "name": "Document", "description": marker, "created_at": "2024-01-01T00:00:00", "status": "draft"}
+        for i in document_ids
+    ])
+    await async_db.create_variables_bulk([
+        {"id": i, "name": f"var_{i}", "value": "x", "description": marker, "document_id": None}
+        for i in variable_ids
+    ])
+    return {"documents": document_ids, "variables": variable_ids}
+
+
+async def run_query(query: str, **params: Any) -> List[Any]:
+    async with get_async_driver().session() as session:
+        result = await session.run(query, **params)
+        return [record async for record in result]
+
+
+async def timed(label: str, repeat: int, func) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<40} {elapsed * 1000:>9.2f} ms")
+    return elapsed
+
+
+def check(condition: bool, message: str) -> bool:
+    print(f"[{'OK' if condition else 'ÉCHEC'}] {message}")
+    return condition
+
+
+async def cleanup(marker: str) -> None:
+    async with get_async_driver().session() as session:
+        await session.run(
+            "MATCH (n) WHERE (n:Scenario OR n:Document OR n:Variable) AND n.description = $marker "
+            "CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS",
+            marker=marker
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", type=int, default=20)
+    parser.add_argument("--documents", type=int, default=300)
+    parser.add_argument("--variables", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    marker = f"benchmark-{uuid.uuid4()}"
+    ok = True
+
+    try:
+        linked = await seed(marker, args.documents, args.variables)
+
+        # Régression : scénario sans document ni variable
+        empty = scenario_row(marker, [], [])
+        legacy_rows = await run_query(LEGACY_CREATE, **{**empty, "id": str(uuid.uuid4())})
+        ok &= check(not legacy_rows, "ancienne création sans liens : aucune ligne retournée (comportement corrigé)")
+        created_id = await async_db.create_scenario(empty)
+        ok &= check(created_id == empty["id"], "création sans liens : l'ID du scénario est retourné")
+
+        # Création de scénarios reliés à tous les documents et variables
+        scenarios = [scenario_row(marker, linked["documents"], linked["variables"]) for _ in range(args.scenarios)]
+        start = time.perf_counter()
+        for scenario in scenarios:
+            await async_db.create_scenario(scenario)
+        print(f"{'création (actuelle), par scénario':<40} {(time.perf_counter() - start) / len(scenarios) * 1000:>9.2f} ms")
+
+        scenario_id = scenarios[0]["id"]
+        current = await async_db.get_scenario(scenario_id)
+        ok &= check(
+            len(current["documents"]) == args.documents and len(current["variables"]) == args.variables,
+            f"lecture : {len(current['documents'])} documents et {len(current['variables'])} variables"
+        )
+        legacy = await run_query(LEGACY_GET, scenario_id=scenario_id)
+        ok &= check(
+            {d["id"] for d in legacy[0]["documents"]} == {d["id"] for d in current["documents"]}
+            and {v["id"] for v in legacy[0]["variables"]} == {v["id"] for v in current["variables"]},
+            "lecture : mêmes documents et variables que l'ancienne requête"
+        )
+        rows = (await run_query(LEGACY_GET_ROWS, scenario_id=scenario_id))[0]["rows"]
+        print(f"ancienne lecture : {rows} lignes avant agrégation, contre 1 pour la nouvelle")
+
+        legacy_time = await timed("lecture d'un scénario (ancienne)", args.repeat,
+                                  lambda: run_query(LEGACY_GET, scenario_id=scenario_id))
+        current_time = await timed("lecture d'un scénario (actuelle)", args.repeat,
+                                   lambda: async_db.get_scenario(scenario_id))
+        print(f"accélération x{legacy_time / current_time:.1f}")
+    finally:
+        await cleanup(marker)
+        await close_async_driver()
+
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
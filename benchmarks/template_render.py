@@ -0,0 +1,60 @@
+"""
+Compare le rendu d'un même template avec et sans cache de compilation.
+
+Sans cache, chaque rendu analyse et compile la source (jinja2.Template) ;
+avec TemplateProcessor.process_string, la compilation n'a lieu qu'une fois.
+
+Usage:
+    python -m benchmarks.template_render --documents 10000
+"""
+import argparse
+import time
+from typing import Any, Callable, Dict
+
+from jinja2 import Template
+
+from src.services.template import TemplateProcessor, template_cache
+
+SOURCE = """
+<h1>Facture {{ number }}</h1>
+<p>Client : {{ customer.name }} ({{ customer.email }})</p>
+<table>
+{% for line in lines %}
+  <tr><td>{{ line.label }}</td><td>{{ "%.2f"|format(line.amount) }}</td></tr>
+{% endfor %}
+</table>
+<p>Total : {{ "%.2f"|format(lines|sum(attribute="amount")) }} €</p>
+{% if notes %}<p>{{ notes }}</p>{% endif %}
+"""
+
+
+def make_context(index: int) -> Dict[str, Any]:
+    return {
+        "number": f"F-{index:06d}",
+        "customer": {"name": f"Client {index}", "email": f"client{index}@example.com"},
+        "lines": [{"label": f"Article {n}", "amount": n * 10.5} for n in range(1, 6)],
+        "notes": "Merci de votre confiance" if index % 2 else "",
+    }
+
+
+def run(label: str, render: Callable[[str, Dict[str, Any]], str], documents: int) -> float:
+    start = time.perf_counter()
+    for index in range(documents):
+        render(SOURCE, make_context(index))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} documents={documents} total={elapsed:.2f}s par_document={elapsed / documents * 1e6:.0f}µs")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=10000)
+    args = parser.parse_args()
+
+    uncached = run("sans cache", lambda source, context: Template(source).render(**context), args.documents)
+    cached = run("avec cache", TemplateProcessor().process_string, args.documents)
+    print(f"accélération x{uncached / cached:.1f} ; cache : {template_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,12 @@ from src.core.security import Token, get_current_user
 from src.services.auth import (
     create_user,
     get_user_by_email,
+    get_current_user_record,
+    update_user,
     verify_password,
     create_access_token
 )
-from src.models.user import UserCreate, UserInDB, User
+from src.models.user import UserCreate, UserInDB, UserUpdate, User
 from src.db.session import get_db
 from datetime import timedelta
 from typing import Any
@@ -48,7 +50,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()) -> dict:
     - **username**: Email de l'utilisateur
     - **password**: Mot de passe de l'utilisateur
     """
-    user = await get_user_by_email(form_data.username)
+    user = await get_user_by_email(form_data.username, use_cache=False)
     if not user or not verify_password(form_data.password, user["hashed_password"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -63,11 +65,32 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()) -> dict:
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/me", response_model=User)
-async def read_users_me(current_user: str = Depends(get_current_user)):
+async def read_users_me(current_user: dict = Depends(get_current_user_record)):
     """
     Récupère les informations de l'utilisateur connecté.
     """
-    user = await get_user_by_email(current_user)
+    return current_user
+
+@router.put("/me", response_model=User)
+async def update_users_me(
+    user_update: UserUpdate,
+    current_user: dict = Depends(get_current_user_record)
+):
+    """
+    Met à jour le nom et le mot de passe de l'utilisateur connecté.
+    
+    - **email**: Doit être l'email actuel (non modifiable)
+    - **full_name**: Nouveau nom complet (optionnel)
+    - **password**: Nouveau mot de passe (optionnel, minimum 8 caractères)
+    """
+    if user_update.email.lower() != current_user["email"].lower():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email cannot be changed"
+        )
+    # is_active et is_superuser ne sont pas modifiables par l'utilisateur lui-même
+    updates = user_update.model_dump(include={"full_name", "password"}, exclude_unset=True)
+    user = await update_user(current_user["email"], updates)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
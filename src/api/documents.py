@@ -1,6 +1,7 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, UploadFile, File, Request, Query
+from typing import List, Dict, Any, Optional
 from src.services.document import DocumentService
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginated_response, parse_fields
 import logging
 
 router = APIRouter(prefix="/documents", tags=["documents"])
@@ -19,15 +20,44 @@ async def create_document(document: Dict[str, Any]):
         logger.error(f"Erreur lors de la création du document: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/bulk")
+async def create_documents_bulk(
+    documents: List[Dict[str, Any]],
+    batch_size: Optional[int] = Query(None, ge=1, le=10000)
+):
+    """
+    Crée des documents en masse.
+    
+    - **batch_size**: Nombre de documents écrits par requête (NEO4J_BULK_BATCH_SIZE par défaut)
+    
+    Retourne le nombre de documents créés, leurs IDs et les erreurs ligne par ligne.
+    """
+    try:
+        document_service = DocumentService()
+        return await document_service.create_documents_bulk(documents, batch_size)
+    except Exception as e:
+        logger.error(f"Erreur lors de l'import des documents: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/")
-async def list_documents():
+async def list_documents(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+):
     """
-    Liste tous les documents disponibles.
+    Liste les documents disponibles, page par page.
+    
+    - **limit**: Nombre de documents par page
+    - **cursor**: Curseur renvoyé par la page précédente (`next_cursor`)
+    - **fields**: Propriétés à renvoyer, séparées par des virgules (optionnel)
     """
     try:
         document_service = DocumentService()
-        documents = await document_service.list_documents()
-        return documents
+        rows = document_service.list_documents(limit, cursor, parse_fields(fields))
+        return await paginated_response(rows, limit)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erreur lors de la récupération des documents: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -63,4 +93,21 @@ async def upload_document_file(
         return result
     except Exception as e:
         logger.error(f"Erreur lors du téléchargement du fichier: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e)) 
+
+@router.get("/{document_id}/download")
+async def download_document_file(document_id: str, request: Request):
+    """
+    Télécharge le fichier associé à un document (requêtes Range prises en charge).
+    """
+    try:
+        document_service = DocumentService()
+        response = await document_service.download_file(document_id, request.headers.get("range"))
+        if not response:
+            raise HTTPException(status_code=404, detail="Document non trouvé")
+        return response
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Erreur lors du téléchargement du fichier: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from src.models.scenario import ExecutionResult
+from src.tasks.executions import execution_queue
+from src.tasks.execution_history import execution_from_history
+from src.db.neo4j_async import async_db
+from src.core.security import get_current_user
+
+router = APIRouter()
+
+@router.get("/{execution_id}", response_model=ExecutionResult)
+async def get_execution(
+    execution_id: str,
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Récupère l'état d'une exécution et les résultats de ses étapes.
+
+    Les exécutions récentes sont servies depuis la mémoire, les plus anciennes
+    depuis l'historique Neo4j.
+    """
+    execution = execution_queue.get(execution_id)
+    if not execution:
+        record = await async_db.get_execution(execution_id)
+        execution = execution_from_history(record) if record else None
+    if not execution:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Execution not found"
+        )
+    return execution
@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from typing import List, Optional
 from src.services.scenario import ScenarioService
 from src.models.scenario import (
     ScenarioCreate,
@@ -9,6 +9,10 @@ from src.models.scenario import (
     ExecutionResult
 )
 from src.core.security import get_current_user
+from src.tasks.executions import execution_queue, QueueFullError
+from src.tasks.execution_history import execution_from_history
+from src.db.neo4j_async import async_db
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginated_response, parse_fields
 
 router = APIRouter()
 scenario_service = ScenarioService()
@@ -30,12 +34,29 @@ async def create_scenario(
     scenario_data["created_by"] = current_user
     return await scenario_service.create_scenario(scenario_data)
 
-@router.get("/scenarios", response_model=List[ScenarioInDB])
-async def list_scenarios(current_user: str = Depends(get_current_user)):
+@router.get("/scenarios")
+async def list_scenarios(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    tag: Optional[str] = None,
+    status: Optional[str] = None,
+    created_by: Optional[str] = None,
+    current_user: str = Depends(get_current_user)
+):
     """
-    Liste tous les scénarios disponibles.
+    Liste les scénarios disponibles, page par page.
+    
+    - **limit**: Nombre de scénarios par page
+    - **cursor**: Curseur renvoyé par la page précédente (`next_cursor`)
+    - **fields**: Propriétés à renvoyer, séparées par des virgules (optionnel)
+    - **tag**, **status**, **created_by**: Filtres (optionnels)
     """
-    return await scenario_service.list_scenarios()
+    rows = scenario_service.list_scenarios(
+        limit, cursor, parse_fields(fields),
+        tag=tag, status=status, created_by=created_by
+    )
+    return await paginated_response(rows, limit)
 
 @router.get("/scenarios/{scenario_id}", response_model=ScenarioInDB)
 async def get_scenario(
@@ -67,25 +88,24 @@ async def update_scenario(
     - **steps**: Nouvelle liste des étapes du scénario (optionnel)
     - **tags**: Nouveaux tags associés au scénario (optionnel)
     """
-    existing_scenario = await scenario_service.get_scenario(scenario_id)
-    if not existing_scenario:
+    update_data = scenario.dict(exclude_unset=True)
+    updated_scenario = await scenario_service.update_scenario(scenario_id, update_data)
+    if not updated_scenario:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Scenario not found"
         )
-    
-    update_data = scenario.dict(exclude_unset=True)
-    updated_scenario = {**existing_scenario, **update_data}
-    return await scenario_service.create_scenario(updated_scenario)
+    return updated_scenario
 
-@router.post("/scenarios/{scenario_id}/execute", response_model=ExecutionResult)
+@router.post("/scenarios/{scenario_id}/execute", response_model=ExecutionResult, status_code=status.HTTP_202_ACCEPTED)
 async def execute_scenario(
     scenario_id: str,
     execution: ScenarioExecution,
     current_user: str = Depends(get_current_user)
 ):
     """
-    Exécute un scénario spécifique.
+    Met en file l'exécution d'un scénario et retourne immédiatement son
+    identifiant ; l'état se consulte via GET /executions/{execution_id}.
     
     - **scenario_id**: ID du scénario à exécuter
     - **parameters**: Paramètres d'exécution du scénario (optionnel)
@@ -97,7 +117,23 @@ async def execute_scenario(
             detail="Scenario not found"
         )
     
-    return await scenario_service.execute_scenario(scenario_id, execution.parameters)
+    try:
+        return await execution_queue.enqueue(scenario_id, execution.parameters, scenario)
+    except QueueFullError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+@router.get("/scenarios/{scenario_id}/executions", response_model=List[ExecutionResult])
+async def list_scenario_executions(
+    scenario_id: str,
+    limit: int = Query(20, ge=1, le=100),
+    before: Optional[str] = Query(None, description="started_at de la dernière exécution de la page précédente"),
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Liste les exécutions les plus récentes d'un scénario (sans le détail des étapes).
+    """
+    records = await async_db.list_scenario_executions(scenario_id, limit, before)
+    return [execution_from_history(record) for record in records]
 
 @router.post("/scenarios/from-pdf", response_model=ScenarioInDB, status_code=status.HTTP_201_CREATED)
 async def create_scenario_from_pdf(
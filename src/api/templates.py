@@ -0,0 +1,82 @@
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from jinja2 import TemplateNotFound
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from typing import AsyncIterator, Optional
+from src.services.template import TemplateProcessor, read_contexts
+from src.core.security import get_current_user
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+INPUT_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+def _input_format(file: UploadFile, input_format: Optional[str]) -> str:
+    if input_format:
+        return input_format
+    extension = os.path.splitext(file.filename or "")[1].lower()
+    if extension in INPUT_FORMATS:
+        return INPUT_FORMATS[extension]
+    if file.content_type == "text/csv":
+        return "csv"
+    return "ndjson"
+
+@router.post("/{template_name}/render-batch")
+async def render_batch(
+    template_name: str,
+    file: UploadFile = File(...),
+    input_format: Optional[str] = Form(None, pattern="^(ndjson|csv)$"),
+    output: str = Query("ndjson", pattern="^(ndjson|zip)$"),
+    window: Optional[int] = Query(None, ge=1, le=1024),
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Rend un template pour chaque contexte d'un fichier NDJSON ou CSV.
+    
+    - **file**: Contextes de rendu, un par ligne (NDJSON ou CSV avec en-tête)
+    - **input_format**: Format du fichier (déduit de son extension par défaut)
+    - **output**: `ndjson` pour recevoir les documents en flux, `zip` pour une archive enregistrée dans MinIO
+    - **window**: Nombre maximal de rendus en cours (TEMPLATE_BATCH_WINDOW par défaut)
+    """
+    processor = TemplateProcessor()
+    try:
+        processor.env.get_template(template_name)
+    except TemplateNotFound:
+        raise HTTPException(status_code=404, detail="Template non trouvé")
+
+    input_format = _input_format(file, input_format)
+
+    if output == "zip":
+        contexts = iterate_in_threadpool(read_contexts(file.file, input_format))
+        try:
+            return await processor.render_batch_archive(template_name, contexts, window)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Erreur lors du rendu du lot: {str(e)}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    # Le fichier reçu est fermé dès la fin de l'endpoint, avant l'envoi de la
+    # réponse : le flux lit une copie temporaire qui lui appartient
+    contexts_file = tempfile.TemporaryFile()
+    await run_in_threadpool(shutil.copyfileobj, file.file, contexts_file)
+    contexts_file.seek(0)
+
+    async def stream() -> AsyncIterator[str]:
+        try:
+            contexts = iterate_in_threadpool(read_contexts(contexts_file, input_format))
+            async for row in processor.render_batch(template_name, contexts, window):
+                yield json.dumps(row) + "\n"
+        except Exception as e:
+            # Le statut HTTP est déjà envoyé : signaler l'erreur en fin de flux
+            logger.error(f"Erreur lors du rendu du lot: {str(e)}")
+            yield json.dumps({"status": "error", "error": str(e)}) + "\n"
+        finally:
+            contexts_file.close()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
@@ -1,13 +1,15 @@
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Dict, Any, Optional
 from src.services.variable import VariableService
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginated_response, parse_fields
+from src.models.variable import VariableCreate, VariableUpdate
 import logging
 
 router = APIRouter(prefix="/variables", tags=["variables"])
 logger = logging.getLogger(__name__)
 
 @router.post("/")
-async def create_variable(variable: Dict[str, Any]):
+async def create_variable(variable: VariableCreate):
     """
     Crée une nouvelle variable.
     """
@@ -19,15 +21,44 @@ async def create_variable(variable: Dict[str, Any]):
         logger.error(f"Erreur lors de la création de la variable: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/bulk")
+async def create_variables_bulk(
+    variables: List[Dict[str, Any]],
+    batch_size: Optional[int] = Query(None, ge=1, le=10000)
+):
+    """
+    Crée des variables en masse (`name`, `value`, `description`, `document_id` optionnels par ligne).
+    
+    - **batch_size**: Nombre de variables écrites par requête (NEO4J_BULK_BATCH_SIZE par défaut)
+    
+    Retourne le nombre de variables créées, leurs IDs et les erreurs ligne par ligne.
+    """
+    try:
+        variable_service = VariableService()
+        return await variable_service.create_variables_bulk(variables, batch_size)
+    except Exception as e:
+        logger.error(f"Erreur lors de l'import des variables: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/")
-async def list_variables():
+async def list_variables(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+):
     """
-    Liste toutes les variables disponibles.
+    Liste les variables disponibles, page par page.
+    
+    - **limit**: Nombre de variables par page
+    - **cursor**: Curseur renvoyé par la page précédente (`next_cursor`)
+    - **fields**: Propriétés à renvoyer, séparées par des virgules (optionnel)
     """
     try:
         variable_service = VariableService()
-        variables = await variable_service.list_variables()
-        return variables
+        rows = variable_service.list_variables(limit, cursor, parse_fields(fields))
+        return await paginated_response(rows, limit)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erreur lors de la récupération des variables: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -50,7 +81,7 @@ async def get_variable(variable_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/{variable_id}")
-async def update_variable(variable_id: str, variable: Dict[str, Any]):
+async def update_variable(variable_id: str, variable: VariableUpdate):
     """
     Met à jour une variable existante.
     """
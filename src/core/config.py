@@ -22,6 +22,12 @@ class Settings(BaseSettings):
     NEO4J_URI: str
     NEO4J_USER: str
     NEO4J_PASSWORD: str
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = 100
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 60.0  # secondes
+    NEO4J_MAX_CONNECTION_LIFETIME: int = 3600  # secondes
+    NEO4J_BULK_BATCH_SIZE: int = 1000  # lignes par requête UNWIND
+    NEO4J_SLOW_QUERY_MS: float = 200.0  # journal des requêtes lentes (0 : désactivé)
+    NEO4J_PROFILE_SLOW_QUERIES: bool = False  # ajoute le plan PROFILE/EXPLAIN au journal
     
     # MinIO Settings
     MINIO_ENDPOINT: str
@@ -29,6 +35,55 @@ class Settings(BaseSettings):
     MINIO_SECRET_KEY: str
     MINIO_BUCKET: str
     MINIO_SECURE: bool = False
+    MINIO_PART_SIZE: int = 10 * 1024 * 1024  # taille des parts multipart (min. 5 Mio)
+    MINIO_CHUNK_SIZE: int = 64 * 1024  # taille des morceaux lors des téléchargements
+    
+    # Authentication cache
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 10000  # jetons décodés (durée de vie bornée par exp)
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_USER_CACHE_TTL: float = 300.0  # secondes
+    
+    # Scenario cache
+    SCENARIO_CACHE_MAX_ENTRIES: int = 1000
+    SCENARIO_CACHE_TTL: float = 300.0  # secondes
+    
+    # Scenario executions
+    EXECUTION_CONCURRENCY: int = 4  # exécutions simultanées
+    EXECUTION_MAX_QUEUED: int = 1000
+    EXECUTION_MAX_RESULTS: int = 10000  # états conservés en mémoire
+    EXECUTION_RESULT_TTL: float = 86400.0  # secondes
+    SCENARIO_MAX_PARALLEL_STEPS: int = 4  # étapes indépendantes exécutées en parallèle
+    EXECUTION_HISTORY_BATCH_SIZE: int = 500  # exécutions écrites par requête UNWIND
+    EXECUTION_HISTORY_FLUSH_INTERVAL: float = 1.0  # secondes
+    EXECUTION_HISTORY_MAX_BUFFERED: int = 10000
+    EXECUTION_HISTORY_MAX_RESULT_CHARS: int = 10000  # résultat d'étape tronqué au-delà
+    
+    # PDF extraction (pool de processus)
+    PDF_WORKERS: int = 2
+    PDF_TIMEOUT_SECONDS: float = 60.0
+    PDF_MAX_PAGES: int = 500  # 0 : toutes les pages
+    PDF_STREAM_BATCH_PAGES: int = 10
+    PDF_CACHE_DIR: str = "/tmp/business_automation/pdf-text"
+    PDF_CACHE_DISK_MAX_BYTES: int = 512 * 1024 * 1024
+    
+    # Templates
+    TEMPLATE_CACHE_MAX_ENTRIES: int = 500
+    TEMPLATE_BYTECODE_CACHE_DIR: str = "/tmp/business_automation/jinja"
+    TEMPLATE_DIR: str = "templates"
+    TEMPLATE_BATCH_WINDOW: int = 32
+    
+    # Rendu PDF (WeasyPrint, pool de processus)
+    RENDER_WORKERS: int = 2
+    RENDER_TIMEOUT_SECONDS: float = 120.0
+    
+    # Web automation (pool de navigateurs Playwright)
+    BROWSER_POOL_SIZE: int = 2
+    BROWSER_MAX_USES: int = 100  # contextes servis avant de relancer un navigateur
+    BROWSER_MAX_CONTEXTS: int = 8  # contextes ouverts simultanément
+    
+    # Observabilité
+    TRACING_ENABLED: bool = True  # spans OpenTelemetry si le paquet est installé
+    ROUTE_LATENCY_SAMPLES: int = 1000  # durées conservées par route pour les percentiles
     
     # AI Settings
     OPENAI_API_KEY: Optional[str] = None
@@ -0,0 +1,93 @@
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(created_at: Any, item_id: Optional[str]) -> str:
+    """
+    Encode la position (created_at, id) du dernier élément d'une page.
+    """
+    payload = json.dumps([_json_default(created_at), item_id or ""])
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Décode un curseur produit par encode_cursor.
+
+    Returns:
+        Tuple: (created_at, id), ou (None, None) pour la première page
+    """
+    if not cursor:
+        return None, None
+    try:
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return created_at, item_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Convertit le paramètre fields=a,b,c en liste de propriétés.
+    """
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+def _json_default(value: Any) -> Any:
+    # Les types temporels de Neo4j exposent iso_format(), ceux de Python isoformat()
+    if hasattr(value, "iso_format"):
+        return value.iso_format()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+async def _next_row(rows: AsyncIterator[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    try:
+        return await rows.__anext__()
+    except StopAsyncIteration:
+        return None
+
+async def _page_chunks(
+    first: Optional[Dict[str, Any]],
+    rows: AsyncIterator[Dict[str, Any]],
+    limit: int
+) -> AsyncIterator[bytes]:
+    try:
+        yield b'{"items": ['
+        count = 0
+        next_cursor = None
+        row = first
+        while row is not None:
+            if count == limit:
+                # La requête lit limit + 1 lignes : la dernière signale une page suivante
+                next_cursor = encode_cursor(last["created_at"], last["id"])
+                break
+            prefix = b", " if count else b""
+            yield prefix + json.dumps(row["item"], default=_json_default).encode('utf-8')
+            last = row
+            count += 1
+            row = await _next_row(rows)
+        yield b'], "next_cursor": ' + json.dumps(next_cursor).encode('utf-8') + b'}'
+    finally:
+        await rows.aclose()
+
+async def paginated_response(rows: AsyncIterator[Dict[str, Any]], limit: int) -> StreamingResponse:
+    """
+    Construit une réponse JSON {"items": [...], "next_cursor": ...} écrite au
+    fil de la lecture des résultats, sans matérialiser la page en mémoire.
+
+    Args:
+        rows: Itérateur asynchrone de dictionnaires {"id", "created_at", "item"},
+            triés par (created_at, id) décroissants et limités à limit + 1 lignes
+        limit: La taille de la page
+    """
+    # Lire la première ligne avant d'envoyer les en-têtes pour que les erreurs
+    # de requête remontent encore sous forme de code HTTP
+    first = await _next_row(rows)
+    return StreamingResponse(_page_chunks(first, rows, limit), media_type="application/json")
@@ -0,0 +1,86 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+import asyncio
+import logging
+import multiprocessing
+
+logger = logging.getLogger(__name__)
+
+class ProcessPool:
+    """
+    Pool de processus partagé pour les traitements lourds en CPU (analyse PDF,
+    mise en page), créé à la première utilisation.
+
+    Les fonctions exécutées doivent être définies dans des modules légers :
+    les processus sont démarrés en mode spawn et n'héritent ni des connexions
+    ni des threads du serveur.
+
+    Un travail qui dépasse son délai, ou un processus qui meurt (mémoire,
+    segfault), entraîne l'arrêt des processus du pool ; un nouveau pool est
+    créé à l'utilisation suivante.
+    """
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.recycled = 0
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Exécute func(*args) dans le pool sans bloquer la boucle d'événements.
+
+        Un travail interrompu parce qu'un autre a fait recycler le pool est
+        relancé une fois sur le nouveau pool.
+
+        Raises:
+            asyncio.TimeoutError: Si le résultat n'est pas disponible après timeout
+                secondes ; les processus du pool sont alors arrêtés
+            BrokenProcessPool: Si un processus du pool s'est arrêté brutalement
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self.get_executor()
+            future = loop.run_in_executor(executor, func, *args)
+            try:
+                return await asyncio.wait_for(future, timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Travail {getattr(func, '__name__', func)} interrompu après {timeout} secondes")
+                self._recycle(executor)
+                raise
+            except BrokenProcessPool:
+                if executor is self._executor:
+                    logger.error(f"Un processus du pool s'est arrêté pendant {getattr(func, '__name__', func)}")
+                    self._recycle(executor)
+                    raise
+                if attempt:
+                    raise
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Arrête les processus d'un pool bloqué ou cassé ; le pool suivant est
+        créé à la prochaine utilisation.
+        """
+        if executor is not self._executor:
+            return
+        self._executor = None
+        self.recycled += 1
+        # ProcessPoolExecutor ne sait pas interrompre un travail en cours :
+        # terminer ses processus est le seul moyen de libérer un worker bloqué
+        processes = list((getattr(executor, "_processes", None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -5,7 +5,10 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
+from src.core.cache import TTLCache
+from src.core.config import settings
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -21,6 +24,9 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Jetons déjà vérifiés, associés à leurs claims jusqu'à leur expiration
+token_cache = TTLCache(settings.AUTH_TOKEN_CACHE_MAX_ENTRIES)
+
 class Token(BaseModel):
     access_token: str
     token_type: str
@@ -44,6 +50,29 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
+def decode_token(token: str) -> dict:
+    """
+    Vérifie un JWT et retourne ses claims.
+
+    Les claims sont mis en cache jusqu'à l'expiration du jeton : les requêtes
+    suivantes avec le même jeton évitent la vérification de signature.
+
+    Raises:
+        JWTError: Si le jeton est invalide ou expiré
+    """
+    claims = token_cache.get(token)
+    if claims is not None:
+        # Le TTL suit l'horloge monotone : revérifier exp par sécurité
+        if claims.get("exp") is None or claims["exp"] > time.time():
+            return claims
+        token_cache.invalidate(token)
+    claims = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+    if claims.get("exp") is not None:
+        ttl = claims["exp"] - time.time()
+        if ttl > 0:
+            token_cache.set(token, claims, ttl=ttl)
+    return claims
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -51,7 +80,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        payload = decode_token(token)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
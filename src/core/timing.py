@@ -0,0 +1,112 @@
+"""
+Middleware mesurant la durée de chaque requête HTTP, agrégée par route.
+
+Les percentiles sont calculés sur les ROUTE_LATENCY_SAMPLES dernières
+requêtes de chaque route et exposés par /health/routes ; les durées
+alimentent aussi l'histogramme Prometheus http_request_duration_seconds.
+"""
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.core.config import settings
+from src.core.metrics import registry
+import threading
+import time
+
+request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "Durée des requêtes HTTP, par route",
+    ["method", "route", "status"]
+)
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    # Rang le plus proche
+    index = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+class RouteLatency:
+    def __init__(self, max_samples: int):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        self._counts: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+    def observe(self, method: str, route: str, status: int, duration: float) -> None:
+        key = (method, route)
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.max_samples)
+                self._counts[key] = {"requests": 0, "errors": 0}
+            samples.append(duration)
+            self._counts[key]["requests"] += 1
+            if status >= 500:
+                self._counts[key]["errors"] += 1
+        request_duration.observe(duration, method=method, route=route, status=status)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Percentiles par route (en millisecondes), routes les plus lentes en premier.
+        """
+        with self._lock:
+            items = [(key, sorted(samples), dict(self._counts[key])) for key, samples in self._samples.items()]
+        stats = [
+            {
+                "method": method,
+                "route": route,
+                **counts,
+                "p50_ms": _percentile(samples, 50) * 1000,
+                "p95_ms": _percentile(samples, 95) * 1000,
+                "p99_ms": _percentile(samples, 99) * 1000,
+                "max_ms": samples[-1] * 1000
+            }
+            for (method, route), samples, counts in items
+        ]
+        stats.sort(key=lambda item: item["p95_ms"], reverse=True)
+        return stats
+
+route_latency = RouteLatency(settings.ROUTE_LATENCY_SAMPLES)
+
+class TimingMiddleware:
+    """
+    Middleware ASGI : la durée court jusqu'au dernier morceau du corps de la
+    réponse, y compris pour les réponses en flux.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._routes: Dict[Callable, str] = {}
+
+    def _route_path(self, scope: Scope) -> str:
+        # Le routeur Starlette indique l'endpoint appelé, pas le modèle de chemin :
+        # on le retrouve parmi les routes de l'application pour ne pas créer
+        # une série par identifiant (/documents/{document_id} et non /documents/42)
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        if endpoint not in self._routes:
+            for route in getattr(scope.get("app"), "routes", []):
+                if getattr(route, "endpoint", None) is endpoint:
+                    self._routes[endpoint] = route.path
+                    break
+            else:
+                self._routes[endpoint] = getattr(endpoint, "__name__", "unknown")
+        return self._routes[endpoint]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route_latency.observe(scope["method"], self._route_path(scope), status, time.perf_counter() - start)
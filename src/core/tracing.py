@@ -0,0 +1,26 @@
+"""
+Spans OpenTelemetry optionnels pour les exécutions et leurs étapes.
+
+Sans le paquet opentelemetry-api, ou si TRACING_ENABLED est faux, span() ne
+fait rien. Avec l'API seule, les spans sont ignorés ; l'export (console,
+OTLP...) se configure en installant et initialisant le SDK OpenTelemetry.
+"""
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+from src.core.config import settings
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+_tracer = trace.get_tracer("business_automation") if trace is not None and settings.TRACING_ENABLED else None
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Any]]:
+    if _tracer is None:
+        yield None
+        return
+    attributes = {key: str(value) for key, value in attributes.items() if value is not None}
+    with _tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
@@ -1,19 +1,26 @@
-from neo4j import GraphDatabase
+from neo4j import Driver
 from typing import Optional, List, Dict, Any
-from ..core.config import settings
+from .session import get_driver, close_driver
+from src.core.metrics import instrument_methods, registry
+from .query_log import timed_session
 
+neo4j_call_duration = registry.histogram(
+    "neo4j_call_duration_seconds",
+    "Durée des appels à Neo4j, par méthode",
+    ["operation"]
+)
+
+@instrument_methods(neo4j_call_duration)
 class Neo4jDatabase:
-    def __init__(self):
-        self.driver = GraphDatabase.driver(
-            settings.NEO4J_URI,
-            auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
-        )
+    @property
+    def driver(self) -> Driver:
+        return get_driver()
 
     def close(self):
-        self.driver.close()
+        close_driver()
 
     def create_document(self, document: Dict[str, Any]) -> str:
-        with self.driver.session() as session:
+        with timed_session(self.driver) as session:
             result = session.write_transaction(
                 self._create_document_tx,
                 document
@@ -21,7 +28,7 @@ class Neo4jDatabase:
             return result
 
     def create_variable(self, variable: Dict[str, Any]) -> str:
-        with self.driver.session() as session:
+        with timed_session(self.driver) as session:
             result = session.write_transaction(
                 self._create_variable_tx,
                 variable
@@ -29,7 +36,7 @@ class Neo4jDatabase:
             return result
 
     def create_scenario(self, scenario: Dict[str, Any]) -> str:
-        with self.driver.session() as session:
+        with timed_session(self.driver) as session:
             result = session.write_transaction(
                 self._create_scenario_tx,
                 scenario
@@ -37,7 +44,7 @@ class Neo4jDatabase:
             return result
 
     def get_scenario(self, scenario_id: str) -> Optional[Dict[str, Any]]:
-        with self.driver.session() as session:
+        with timed_session(self.driver) as session:
             result = session.read_transaction(
                 self._get_scenario_tx,
                 scenario_id
@@ -45,17 +52,17 @@ class Neo4jDatabase:
             return result
 
     def get_all_documents(self) -> List[Dict[str, Any]]:
-        with self.driver.session() as session:
+        with timed_session(self.driver) as session:
             result = session.read_transaction(self._get_all_documents_tx)
             return result
 
     def get_all_variables(self) -> List[Dict[str, Any]]:
-        with self.driver.session() as session:
+        with timed_session(self.driver) as session:
             result = session.read_transaction(self._get_all_variables_tx)
             return result
 
     def get_all_scenarios(self) -> List[Dict[str, Any]]:
-        with self.driver.session() as session:
+        with timed_session(self.driver) as session:
             result = session.read_transaction(self._get_all_scenarios_tx)
             return result
 
@@ -79,12 +86,14 @@ class Neo4jDatabase:
     def _create_variable_tx(tx, variable: Dict[str, Any]) -> str:
         query = """
         MATCH (d:Document {id: $document_id})
+        // Dates en DateTime Neo4j, comme pour les autres variables : la
+        // pagination compare created_at à un DateTime
         CREATE (v:Variable {
             id: $id,
             name: $name,
             value: $value,
-            created_at: $created_at,
-            updated_at: $updated_at
+            created_at: datetime(),
+            updated_at: datetime()
         })
         CREATE (v)-[:BELONGS_TO]->(d)
         RETURN v.id
@@ -104,25 +113,34 @@ class Neo4jDatabase:
             updated_at: $updated_at
         })
         WITH s
-        UNWIND $document_ids as doc_id
-        MATCH (d:Document {id: doc_id})
-        CREATE (s)-[:USES]->(d)
-        WITH s
-        UNWIND $variable_ids as var_id
-        MATCH (v:Variable {id: var_id})
-        CREATE (s)-[:USES]->(v)
+        // Sous-requêtes agrégées : une ligne par scénario, même sans document
+        // ni variable, et pas de produit cartésien entre les deux listes
+        CALL {
+            WITH s
+            UNWIND coalesce($document_ids, []) AS doc_id
+            MATCH (d:Document {id: doc_id})
+            MERGE (s)-[:USES]->(d)
+            RETURN count(d) AS documents_count
+        }
+        CALL {
+            WITH s
+            UNWIND coalesce($variable_ids, []) AS var_id
+            MATCH (v:Variable {id: var_id})
+            MERGE (s)-[:USES]->(v)
+            RETURN count(v) AS variables_count
+        }
         RETURN s.id
         """
-        result = tx.run(query, **scenario)
+        result = tx.run(query, **{"document_ids": [], "variable_ids": [], **scenario})
         return result.single()[0]
 
     @staticmethod
     def _get_scenario_tx(tx, scenario_id: str) -> Optional[Dict[str, Any]]:
         query = """
         MATCH (s:Scenario {id: $scenario_id})
-        OPTIONAL MATCH (s)-[:USES]->(d:Document)
-        OPTIONAL MATCH (s)-[:USES]->(v:Variable)
-        RETURN s, collect(distinct d) as documents, collect(distinct v) as variables
+        RETURN s,
+               [(s)-[:USES]->(d:Document) | d] AS documents,
+               [(s)-[:USES]->(v:Variable) | v] AS variables
         """
         result = tx.run(query, scenario_id=scenario_id)
         record = result.single()
@@ -156,9 +174,9 @@ class Neo4jDatabase:
     def _get_all_scenarios_tx(tx) -> List[Dict[str, Any]]:
         query = """
         MATCH (s:Scenario)
-        OPTIONAL MATCH (s)-[:USES]->(d:Document)
-        OPTIONAL MATCH (s)-[:USES]->(v:Variable)
-        RETURN s, collect(distinct d) as documents, collect(distinct v) as variables
+        RETURN s,
+               [(s)-[:USES]->(d:Document) | d] AS documents,
+               [(s)-[:USES]->(v:Variable) | v] AS variables
         """
         result = tx.run(query)
         return [{
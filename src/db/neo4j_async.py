@@ -0,0 +1,669 @@
+from neo4j import AsyncDriver
+from typing import AsyncIterator, Optional, List, Dict, Any
+from .session import get_async_driver, close_async_driver
+from src.core.metrics import instrument_methods, registry
+from .query_log import query_log, timed_async_session
+import time
+
+neo4j_call_duration = registry.histogram(
+    "neo4j_call_duration_seconds",
+    "Durée des appels à Neo4j, par méthode",
+    ["operation"]
+)
+
+@instrument_methods(neo4j_call_duration)
+class AsyncNeo4jDatabase:
+    """
+    Équivalent asynchrone de Neo4jDatabase, basé sur neo4j.AsyncGraphDatabase,
+    pour ne pas bloquer la boucle d'événements des handlers FastAPI.
+    """
+    @property
+    def driver(self) -> AsyncDriver:
+        return get_async_driver()
+
+    async def close(self):
+        await close_async_driver()
+
+    async def create_document(self, document: Dict[str, Any]) -> str:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._create_document_tx, document)
+
+    async def create_variable(self, variable: Dict[str, Any]) -> str:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._create_variable_tx, variable)
+
+    async def create_scenario(self, scenario: Dict[str, Any]) -> str:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._create_scenario_tx, scenario)
+
+    async def get_scenario(self, scenario_id: str) -> Optional[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_read(self._get_scenario_tx, scenario_id)
+
+    async def get_all_documents(self) -> List[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_read(self._get_all_documents_tx)
+
+    async def get_all_variables(self) -> List[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_read(self._get_all_variables_tx)
+
+    async def get_all_scenarios(self) -> List[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_read(self._get_all_scenarios_tx)
+
+    async def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_read(self._get_document_tx, document_id)
+
+    async def get_document_variables(self, document_id: str) -> List[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_read(self._get_document_variables_tx, document_id)
+
+    async def update_variable(self, variable_id: str, variable: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._update_variable_tx, variable_id, variable)
+
+    # Listes paginées par curseur (created_at, id), lues en flux.
+    # Chaque requête lit limit + 1 lignes pour savoir s'il reste une page.
+
+    async def iter_documents(
+        self,
+        limit: int,
+        after_created_at: Optional[str] = None,
+        after_id: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        query = """
+        MATCH (d:Document)
+        WHERE $after_created_at IS NULL
+           OR d.created_at < $after_created_at
+           OR (d.created_at = $after_created_at AND d.id < $after_id)
+        RETURN d.id AS id, d.created_at AS created_at,
+               [key IN coalesce($fields, keys(d)) | [key, d[key]]] AS properties
+        ORDER BY created_at DESC, id DESC
+        LIMIT $limit
+        """
+        async for row in self._iter_page("iter_documents", query, limit, after_created_at, after_id, fields):
+            yield row
+
+    async def iter_variables(
+        self,
+        limit: int,
+        after_created_at: Optional[str] = None,
+        after_id: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # created_at est un DateTime Neo4j pour toutes les variables (datetime() à
+        # l'écriture ; les plus anciennes sont converties par
+        # src.scripts.normalize_variable_dates)
+        query = """
+        MATCH (v:Variable)
+        WHERE $after_created_at IS NULL
+           OR v.created_at < datetime($after_created_at)
+           OR (v.created_at = datetime($after_created_at) AND coalesce(v.id, '') < $after_id)
+        RETURN coalesce(v.id, '') AS id, v.created_at AS created_at,
+               [key IN coalesce($fields, keys(v)) | [key, v[key]]] AS properties
+        ORDER BY created_at DESC, id DESC
+        LIMIT $limit
+        """
+        async for row in self._iter_page("iter_variables", query, limit, after_created_at, after_id, fields):
+            yield row
+
+    async def iter_scenarios(
+        self,
+        limit: int,
+        after_created_at: Optional[str] = None,
+        after_id: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        tag: Optional[str] = None,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        query = """
+        MATCH (s:Scenario)
+        WHERE ($after_created_at IS NULL
+               OR s.created_at < $after_created_at
+               OR (s.created_at = $after_created_at AND s.id < $after_id))
+          AND ($tag IS NULL OR $tag IN s.tags)
+          AND ($status IS NULL OR s.status = $status)
+          AND ($created_by IS NULL OR s.created_by = $created_by)
+        RETURN s.id AS id, s.created_at AS created_at,
+               [key IN coalesce($fields, keys(s)) | [key, s[key]]] AS properties
+        ORDER BY created_at DESC, id DESC
+        LIMIT $limit
+        """
+        rows = self._iter_page(
+            "iter_scenarios", query, limit, after_created_at, after_id, fields,
+            tag=tag, status=status, created_by=created_by
+        )
+        async for row in rows:
+            yield row
+
+    async def _iter_page(
+        self,
+        name: str,
+        query: str,
+        limit: int,
+        after_created_at: Optional[str],
+        after_id: Optional[str],
+        fields: Optional[List[str]],
+        **params: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        parameters = {
+            "limit": limit + 1,
+            "after_created_at": after_created_at,
+            "after_id": after_id or "",
+            "fields": fields,
+            **params
+        }
+        async with timed_async_session(self.driver) as session:
+            # Lecture en flux : la durée va jusqu'à la dernière ligne lue
+            start = time.perf_counter()
+            rows = 0
+            try:
+                result = await session.run(query, parameters)
+                async for record in result:
+                    rows += 1
+                    yield {
+                        "id": record["id"],
+                        "created_at": record["created_at"],
+                        "item": {key: value for key, value in record["properties"]}
+                    }
+            finally:
+                query_log.observe(name, query, parameters, time.perf_counter() - start, rows)
+
+    # Catalogue des scénarios : projection des scénarios stockés dans MinIO
+
+    async def upsert_scenario_summary(self, summary: Dict[str, Any]) -> None:
+        async with timed_async_session(self.driver) as session:
+            await session.execute_write(self._upsert_scenario_summary_tx, summary)
+
+    # Documents gérés par DocumentService (brouillons sans fichier MinIO)
+
+    async def create_document_draft(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._create_document_draft_tx, document)
+
+    async def update_document_file(self, document_id: str, file_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._update_document_file_tx, document_id, file_info)
+
+    # Import en masse : un lot entier est écrit par une seule requête UNWIND
+
+    async def create_documents_bulk(self, rows: List[Dict[str, Any]]) -> List[str]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._create_documents_bulk_tx, rows)
+
+    async def create_variables_bulk(self, rows: List[Dict[str, Any]]) -> List[str]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._create_variables_bulk_tx, rows)
+
+    async def normalize_variable_dates(self, batch_size: int = 10000) -> int:
+        """
+        Convertit en DateTime les created_at/updated_at des variables écrits
+        sous forme de chaîne ISO ou de LocalDateTime, par lots de batch_size.
+
+        Returns:
+            int: Le nombre de variables corrigées
+        """
+        total = 0
+        while True:
+            async with timed_async_session(self.driver) as session:
+                count = await session.execute_write(self._normalize_variable_dates_tx, batch_size)
+            total += count
+            if count < batch_size:
+                return total
+
+    # Historique des exécutions : (:Execution)-[:OF_SCENARIO]->(:Scenario),
+    # (:Execution)-[:HAS_STEP]->(:StepResult)
+
+    async def record_executions(self, rows: List[Dict[str, Any]]) -> int:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._record_executions_tx, rows)
+
+    async def get_execution(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_read(self._get_execution_tx, execution_id)
+
+    async def list_scenario_executions(
+        self,
+        scenario_id: str,
+        limit: int,
+        before: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_read(self._list_scenario_executions_tx, scenario_id, limit, before)
+
+    # Variables gérées par VariableService (identifiées par leur nom)
+
+    async def create_named_variable(self, variable: Dict[str, Any]) -> Dict[str, Any]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._create_named_variable_tx, variable)
+
+    async def list_variables(self) -> List[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_read(self._list_variables_tx)
+
+    async def get_variables_by_ids_or_names(self, ids: List[str], names: List[str]) -> List[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_read(self._get_variables_by_ids_or_names_tx, ids, names)
+
+    async def get_variable_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_read(self._get_variable_by_name_tx, name)
+
+    async def update_variable_by_name(self, name: str, variable: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._update_variable_by_name_tx, name, variable)
+
+    async def delete_variable_by_name(self, name: str) -> bool:
+        async with timed_async_session(self.driver) as session:
+            return await session.execute_write(self._delete_variable_by_name_tx, name)
+
+    @staticmethod
+    async def _create_document_tx(tx, document: Dict[str, Any]) -> str:
+        query = """
+        CREATE (d:Document {
+            id: $id,
+            type: $type,
+            minio_key: $minio_key,
+            metadata: $metadata,
+            created_at: $created_at,
+            updated_at: $updated_at
+        })
+        RETURN d.id
+        """
+        result = await tx.run(query, **document)
+        return (await result.single())[0]
+
+    @staticmethod
+    async def _create_variable_tx(tx, variable: Dict[str, Any]) -> str:
+        query = """
+        MATCH (d:Document {id: $document_id})
+        // Dates en DateTime Neo4j, comme pour les autres variables : la
+        // pagination compare created_at à un DateTime
+        CREATE (v:Variable {
+            id: $id,
+            name: $name,
+            value: $value,
+            created_at: datetime(),
+            updated_at: datetime()
+        })
+        CREATE (v)-[:BELONGS_TO]->(d)
+        RETURN v.id
+        """
+        result = await tx.run(query, **variable)
+        return (await result.single())[0]
+
+    @staticmethod
+    async def _create_scenario_tx(tx, scenario: Dict[str, Any]) -> str:
+        query = """
+        CREATE (s:Scenario {
+            id: $id,
+            name: $name,
+            description: $description,
+            steps: $steps,
+            created_at: $created_at,
+            updated_at: $updated_at
+        })
+        WITH s
+        // Sous-requêtes agrégées : une ligne par scénario, même sans document
+        // ni variable, et pas de produit cartésien entre les deux listes
+        CALL {
+            WITH s
+            UNWIND coalesce($document_ids, []) AS doc_id
+            MATCH (d:Document {id: doc_id})
+            MERGE (s)-[:USES]->(d)
+            RETURN count(d) AS documents_count
+        }
+        CALL {
+            WITH s
+            UNWIND coalesce($variable_ids, []) AS var_id
+            MATCH (v:Variable {id: var_id})
+            MERGE (s)-[:USES]->(v)
+            RETURN count(v) AS variables_count
+        }
+        RETURN s.id
+        """
+        result = await tx.run(query, **{"document_ids": [], "variable_ids": [], **scenario})
+        return (await result.single())[0]
+
+    @staticmethod
+    async def _get_scenario_tx(tx, scenario_id: str) -> Optional[Dict[str, Any]]:
+        query = """
+        MATCH (s:Scenario {id: $scenario_id})
+        RETURN s,
+               [(s)-[:USES]->(d:Document) | d] AS documents,
+               [(s)-[:USES]->(v:Variable) | v] AS variables
+        """
+        result = await tx.run(query, scenario_id=scenario_id)
+        record = await result.single()
+        if record:
+            return {
+                "scenario": dict(record["s"]),
+                "documents": [dict(doc) for doc in record["documents"]],
+                "variables": [dict(var) for var in record["variables"]]
+            }
+        return None
+
+    @staticmethod
+    async def _get_all_documents_tx(tx) -> List[Dict[str, Any]]:
+        query = """
+        MATCH (d:Document)
+        RETURN d
+        """
+        result = await tx.run(query)
+        return [dict(record["d"]) async for record in result]
+
+    @staticmethod
+    async def _get_all_variables_tx(tx) -> List[Dict[str, Any]]:
+        query = """
+        MATCH (v:Variable)-[:BELONGS_TO]->(d:Document)
+        RETURN v, d.id as document_id
+        """
+        result = await tx.run(query)
+        return [dict(record["v"]) async for record in result]
+
+    @staticmethod
+    async def _get_all_scenarios_tx(tx) -> List[Dict[str, Any]]:
+        query = """
+        MATCH (s:Scenario)
+        RETURN s,
+               [(s)-[:USES]->(d:Document) | d] AS documents,
+               [(s)-[:USES]->(v:Variable) | v] AS variables
+        """
+        result = await tx.run(query)
+        return [{
+            "scenario": dict(record["s"]),
+            "documents": [dict(doc) for doc in record["documents"]],
+            "variables": [dict(var) for var in record["variables"]]
+        } async for record in result]
+
+    @staticmethod
+    async def _get_document_tx(tx, document_id: str) -> Optional[Dict[str, Any]]:
+        query = """
+        MATCH (d:Document {id: $id})
+        RETURN d
+        """
+        result = await tx.run(query, id=document_id)
+        record = await result.single()
+        return dict(record["d"]) if record else None
+
+    @staticmethod
+    async def _get_document_variables_tx(tx, document_id: str) -> List[Dict[str, Any]]:
+        query = """
+        MATCH (v:Variable)-[:BELONGS_TO]->(d:Document {id: $document_id})
+        RETURN v, d.id as document_id
+        """
+        result = await tx.run(query, document_id=document_id)
+        return [{**dict(record["v"]), "document_id": record["document_id"]} async for record in result]
+
+    @staticmethod
+    async def _update_variable_tx(tx, variable_id: str, variable: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        query = """
+        MATCH (v:Variable {id: $id})-[:BELONGS_TO]->(d:Document)
+        SET v.name = $name,
+            v.value = $value,
+            v.updated_at = $updated_at
+        RETURN v, d.id as document_id
+        """
+        result = await tx.run(
+            query,
+            id=variable_id,
+            name=variable["name"],
+            value=variable["value"],
+            updated_at=variable["updated_at"]
+        )
+        record = await result.single()
+        if record:
+            return {**dict(record["v"]), "document_id": record["document_id"]}
+        return None
+
+    @staticmethod
+    async def _upsert_scenario_summary_tx(tx, summary: Dict[str, Any]) -> None:
+        query = """
+        MERGE (s:Scenario {id: $id})
+        SET s.name = $name,
+            s.description = $description,
+            s.tags = $tags,
+            s.status = $status,
+            s.created_by = $created_by,
+            s.created_at = $created_at,
+            s.updated_at = $updated_at,
+            s.steps_count = $steps_count
+        """
+        await (await tx.run(query, **summary)).consume()
+
+    @staticmethod
+    async def _create_document_draft_tx(tx, document: Dict[str, Any]) -> Dict[str, Any]:
+        query = """
+        CREATE (d:Document {
+            id: $id,
+            name: $name,
+            description: $description,
+            created_at: $created_at,
+            status: $status
+        })
+        RETURN d
+        """
+        result = await tx.run(query, **document)
+        return dict((await result.single())["d"])
+
+    @staticmethod
+    async def _update_document_file_tx(tx, document_id: str, file_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        query = """
+        MATCH (d:Document {id: $id})
+        SET d.filename = $filename,
+            d.content_type = $content_type,
+            d.file_size = $file_size,
+            d.minio_key = $minio_key,
+            d.updated_at = $updated_at
+        RETURN d
+        """
+        result = await tx.run(query, id=document_id, **file_info)
+        record = await result.single()
+        return dict(record["d"]) if record else None
+
+    @staticmethod
+    async def _create_named_variable_tx(tx, variable: Dict[str, Any]) -> Dict[str, Any]:
+        query = """
+        CREATE (v:Variable {
+            id: $id,
+            name: $name,
+            value: $value,
+            description: $description,
+            created_at: datetime(),
+            updated_at: datetime()
+        })
+        RETURN v
+        """
+        result = await tx.run(query, **variable)
+        return dict((await result.single())["v"])
+
+    @staticmethod
+    async def _create_documents_bulk_tx(tx, rows: List[Dict[str, Any]]) -> List[str]:
+        query = """
+        UNWIND $rows AS row
+        CREATE (d:Document {
+            id: row.id,
+            name: row.name,
+            description: row.description,
+            created_at: row.created_at,
+            status: row.status
+        })
+        RETURN d.id AS id
+        """
+        result = await tx.run(query, rows=rows)
+        return [record["id"] async for record in result]
+
+    @staticmethod
+    async def _normalize_variable_dates_tx(tx, batch_size: int) -> int:
+        # Une chaîne ou un LocalDateTime comparé à un DateTime donne null : ces
+        # variables disparaissaient des pages suivant la première
+        query = """
+        MATCH (v:Variable)
+        WHERE (v.created_at IS NOT NULL AND NOT v.created_at IS :: DATETIME)
+           OR (v.updated_at IS NOT NULL AND NOT v.updated_at IS :: DATETIME)
+        WITH v LIMIT $batch_size
+        SET v.created_at = CASE WHEN v.created_at IS :: DATETIME THEN v.created_at
+                                ELSE datetime(toString(v.created_at)) END,
+            v.updated_at = CASE WHEN v.updated_at IS :: DATETIME THEN v.updated_at
+                                ELSE datetime(toString(v.updated_at)) END
+        RETURN count(v) AS normalized
+        """
+        result = await tx.run(query, batch_size=batch_size)
+        return (await result.single())["normalized"]
+
+    @staticmethod
+    async def _create_variables_bulk_tx(tx, rows: List[Dict[str, Any]]) -> List[str]:
+        # Les lignes rattachées à un document inexistant ne sont pas créées :
+        # elles sont absentes des identifiants retournés
+        query = """
+        UNWIND $rows AS row
+        OPTIONAL MATCH (d:Document {id: row.document_id})
+        WITH row, d
+        WHERE row.document_id IS NULL OR d IS NOT NULL
+        CREATE (v:Variable {
+            id: row.id,
+            name: row.name,
+            value: row.value,
+            description: row.description,
+            created_at: datetime(),
+            updated_at: datetime()
+        })
+        FOREACH (_ IN CASE WHEN d IS NULL THEN [] ELSE [1] END | CREATE (v)-[:BELONGS_TO]->(d))
+        RETURN v.id AS id
+        """
+        result = await tx.run(query, rows=rows)
+        return [record["id"] async for record in result]
+
+    @staticmethod
+    async def _record_executions_tx(tx, rows: List[Dict[str, Any]]) -> int:
+        query = """
+        UNWIND $rows AS row
+        MERGE (e:Execution {id: row.execution_id})
+        SET e.scenario_id = row.scenario_id,
+            e.status = row.status,
+            e.started_at = row.started_at,
+            e.completed_at = row.completed_at,
+            e.error = row.error
+        WITH e, row
+        CALL {
+            WITH e, row
+            MATCH (s:Scenario {id: row.scenario_id})
+            MERGE (e)-[:OF_SCENARIO]->(s)
+            RETURN count(s) AS linked
+        }
+        CALL {
+            WITH e, row
+            UNWIND row.steps AS step
+            // MERGE : réenregistrer une exécution ne duplique pas ses étapes
+            MERGE (e)-[:HAS_STEP]->(r:StepResult {execution_id: row.execution_id, index: step.index})
+            SET r.type = step.type,
+                r.status = step.status,
+                r.result = step.result,
+                r.error = step.error
+            RETURN count(r) AS steps_count
+        }
+        RETURN count(e) AS recorded
+        """
+        result = await tx.run(query, rows=rows)
+        return (await result.single())["recorded"]
+
+    @staticmethod
+    async def _get_execution_tx(tx, execution_id: str) -> Optional[Dict[str, Any]]:
+        query = """
+        MATCH (e:Execution {id: $id})
+        RETURN e, [(e)-[:HAS_STEP]->(r:StepResult) | r] AS steps
+        """
+        result = await tx.run(query, id=execution_id)
+        record = await result.single()
+        if not record:
+            return None
+        return {
+            **dict(record["e"]),
+            "steps": sorted((dict(step) for step in record["steps"]), key=lambda step: step.get("index", 0))
+        }
+
+    @staticmethod
+    async def _list_scenario_executions_tx(
+        tx,
+        scenario_id: str,
+        limit: int,
+        before: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        # Servie par l'index composite (scenario_id, started_at), dans l'ordre de l'index
+        query = """
+        MATCH (e:Execution)
+        WHERE e.scenario_id = $scenario_id
+          AND e.started_at < coalesce($before, '9999')
+        RETURN e
+        ORDER BY e.started_at DESC
+        LIMIT $limit
+        """
+        result = await tx.run(query, scenario_id=scenario_id, limit=limit, before=before)
+        return [dict(record["e"]) async for record in result]
+
+    @staticmethod
+    async def _list_variables_tx(tx) -> List[Dict[str, Any]]:
+        query = """
+        MATCH (v:Variable)
+        RETURN v
+        ORDER BY v.created_at DESC
+        """
+        result = await tx.run(query)
+        return [dict(record["v"]) async for record in result]
+
+    @staticmethod
+    async def _get_variables_by_ids_or_names_tx(tx, ids: List[str], names: List[str]) -> List[Dict[str, Any]]:
+        # UNION plutôt qu'un OR : chaque branche utilise son index (id, name)
+        query = """
+        CALL {
+            MATCH (v:Variable) WHERE v.id IN $ids RETURN v
+            UNION
+            MATCH (v:Variable) WHERE v.name IN $names RETURN v
+        }
+        RETURN v.id AS id, v.name AS name, v.value AS value
+        """
+        result = await tx.run(query, ids=ids, names=names)
+        return [record.data() async for record in result]
+
+    @staticmethod
+    async def _get_variable_by_name_tx(tx, name: str) -> Optional[Dict[str, Any]]:
+        query = """
+        MATCH (v:Variable)
+        WHERE v.name = $name
+        RETURN v
+        """
+        result = await tx.run(query, name=name)
+        record = await result.single()
+        return dict(record["v"]) if record else None
+
+    @staticmethod
+    async def _update_variable_by_name_tx(tx, name: str, variable: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        query = """
+        MATCH (v:Variable)
+        WHERE v.name = $name
+        SET v.value = $value,
+            v.description = $description,
+            v.updated_at = datetime()
+        RETURN v
+        """
+        result = await tx.run(query, name=name, **variable)
+        record = await result.single()
+        return dict(record["v"]) if record else None
+
+    @staticmethod
+    async def _delete_variable_by_name_tx(tx, name: str) -> bool:
+        query = """
+        MATCH (v:Variable)
+        WHERE v.name = $name
+        DELETE v
+        RETURN count(v) as deleted
+        """
+        result = await tx.run(query, name=name)
+        return (await result.single())["deleted"] > 0
+
+# Create a global asynchronous database instance
+async_db = AsyncNeo4jDatabase()
@@ -0,0 +1,250 @@
+"""
+Mesure des requêtes Cypher : texte, taille des paramètres, durée et nombre de
+lignes retournées, agrégés par requête et exposés par /health/queries.
+
+Les requêtes plus longues que NEO4J_SLOW_QUERY_MS sont écrites dans le
+journal des requêtes lentes ; avec NEO4J_PROFILE_SLOW_QUERIES, leur plan
+d'exécution y est ajouté (PROFILE pour les lectures, rejouées une seconde
+fois, EXPLAIN pour les écritures, qui ne sont pas réexécutées).
+"""
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+from neo4j import AsyncDriver, Driver
+from src.core.config import settings
+from src.core.metrics import registry
+from src.db.session import session_metrics
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("src.db.slow_queries")
+
+query_duration = registry.histogram(
+    "neo4j_query_duration_seconds",
+    "Durée des requêtes Cypher, par requête",
+    ["query"]
+)
+slow_queries = registry.counter(
+    "neo4j_slow_queries",
+    "Requêtes Cypher plus longues que NEO4J_SLOW_QUERY_MS",
+    ["query"]
+)
+
+def query_name(work: Callable) -> str:
+    # _get_all_documents_tx -> get_all_documents
+    name = getattr(work, "__name__", "query").strip("_")
+    return name[:-3] if name.endswith("_tx") else name
+
+def parameter_sizes(parameters: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Taille de chaque paramètre : nombre d'éléments des listes et dictionnaires,
+    longueur des chaînes, 1 pour les scalaires.
+    """
+    return {
+        name: len(value) if isinstance(value, (str, bytes, list, tuple, dict, set)) else 1
+        for name, value in parameters.items()
+    }
+
+def count_rows(result: Any) -> int:
+    if result is None:
+        return 0
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    return 1
+
+def _compact(query: str) -> str:
+    return " ".join(query.split())
+
+def format_plan(plan: Optional[Dict[str, Any]], depth: int = 0) -> List[str]:
+    """
+    Représentation indentée d'un plan PROFILE/EXPLAIN : opérateur, lignes et
+    accès à la base (dbHits) ; les NodeByLabelScan signalent un index manquant.
+    """
+    if not plan:
+        return []
+    details = plan.get("args", {}).get("Details", "")
+    line = f"{'  ' * depth}{plan.get('operatorType')}"
+    if "rows" in plan:
+        line += f" rows={plan['rows']} dbHits={plan.get('dbHits', 0)}"
+    else:
+        line += f" estimatedRows={plan.get('args', {}).get('EstimatedRows', '?')}"
+    if details:
+        line += f" {details}"
+    lines = [line]
+    for child in plan.get("children", []):
+        lines.extend(format_plan(child, depth + 1))
+    return lines
+
+class QueryLog:
+    def __init__(self, slow_ms: float):
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def observe(self, name: str, query: str, parameters: Dict[str, Any], duration: float, rows: int) -> bool:
+        """
+        Enregistre une exécution de requête et retourne True si elle est lente.
+        """
+        duration_ms = duration * 1000
+        slow = bool(self.slow_ms) and duration_ms >= self.slow_ms
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {
+                    "query": _compact(query),
+                    "calls": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "rows": 0,
+                    "slow": 0
+                }
+            stats["calls"] += 1
+            stats["total_ms"] += duration_ms
+            stats["max_ms"] = max(stats["max_ms"], duration_ms)
+            stats["rows"] += rows
+            if slow:
+                stats["slow"] += 1
+        query_duration.observe(duration, query=name)
+        if slow:
+            slow_queries.inc(query=name)
+            slow_query_logger.warning(
+                f"Requête Neo4j lente {name}: {duration_ms:.1f} ms, {rows} lignes, "
+                f"paramètres {parameter_sizes(parameters)}: {_compact(query)}"
+            )
+        return slow
+
+    def log_plan(self, name: str, plan: Optional[Dict[str, Any]]) -> None:
+        if plan:
+            slow_query_logger.warning(f"Plan de la requête {name}:\n" + "\n".join(format_plan(plan)))
+
+    def stats(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Requêtes triées par temps cumulé décroissant.
+        """
+        with self._lock:
+            items = [(name, dict(stats)) for name, stats in self._stats.items()]
+        items.sort(key=lambda item: item[1]["total_ms"], reverse=True)
+        return [
+            {
+                "name": name,
+                **stats,
+                "avg_ms": stats["total_ms"] / stats["calls"],
+                "avg_rows": stats["rows"] / stats["calls"]
+            }
+            for name, stats in items[:limit]
+        ]
+
+query_log = QueryLog(settings.NEO4J_SLOW_QUERY_MS)
+
+class _RecordingTransaction:
+    """
+    Transaction dont les appels à run() sont enregistrés (texte et paramètres).
+    """
+    def __init__(self, tx: Any, queries: List[Tuple[str, Dict[str, Any]]]):
+        self._tx = tx
+        self._queries = queries
+
+    def run(self, query: str, parameters: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        self._queries.append((query, {**(parameters or {}), **kwargs}))
+        return self._tx.run(query, parameters, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._tx, name)
+
+class TimedAsyncSession:
+    """
+    Session asynchrone dont les transactions gérées (execute_read,
+    execute_write) sont mesurées par query_log.
+    """
+    def __init__(self, session: Any):
+        self._session = session
+
+    async def execute_read(self, work: Callable, *args: Any, **kwargs: Any) -> Any:
+        return await self._execute(self._session.execute_read, "PROFILE", work, args, kwargs)
+
+    async def execute_write(self, work: Callable, *args: Any, **kwargs: Any) -> Any:
+        return await self._execute(self._session.execute_write, "EXPLAIN", work, args, kwargs)
+
+    async def _execute(self, execute: Callable, plan_mode: str, work: Callable, args: tuple, kwargs: dict) -> Any:
+        queries: List[Tuple[str, Dict[str, Any]]] = []
+
+        async def recorded_work(tx: Any, *work_args: Any, **work_kwargs: Any) -> Any:
+            # Une transaction rejouée par le driver ne compte qu'une fois
+            queries.clear()
+            return await work(_RecordingTransaction(tx, queries), *work_args, **work_kwargs)
+
+        start = time.perf_counter()
+        result = await execute(recorded_work, *args, **kwargs)
+        duration = time.perf_counter() - start
+        name = query_name(work)
+        for query, parameters in queries or [("", {})]:
+            slow = query_log.observe(name, query, parameters, duration / max(len(queries), 1), count_rows(result))
+            if slow and query and settings.NEO4J_PROFILE_SLOW_QUERIES:
+                await self._capture_plan(name, plan_mode, query, parameters)
+        return result
+
+    async def _capture_plan(self, name: str, plan_mode: str, query: str, parameters: Dict[str, Any]) -> None:
+        try:
+            result = await self._session.run(f"{plan_mode} {query}", parameters)
+            summary = await result.consume()
+            query_log.log_plan(name, summary.profile or summary.plan)
+        except Exception as e:
+            logger.error(f"Impossible de capturer le plan de la requête {name}: {str(e)}")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+class TimedSession:
+    """
+    Équivalent synchrone de TimedAsyncSession.
+    """
+    def __init__(self, session: Any):
+        self._session = session
+
+    def execute_read(self, work: Callable, *args: Any, **kwargs: Any) -> Any:
+        return self._execute(self._session.execute_read, "PROFILE", work, args, kwargs)
+
+    def execute_write(self, work: Callable, *args: Any, **kwargs: Any) -> Any:
+        return self._execute(self._session.execute_write, "EXPLAIN", work, args, kwargs)
+
+    read_transaction = execute_read
+    write_transaction = execute_write
+
+    def _execute(self, execute: Callable, plan_mode: str, work: Callable, args: tuple, kwargs: dict) -> Any:
+        queries: List[Tuple[str, Dict[str, Any]]] = []
+
+        def recorded_work(tx: Any, *work_args: Any, **work_kwargs: Any) -> Any:
+            queries.clear()
+            return work(_RecordingTransaction(tx, queries), *work_args, **work_kwargs)
+
+        start = time.perf_counter()
+        result = execute(recorded_work, *args, **kwargs)
+        duration = time.perf_counter() - start
+        name = query_name(work)
+        for query, parameters in queries or [("", {})]:
+            slow = query_log.observe(name, query, parameters, duration / max(len(queries), 1), count_rows(result))
+            if slow and query and settings.NEO4J_PROFILE_SLOW_QUERIES:
+                self._capture_plan(name, plan_mode, query, parameters)
+        return result
+
+    def _capture_plan(self, name: str, plan_mode: str, query: str, parameters: Dict[str, Any]) -> None:
+        try:
+            summary = self._session.run(f"{plan_mode} {query}", parameters).consume()
+            query_log.log_plan(name, summary.profile or summary.plan)
+        except Exception as e:
+            logger.error(f"Impossible de capturer le plan de la requête {name}: {str(e)}")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+@asynccontextmanager
+async def timed_async_session(driver: AsyncDriver) -> AsyncIterator[TimedAsyncSession]:
+    with session_metrics.track():
+        async with driver.session() as session:
+            yield TimedAsyncSession(session)
+
+@contextmanager
+def timed_session(driver: Driver) -> Iterator[TimedSession]:
+    with session_metrics.track(), driver.session() as session:
+        yield TimedSession(session)
@@ -0,0 +1,147 @@
+"""
+Contraintes et index Neo4j utilisés par les requêtes de l'application.
+
+Toutes les requêtes filtrent sur {id: $id} (Document, Scenario, Variable,
+Execution), sur Variable.name, et les listes sont triées par created_at (ou
+started_at pour les exécutions) : sans index, chacune de ces recherches
+parcourt tous les nœuds du label.
+
+Usage:
+    python -m src.db.schema          # crée les contraintes et index manquants
+    python -m src.db.schema --check  # signale les index manquants sans rien modifier
+"""
+from typing import Any, Dict, List, Optional, Tuple, Union
+from neo4j import Session
+from src.db.session import get_db
+import argparse
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+# (nom, label, propriété ou tuple de propriétés pour un index composite)
+CONSTRAINTS = [
+    ("document_id_unique", "Document", "id"),
+    ("scenario_id_unique", "Scenario", "id"),
+    ("variable_id_unique", "Variable", "id"),
+    ("execution_id_unique", "Execution", "id"),
+]
+
+INDEXES = [
+    ("variable_name", "Variable", "name"),
+    ("variable_created_at", "Variable", "created_at"),
+    ("document_created_at", "Document", "created_at"),
+    ("scenario_created_at", "Scenario", "created_at"),
+    ("scenario_status", "Scenario", "status"),
+    ("scenario_created_by", "Scenario", "created_by"),
+    # Index composite : exécutions récentes d'un scénario
+    ("execution_scenario_started_at", "Execution", ("scenario_id", "started_at")),
+    ("execution_started_at", "Execution", "started_at"),
+]
+
+# Requêtes représentatives qui doivent être servies par un index
+CHECKED_QUERIES = [
+    "MATCH (d:Document {id: $id}) RETURN d",
+    "MATCH (s:Scenario {id: $id}) RETURN s",
+    "MATCH (v:Variable {id: $id}) RETURN v",
+    "MATCH (v:Variable) WHERE v.name = $name RETURN v",
+    "MATCH (e:Execution {id: $id}) RETURN e",
+]
+
+SCAN_OPERATORS = ("AllNodesScan", "NodeByLabelScan")
+
+def _properties(prop: Union[str, Tuple[str, ...]]) -> Tuple[str, ...]:
+    return prop if isinstance(prop, tuple) else (prop,)
+
+def apply_schema(session: Optional[Session] = None) -> List[str]:
+    """
+    Crée les contraintes et index manquants. L'opération est idempotente.
+
+    Returns:
+        List[str]: Les noms des éléments qu'il n'a pas été possible de créer
+    """
+    if session is None:
+        with get_db() as session:
+            return apply_schema(session)
+
+    failed = []
+    statements = [
+        (name, f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE")
+        for name, label, prop in CONSTRAINTS
+    ] + [
+        (name, f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON "
+               f"({', '.join(f'n.{p}' for p in _properties(prop))})")
+        for name, label, prop in INDEXES
+    ]
+    for name, statement in statements:
+        try:
+            session.run(statement).consume()
+        except Exception as e:
+            # Par exemple des doublons d'id existants qui empêchent la contrainte
+            logger.error(f"Impossible de créer {name}: {str(e)}")
+            failed.append(name)
+    return failed
+
+def _scan_operators(plan: Dict[str, Any]) -> List[str]:
+    operator = plan.get("operatorType", "").split("@")[0]
+    found = [operator] if operator in SCAN_OPERATORS else []
+    for child in plan.get("children", []):
+        found.extend(_scan_operators(child))
+    return found
+
+def check_schema(session: Optional[Session] = None) -> Dict[str, Any]:
+    """
+    Compare les index existants (SHOW INDEXES) à ceux attendus et vérifie,
+    via EXPLAIN, que les requêtes de recherche n'utilisent pas de parcours
+    complet d'un label.
+
+    Returns:
+        Dict[str, Any]: {"missing": [...], "scans": [{"query", "operators"}]}
+    """
+    if session is None:
+        with get_db() as session:
+            return check_schema(session)
+
+    existing = set()
+    for record in session.run(
+        "SHOW INDEXES YIELD labelsOrTypes, properties, state WHERE state = 'ONLINE' "
+        "RETURN labelsOrTypes, properties"
+    ):
+        for label in record["labelsOrTypes"] or []:
+            existing.add((label, tuple(record["properties"] or [])))
+
+    missing = [
+        name for name, label, prop in CONSTRAINTS + INDEXES
+        if (label, _properties(prop)) not in existing
+    ]
+
+    scans = []
+    for query in CHECKED_QUERIES:
+        summary = session.run(f"EXPLAIN {query}", id="", name="").consume()
+        operators = _scan_operators(summary.plan or {})
+        if operators:
+            scans.append({"query": query, "operators": operators})
+
+    return {"missing": missing, "scans": scans}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Contraintes et index Neo4j")
+    parser.add_argument("--check", action="store_true", help="signale les index manquants sans rien créer")
+    args = parser.parse_args()
+
+    if not args.check:
+        failed = apply_schema()
+        for name in failed:
+            print(f"échec : {name}")
+
+    report = check_schema()
+    for name in report["missing"]:
+        print(f"index manquant : {name}")
+    for scan in report["scans"]:
+        print(f"parcours complet ({', '.join(scan['operators'])}) : {scan['query']}")
+    if report["missing"] or report["scans"]:
+        sys.exit(1)
+    print("schéma à jour")
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,208 @@
-from contextlib import contextmanager
-from neo4j import GraphDatabase
+from contextlib import contextmanager, asynccontextmanager
+from typing import Any, Dict, Optional
+from neo4j import GraphDatabase, AsyncGraphDatabase, Driver, AsyncDriver
 from src.core.config import settings
+import threading
+import time
+
+_driver: Optional[Driver] = None
+_async_driver: Optional[AsyncDriver] = None
+_driver_lock = threading.Lock()
+
+class PoolMetrics:
+    """
+    Temps d'attente pour l'acquisition d'une connexion dans le pool Neo4j.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.failures = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.instrumented = False
+
+    def observe(self, wait: float, failed: bool = False) -> None:
+        with self._lock:
+            self.acquisitions += 1
+            if failed:
+                self.failures += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "acquisitions": self.acquisitions,
+                "failures": self.failures,
+                "avg_wait_ms": (self.total_wait / self.acquisitions * 1000) if self.acquisitions else 0.0,
+                "max_wait_ms": self.max_wait * 1000
+            }
+
+pool_metrics = PoolMetrics()
+
+class SessionMetrics:
+    """
+    Sessions Neo4j ouvertes par l'application (get_db, get_async_db et les
+    sessions mesurées de query_log), comptées sans dépendre des internes du
+    driver : chaque session occupe au plus une connexion du pool.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.opened = 0
+
+    @contextmanager
+    def track(self):
+        with self._lock:
+            self.active += 1
+            self.opened += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "active": self.active,
+                "peak": self.peak,
+                "opened": self.opened
+            }
+
+session_metrics = SessionMetrics()
+
+def _instrument_pool(driver: Driver) -> None:
+    # Le driver n'expose pas de métriques publiques sur son pool : quand son
+    # pool interne a la forme attendue, on chronomètre l'acquisition des
+    # connexions ; sinon (autre version du driver) la mesure est indisponible.
+    pool = getattr(driver, "_pool", None)
+    acquire = getattr(pool, "acquire", None)
+    if not callable(acquire):
+        return
+
+    def timed_acquire(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            connection = acquire(*args, **kwargs)
+        except Exception:
+            pool_metrics.observe(time.perf_counter() - start, failed=True)
+            raise
+        pool_metrics.observe(time.perf_counter() - start)
+        return connection
+
+    async def async_timed_acquire(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            connection = await acquire(*args, **kwargs)
+        except Exception:
+            pool_metrics.observe(time.perf_counter() - start, failed=True)
+            raise
+        pool_metrics.observe(time.perf_counter() - start)
+        return connection
+
+    try:
+        pool.acquire = async_timed_acquire if isinstance(driver, AsyncDriver) else timed_acquire
+    except (AttributeError, TypeError):
+        return
+    pool_metrics.instrumented = True
+
+def _driver_options() -> Dict[str, Any]:
+    return {
+        "auth": (settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+        "max_connection_pool_size": settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        "connection_acquisition_timeout": settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        "max_connection_lifetime": settings.NEO4J_MAX_CONNECTION_LIFETIME
+    }
+
+def init_driver() -> Driver:
+    """
+    Crée le driver Neo4j partagé par tout le processus.
+    """
+    global _driver
+    with _driver_lock:
+        if _driver is None:
+            _driver = GraphDatabase.driver(settings.NEO4J_URI, **_driver_options())
+            _instrument_pool(_driver)
+        return _driver
+
+def get_driver() -> Driver:
+    if _driver is None:
+        return init_driver()
+    return _driver
+
+def close_driver() -> None:
+    global _driver
+    with _driver_lock:
+        if _driver is not None:
+            _driver.close()
+            _driver = None
+
+def init_async_driver() -> AsyncDriver:
+    """
+    Crée le driver Neo4j asynchrone partagé, utilisé par les handlers FastAPI.
+    """
+    global _async_driver
+    with _driver_lock:
+        if _async_driver is None:
+            _async_driver = AsyncGraphDatabase.driver(settings.NEO4J_URI, **_driver_options())
+            _instrument_pool(_async_driver)
+        return _async_driver
+
+def get_async_driver() -> AsyncDriver:
+    if _async_driver is None:
+        return init_async_driver()
+    return _async_driver
+
+async def close_async_driver() -> None:
+    global _async_driver
+    driver = _async_driver
+    _async_driver = None
+    if driver is not None:
+        await driver.close()
 
 @contextmanager
 def get_db():
-    driver = GraphDatabase.driver(
-        settings.NEO4J_URI,
-        auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
-    )
-    try:
-        with driver.session() as session:
+    with session_metrics.track(), get_driver().session() as session:
+        yield session
+
+@asynccontextmanager
+async def get_async_db():
+    with session_metrics.track():
+        async with get_async_driver().session() as session:
             yield session
-    finally:
-        driver.close() 
\ No newline at end of file
+
+def _connection_counts() -> Optional[Dict[str, int]]:
+    # Lecture des connexions du pool interne du driver ; None si sa structure
+    # n'est pas celle attendue.
+    counts = {"in_use": 0, "idle": 0}
+    try:
+        for driver in (_driver, _async_driver):
+            pool = getattr(driver, "_pool", None)
+            if pool is None:
+                continue
+            # Le verrou du pool asynchrone est coopératif : la lecture se fait
+            # sans await, elle n'a donc pas besoin d'être protégée.
+            for connections in list(pool.connections.values()):
+                for connection in list(connections):
+                    counts["in_use" if connection.in_use else "idle"] += 1
+    except (AttributeError, TypeError):
+        return None
+    return counts
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Retourne l'état du pool de connexions Neo4j : sessions ouvertes par
+    l'application et, quand le driver le permet, connexions utilisées,
+    inactives et temps d'attente d'acquisition ("unavailable" sinon).
+    """
+    counts = _connection_counts()
+    return {
+        "max_size": settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        "sessions": session_metrics.snapshot(),
+        "in_use": counts["in_use"] if counts is not None else "unavailable",
+        "idle": counts["idle"] if counts is not None else "unavailable",
+        "acquisition": pool_metrics.snapshot() if pool_metrics.instrumented else "unavailable"
+    }
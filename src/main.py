@@ -1,8 +1,33 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.api import auth, documents, variables, scenarios
+from fastapi.responses import PlainTextResponse
+from src.api import auth, documents, variables, scenarios, executions, templates
 from src.core.config import settings
+from src.core.metrics import registry
+from src.core.timing import TimingMiddleware, route_latency
 from src.db import init_db
+from src.db.schema import apply_schema
+from src.db.query_log import query_log
+from src.services.scenario import scenario_cache
+from src.services.browser_pool import browser_pool
+from src.tasks.executions import execution_queue
+from src.tasks.execution_history import execution_recorder
+from src.services.pdf import pdf_pool
+from src.services.render import render_pool, render_service
+from src.services.pdf_cache import pdf_text_cache
+from src.services.template import template_cache
+from src.services.auth import user_cache
+from src.core.security import token_cache
+from src.db.session import (
+    init_driver,
+    close_driver,
+    init_async_driver,
+    close_async_driver,
+    get_pool_stats
+)
+import logging
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -19,17 +44,95 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Durée des requêtes par route (/health/routes, /metrics)
+app.add_middleware(TimingMiddleware)
+
 # Initialize database
 @app.on_event("startup")
 async def startup_event():
     init_db()
+    init_driver()
+    init_async_driver()
+    try:
+        apply_schema()
+    except Exception as e:
+        # Neo4j peut démarrer après l'API : le schéma sera appliqué au prochain
+        # démarrage ou via `python -m src.db.schema`
+        logger.error(f"Impossible d'appliquer le schéma Neo4j: {str(e)}")
+    await execution_queue.start()
+    await execution_recorder.start()
+    try:
+        # Lancer BROWSER_POOL_SIZE navigateurs dès le démarrage plutôt qu'à
+        # la première étape web
+        await browser_pool.start()
+    except Exception as e:
+        # Le pool sera (re)lancé à la première demande de contexte
+        logger.error(f"Impossible de démarrer le pool de navigateurs: {str(e)}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await execution_queue.stop()
+    await execution_recorder.stop()
+    close_driver()
+    await close_async_driver()
+    await browser_pool.close()
+    pdf_pool.shutdown()
+    render_pool.shutdown()
 
 # Include routers
 app.include_router(auth.router, prefix="/auth", tags=["authentication"])
 app.include_router(documents.router, prefix="/documents", tags=["documents"])
 app.include_router(variables.router, prefix="/variables", tags=["variables"])
 app.include_router(scenarios.router, prefix="/scenarios", tags=["scenarios"])
+app.include_router(executions.router, prefix="/executions", tags=["executions"])
+app.include_router(templates.router, prefix="/templates", tags=["templates"])
 
 @app.get("/")
 async def root():
-    return {"message": "Welcome to the Business Process Automation API"} 
\ No newline at end of file
+    return {"message": "Welcome to the Business Process Automation API"}
+
+@app.get("/health/neo4j")
+async def neo4j_pool_health():
+    return get_pool_stats()
+
+@app.get("/health/queries")
+async def query_health():
+    """
+    Requêtes Cypher par temps cumulé décroissant : appels, durées, lignes
+    retournées et nombre de requêtes lentes (> NEO4J_SLOW_QUERY_MS).
+    """
+    return query_log.stats()
+
+@app.get("/health/routes")
+async def route_health():
+    return route_latency.stats()
+
+@app.get("/health/browsers")
+async def browser_pool_health():
+    return browser_pool.stats()
+
+@app.get("/health/executions")
+async def execution_health():
+    return {
+        "history": execution_recorder.stats()
+    }
+
+@app.get("/health/caches")
+async def cache_health():
+    return {
+        "scenarios": scenario_cache.stats(),
+        "pdf_text": pdf_text_cache.stats(),
+        "templates": template_cache.stats(),
+        "renders": render_service.stats(),
+        "auth_tokens": token_cache.stats(),
+        "users": user_cache.stats()
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Métriques au format texte Prometheus : durées des étapes et exécutions,
+    des appels Neo4j et MinIO, de l'extraction PDF et de l'attente du pool
+    de navigateurs.
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
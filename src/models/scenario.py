@@ -7,18 +7,22 @@ class StepType(str, Enum):
     WEB = "web"
     TEMPLATE = "template"
     PDF = "pdf"
+    RENDER = "render"
     AI = "ai"
 
 class Step(BaseModel):
     type: StepType = Field(..., description="Type d'étape")
     details: Dict[str, Any] = Field(..., description="Détails spécifiques à l'étape")
     order: int = Field(..., description="Ordre d'exécution de l'étape")
+    depends_on: Optional[List[int]] = Field(None, description="Ordres des étapes à terminer avant celle-ci (exécution parallèle)")
 
 class ScenarioBase(BaseModel):
     name: str = Field(..., description="Nom du scénario", min_length=1)
     description: Optional[str] = Field(None, description="Description du scénario")
     steps: List[Step] = Field(..., description="Liste des étapes du scénario")
     tags: Optional[List[str]] = Field([], description="Tags associés au scénario")
+    variable_ids: Optional[List[str]] = Field([], description="IDs des variables utilisées par le scénario")
+    max_parallel_steps: Optional[int] = Field(None, description="Nombre maximal d'étapes exécutées en parallèle", ge=1)
 
 class ScenarioCreate(ScenarioBase):
     pass
@@ -28,6 +32,8 @@ class ScenarioUpdate(BaseModel):
     description: Optional[str] = Field(None, description="Description du scénario")
     steps: Optional[List[Step]] = Field(None, description="Liste des étapes du scénario")
     tags: Optional[List[str]] = Field(None, description="Tags associés au scénario")
+    variable_ids: Optional[List[str]] = Field(None, description="IDs des variables utilisées par le scénario")
+    max_parallel_steps: Optional[int] = Field(None, description="Nombre maximal d'étapes exécutées en parallèle", ge=1)
 
 class ScenarioInDB(ScenarioBase):
     id: str = Field(..., description="ID unique du scénario")
@@ -43,7 +49,7 @@ class ScenarioExecution(BaseModel):
 class ExecutionResult(BaseModel):
     execution_id: str = Field(..., description="ID de l'exécution")
     scenario_id: str = Field(..., description="ID du scénario exécuté")
-    status: str = Field(..., description="Statut de l'exécution (success, failed, in_progress)")
+    status: str = Field(..., description="Statut de l'exécution (queued, in_progress, success, failed)")
     results: List[Dict[str, Any]] = Field(..., description="Résultats de chaque étape")
     started_at: datetime = Field(..., description="Date de début d'exécution")
     completed_at: Optional[datetime] = Field(None, description="Date de fin d'exécution")
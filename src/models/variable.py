@@ -10,6 +10,9 @@ class VariableBase(BaseModel):
 class VariableCreate(VariableBase):
     pass
 
+class VariableBulkItem(VariableBase):
+    document_id: Optional[str] = Field(None, description="ID du document auquel rattacher la variable")
+
 class VariableUpdate(BaseModel):
     value: Optional[str] = Field(None, description="Nouvelle valeur de la variable")
     description: Optional[str] = Field(None, description="Nouvelle description de la variable")
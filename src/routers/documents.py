@@ -1,11 +1,11 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, HTTPException, UploadFile, File, Request
 from typing import List
 import uuid
 from datetime import datetime
 
 from ..models.base import Document
-from ..db.neo4j import db
-from ..storage.minio import storage
+from ..db.neo4j_async import async_db
+from ..storage.minio import async_storage
 
 router = APIRouter()
 
@@ -13,7 +13,7 @@ router = APIRouter()
 async def get_all_documents():
     """Get all documents"""
     try:
-        documents = db.get_all_documents()
+        documents = await async_db.get_all_documents()
         return documents
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -26,11 +26,7 @@ async def upload_document(
     """Upload a new document"""
     try:
         # Upload file to MinIO
-        minio_key = storage.upload_file(
-            file.file,
-            file.filename,
-            file.content_type
-        )
+        minio_key = await async_storage.upload_file(file)
         
         # Create document record
         document = Document(
@@ -42,7 +38,7 @@ async def upload_document(
         )
         
         # Save to Neo4j
-        db.create_document(document.dict())
+        await async_db.create_document(document.dict())
         
         return document
     except Exception as e:
@@ -51,20 +47,19 @@ async def upload_document(
 @router.get("/{document_id}", response_model=Document)
 async def get_document(document_id: str):
     """Get a document by ID"""
-    document = db.get_document(document_id)
+    document = await async_db.get_document(document_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     return document
 
 @router.get("/{document_id}/download")
-async def download_document(document_id: str):
+async def download_document(document_id: str, request: Request):
     """Download a document"""
-    document = db.get_document(document_id)
+    document = await async_db.get_document(document_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    file_data = storage.download_file(document.minio_key)
-    if not file_data:
-        raise HTTPException(status_code=500, detail="Error downloading file")
-    
-    return file_data 
\ No newline at end of file
+    return await async_storage.download_response(
+        document["minio_key"],
+        request.headers.get("range")
+    ) 
\ No newline at end of file
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File
-from typing import List, Dict, Any
-from src.tasks.scenarios import ScenarioRunner
+from fastapi import APIRouter, HTTPException, UploadFile, File, Query
+from typing import List, Dict, Any, Optional
+from src.tasks.executions import execution_queue, QueueFullError
 from src.services.scenario import ScenarioService
+from src.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginated_response, parse_fields
 import logging
 
 router = APIRouter(prefix="/scenarios", tags=["scenarios"])
@@ -21,14 +22,26 @@ async def create_scenario(scenario: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/")
-async def list_scenarios():
+async def list_scenarios(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    tag: Optional[str] = None,
+    status: Optional[str] = None,
+    created_by: Optional[str] = None
+):
     """
-    Liste tous les scénarios disponibles.
+    Liste les scénarios disponibles, page par page.
     """
     try:
         scenario_service = ScenarioService()
-        scenarios = await scenario_service.list_scenarios()
-        return scenarios
+        rows = scenario_service.list_scenarios(
+            limit, cursor, parse_fields(fields),
+            tag=tag, status=status, created_by=created_by
+        )
+        return await paginated_response(rows, limit)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erreur lors de la récupération des scénarios: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -50,15 +63,15 @@ async def get_scenario(scenario_id: str):
         logger.error(f"Erreur lors de la récupération du scénario: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/{scenario_id}/run")
-async def run_scenario(scenario_id: str):
+@router.post("/{scenario_id}/run", status_code=202)
+async def run_scenario(scenario_id: str, parameters: Optional[Dict[str, Any]] = None):
     """
-    Exécute un scénario spécifique.
+    Met en file l'exécution d'un scénario et retourne son identifiant.
     """
     try:
-        runner = ScenarioRunner()
-        result = await runner.run(scenario_id)
-        return result
+        return await execution_queue.enqueue(scenario_id, parameters)
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Erreur lors de l'exécution du scénario: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
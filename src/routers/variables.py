@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 
 from ..models.base import Variable
-from ..db.neo4j import db
+from ..db.neo4j_async import async_db
 
 router = APIRouter()
 
@@ -12,7 +12,7 @@ router = APIRouter()
 async def get_all_variables():
     """Get all variables"""
     try:
-        variables = db.get_all_variables()
+        variables = await async_db.get_all_variables()
         return variables
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -25,7 +25,7 @@ async def create_variable(variable: Variable):
     variable.updated_at = datetime.utcnow()
     
     try:
-        db.create_variable(variable.dict())
+        await async_db.create_variable(variable.dict())
         return variable
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -34,7 +34,7 @@ async def create_variable(variable: Variable):
 async def get_document_variables(document_id: str):
     """Get all variables for a document"""
     try:
-        variables = db.get_document_variables(document_id)
+        variables = await async_db.get_document_variables(document_id)
         return variables
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -43,7 +43,7 @@ async def get_document_variables(document_id: str):
 async def update_variable(variable_id: str, variable: Variable):
     """Update a variable"""
     try:
-        updated_variable = db.update_variable(variable_id, variable.dict())
+        updated_variable = await async_db.update_variable(variable_id, variable.dict())
         if not updated_variable:
             raise HTTPException(status_code=404, detail="Variable not found")
         return updated_variable
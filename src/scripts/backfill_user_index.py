@@ -0,0 +1,16 @@
+"""
+Reconstruit l'index email → user_id des utilisateurs stockés dans MinIO.
+
+Usage:
+    python -m src.scripts.backfill_user_index
+"""
+from src.services.auth import backfill_email_index
+
+
+def main() -> None:
+    count = backfill_email_index()
+    print(f"{count} utilisateur(s) indexé(s)")
+
+
+if __name__ == "__main__":
+    main()
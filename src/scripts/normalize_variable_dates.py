@@ -0,0 +1,27 @@
+"""
+Convertit en DateTime Neo4j les dates des variables enregistrées sous forme
+de chaîne ISO (variables rattachées à un document, créées avant que toutes
+les écritures utilisent datetime()). La pagination de GET /variables compare
+created_at à un DateTime : les autres valeurs en seraient exclues.
+
+Usage:
+    python -m src.scripts.normalize_variable_dates
+"""
+import asyncio
+from src.db.neo4j_async import async_db
+
+
+async def normalize() -> int:
+    try:
+        return await async_db.normalize_variable_dates()
+    finally:
+        await async_db.close()
+
+
+def main() -> None:
+    count = asyncio.run(normalize())
+    print(f"{count} variable(s) corrigée(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+Reconstruit le catalogue Neo4j des scénarios à partir des fichiers
+scenarios/*.json stockés dans MinIO.
+
+Usage:
+    python -m src.scripts.rebuild_scenario_catalog
+"""
+import asyncio
+from src.db.neo4j_async import async_db
+from src.services.scenario import ScenarioService
+
+
+async def rebuild() -> int:
+    try:
+        return await ScenarioService().rebuild_catalog()
+    finally:
+        await async_db.close()
+
+
+def main() -> None:
+    count = asyncio.run(rebuild())
+    print(f"{count} scénario(s) indexé(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from src.core.security import (
     verify_password,
     get_password_hash,
     create_access_token,
+    get_current_user,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
 from src.models.user import UserCreate, UserInDB
@@ -14,13 +15,20 @@ from src.db.session import get_db
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from src.core.config import settings
+from src.core.cache import TTLCache
 from src.db import get_storage
+from minio.error import S3Error
+from starlette.concurrency import run_in_threadpool
+import hashlib
 import json
 import uuid
 import io
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Utilisateurs déjà lus dans MinIO, par email normalisé ; invalidé par update_user
+user_cache = TTLCache(settings.AUTH_USER_CACHE_MAX_ENTRIES, settings.AUTH_USER_CACHE_TTL)
+
 async def authenticate_user(username: str, password: str, db: Session) -> Optional[UserInDB]:
     # TODO: Implement actual user lookup from database
     # This is a placeholder implementation
@@ -31,40 +39,151 @@ async def authenticate_user(username: str, password: str, db: Session) -> Option
         return None
     return user
 
+def _normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+def _email_index_key(email: str) -> str:
+    """
+    Retourne la clé de l'index email → user_id pour un email donné.
+    """
+    digest = hashlib.sha256(_normalize_email(email).encode('utf-8')).hexdigest()
+    return f"users/by-email/{digest}.json"
+
+def _put_json(storage, key: str, payload: dict) -> None:
+    content = json.dumps(payload).encode('utf-8')
+    storage.put_object(
+        settings.MINIO_BUCKET,
+        key,
+        io.BytesIO(content),
+        len(content),
+        content_type="application/json"
+    )
+
+def _get_json(storage, key: str) -> Optional[dict]:
+    try:
+        response = storage.get_object(settings.MINIO_BUCKET, key)
+    except S3Error as e:
+        if e.code == "NoSuchKey":
+            return None
+        raise
+    try:
+        return json.loads(response.read())
+    finally:
+        response.close()
+        response.release_conn()
+
 async def create_user(user_data: dict) -> dict:
-    storage = get_storage()
     user_id = str(uuid.uuid4())
     user_data["id"] = user_id
     user_data["hashed_password"] = get_password_hash(user_data["password"])
     user_data["created_at"] = datetime.utcnow().isoformat()
     del user_data["password"]
     
-    # Stocker l'utilisateur dans MinIO
-    user_key = f"users/{user_id}.json"
-    user_json = json.dumps(user_data)
-    data = io.BytesIO(user_json.encode('utf-8'))
-    storage.put_object(
-        settings.MINIO_BUCKET,
-        user_key,
-        data,
-        len(user_json)
-    )
+    await run_in_threadpool(_write_user, user_data)
+    user_cache.invalidate(_normalize_email(user_data["email"]))
     
     return user_data
 
-async def get_user_by_email(email: str) -> Optional[dict]:
+def _write_user(user_data: dict) -> None:
     storage = get_storage()
-    try:
-        # Lister tous les objets dans le dossier users
-        objects = storage.list_objects(settings.MINIO_BUCKET, prefix="users/")
-        for obj in objects:
-            data = storage.get_object(settings.MINIO_BUCKET, obj.object_name)
-            user = json.loads(data.read())
-            if user["email"] == email:
-                return user
-    except Exception:
+    # Stocker l'utilisateur dans MinIO
+    _put_json(storage, f"users/{user_data['id']}.json", user_data)
+
+    # Mettre à jour l'index secondaire email → user_id
+    _put_json(storage, _email_index_key(user_data["email"]), {
+        "email": user_data["email"],
+        "user_id": user_data["id"]
+    })
+
+def _read_user(email: str) -> Optional[dict]:
+    storage = get_storage()
+    # Lecture ponctuelle de l'index puis de l'utilisateur
+    entry = _get_json(storage, _email_index_key(email))
+    if not entry:
+        return None
+    return _get_json(storage, f"users/{entry['user_id']}.json")
+
+async def get_user_by_email(email: str, use_cache: bool = True) -> Optional[dict]:
+    """
+    Retourne l'utilisateur associé à un email, depuis le cache ou MinIO.
+
+    Avec use_cache=False, l'utilisateur est toujours relu dans MinIO
+    (vérification du mot de passe à la connexion).
+    """
+    key = _normalize_email(email)
+    user = user_cache.get(key) if use_cache else None
+    if user is None:
+        # Seul un objet absent (NoSuchKey) signifie « utilisateur inconnu » ;
+        # une erreur de stockage remonte à l'appelant (réponse 5xx)
+        user = await run_in_threadpool(_read_user, email)
+        if user is None:
+            return None
+        user_cache.set(key, user)
+    return dict(user)
+
+async def update_user(email: str, updates: dict) -> Optional[dict]:
+    """
+    Met à jour un utilisateur (un mot de passe en clair est haché) et
+    remplace son entrée dans le cache par l'enregistrement écrit.
+
+    Une simple invalidation laisserait une lecture concurrente, commencée
+    avant l'écriture, remettre l'ancien enregistrement en cache.
+
+    L'email, identifiant de l'index et du sujet des jetons, n'est pas modifiable.
+
+    Returns:
+        Optional[dict]: L'utilisateur mis à jour, ou None s'il n'existe pas
+    """
+    user = await run_in_threadpool(_read_user, email)
+    if not user:
         return None
-    return None
+    updates = {key: value for key, value in updates.items() if key not in ("id", "email", "hashed_password", "created_at")}
+    if updates.get("password"):
+        updates["hashed_password"] = get_password_hash(updates["password"])
+    updates.pop("password", None)
+    user.update(updates)
+    user["updated_at"] = datetime.utcnow().isoformat()
+
+    await run_in_threadpool(_put_json, get_storage(), f"users/{user['id']}.json", user)
+    user_cache.set(_normalize_email(email), dict(user))
+    return user
+
+async def get_current_user_record(email: str = Depends(get_current_user)) -> dict:
+    """
+    Dépendance FastAPI fournissant l'utilisateur connecté complet ; servi par
+    les caches de jetons et d'utilisateurs, sans accès à MinIO en régime établi.
+    """
+    user = await get_user_by_email(email)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    return user
+
+def backfill_email_index() -> int:
+    """
+    Reconstruit l'index email → user_id à partir des objets users/*.json.
+
+    Returns:
+        int: Le nombre d'entrées d'index écrites
+    """
+    storage = get_storage()
+    count = 0
+    # Les entrées d'index vivent sous users/by-email/ et ne sont pas listées
+    # ici car list_objects n'est pas récursif par défaut.
+    for obj in storage.list_objects(settings.MINIO_BUCKET, prefix="users/"):
+        if obj.is_dir or not obj.object_name.endswith(".json"):
+            continue
+        user = _get_json(storage, obj.object_name)
+        if not user or "email" not in user or "id" not in user:
+            continue
+        _put_json(storage, _email_index_key(user["email"]), {
+            "email": user["email"],
+            "user_id": user["id"]
+        })
+        count += 1
+    return count
 
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
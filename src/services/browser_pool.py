@@ -0,0 +1,158 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+from src.core.config import settings
+from src.core.metrics import registry
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+browser_wait_duration = registry.histogram(
+    "browser_pool_wait_seconds",
+    "Attente avant l'obtention d'un contexte de navigateur"
+)
+
+class _PooledBrowser:
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.uses = 0
+        self.active = 0
+
+    @property
+    def healthy(self) -> bool:
+        return self.browser.is_connected()
+
+class BrowserPool:
+    """
+    Pool de navigateurs Chromium partagé par tout le processus.
+
+    Les navigateurs restent lancés entre deux exécutions ; chaque exécution
+    reçoit un BrowserContext isolé (cookies, stockage, cache). Un navigateur
+    est relancé après max_uses contextes ou s'il n'est plus connecté.
+    """
+    def __init__(self, size: int, max_uses: int, max_contexts: int):
+        """
+        Args:
+            size: Nombre de navigateurs gardés lancés
+            max_uses: Nombre de contextes servis par un navigateur avant son recyclage
+            max_contexts: Nombre maximal de contextes ouverts simultanément
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self.max_contexts = max_contexts
+        self._playwright: Optional[Playwright] = None
+        self._browsers: List[_PooledBrowser] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self.acquisitions = 0
+        self.recycled = 0
+        self.total_wait = 0.0
+
+    async def start(self) -> None:
+        async with self._get_lock():
+            await self._start()
+
+    async def _start(self) -> None:
+        if self._playwright is not None:
+            return
+        self._playwright = await async_playwright().start()
+        for _ in range(self.size):
+            self._browsers.append(_PooledBrowser(await self._launch()))
+
+    async def _launch(self) -> Browser:
+        return await self._playwright.chromium.launch(headless=True)
+
+    async def close(self) -> None:
+        async with self._get_lock():
+            for pooled in self._browsers:
+                try:
+                    await pooled.browser.close()
+                except Exception as e:
+                    logger.error(f"Erreur lors de la fermeture du navigateur: {str(e)}")
+            self._browsers = []
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def _acquire_browser(self) -> _PooledBrowser:
+        async with self._get_lock():
+            await self._start()
+            # Remplacer les navigateurs déconnectés ou usés qui ne servent plus
+            for pooled in list(self._browsers):
+                if pooled.active == 0 and (not pooled.healthy or pooled.uses >= self.max_uses):
+                    await self._retire(pooled)
+            while len(self._browsers) < self.size:
+                self._browsers.append(_PooledBrowser(await self._launch()))
+
+            candidates = [p for p in self._browsers if p.healthy and p.uses < self.max_uses]
+            if not candidates:
+                # Tous les navigateurs sont en fin de vie mais encore utilisés :
+                # en lancer un de plus, il sera retiré une fois libéré
+                pooled = _PooledBrowser(await self._launch())
+                self._browsers.append(pooled)
+                candidates = [pooled]
+            pooled = min(candidates, key=lambda p: p.active)
+            pooled.uses += 1
+            pooled.active += 1
+            return pooled
+
+    async def _retire(self, pooled: _PooledBrowser) -> None:
+        self._browsers.remove(pooled)
+        self.recycled += 1
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.error(f"Erreur lors de la fermeture du navigateur: {str(e)}")
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Créés à la première utilisation pour être liés à la boucle en cours
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_contexts)
+        return self._semaphore
+
+    @asynccontextmanager
+    async def context(self, **options: Any) -> AsyncIterator[BrowserContext]:
+        """
+        Fournit un BrowserContext isolé, fermé à la sortie du bloc.
+        """
+        semaphore = self._get_semaphore()
+        start = time.perf_counter()
+        await semaphore.acquire()
+        try:
+            pooled = await self._acquire_browser()
+            self.acquisitions += 1
+            waited = time.perf_counter() - start
+            self.total_wait += waited
+            browser_wait_duration.observe(waited)
+            try:
+                context = await pooled.browser.new_context(**options)
+                try:
+                    yield context
+                finally:
+                    await context.close()
+            finally:
+                pooled.active -= 1
+        finally:
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "browsers": len(self._browsers),
+            "active_contexts": sum(p.active for p in self._browsers),
+            "acquisitions": self.acquisitions,
+            "recycled": self.recycled,
+            "avg_wait_ms": (self.total_wait / self.acquisitions * 1000) if self.acquisitions else 0.0
+        }
+
+browser_pool = BrowserPool(
+    settings.BROWSER_POOL_SIZE,
+    settings.BROWSER_MAX_USES,
+    settings.BROWSER_MAX_CONTEXTS
+)
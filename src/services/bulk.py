@@ -0,0 +1,53 @@
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+BatchWriter = Callable[[List[Dict[str, Any]]], Awaitable[List[str]]]
+
+async def write_in_batches(
+    rows: List[Tuple[int, Dict[str, Any]]],
+    write_batch: BatchWriter,
+    batch_size: int,
+    missing_error: str
+) -> Dict[str, Any]:
+    """
+    Écrit des lignes par lots, chaque lot dans une seule transaction.
+
+    Si un lot échoue, ses lignes sont réécrites une par une pour isoler
+    celles qui posent problème ; les autres sont tout de même créées.
+
+    Args:
+        rows: Les lignes à écrire, avec leur position dans la requête d'origine
+        write_batch: Écrit un lot et retourne les identifiants créés
+        batch_size: Nombre de lignes par lot
+        missing_error: Erreur signalée pour une ligne absente des identifiants créés
+
+    Returns:
+        Dict: Les identifiants créés et les erreurs, ligne par ligne ({"index", "error"})
+    """
+    ids: List[str] = []
+    errors: List[Dict[str, Any]] = []
+
+    async def write(batch: List[Tuple[int, Dict[str, Any]]]) -> None:
+        try:
+            created = set(await write_batch([row for _, row in batch]))
+        except Exception as e:
+            if len(batch) > 1:
+                logger.error(f"Échec d'un lot de {len(batch)} lignes, écriture ligne par ligne: {str(e)}")
+                for item in batch:
+                    await write([item])
+            else:
+                errors.append({"index": batch[0][0], "error": str(e)})
+            return
+        for index, row in batch:
+            if row["id"] in created:
+                ids.append(row["id"])
+            else:
+                errors.append({"index": index, "error": missing_error})
+
+    for start in range(0, len(rows), batch_size):
+        await write(rows[start:start + batch_size])
+
+    errors.sort(key=lambda error: error["index"])
+    return {"created": len(ids), "ids": ids, "errors": errors}
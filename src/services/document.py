@@ -1,6 +1,11 @@
-from typing import Dict, Any, List
+from typing import AsyncIterator, Dict, Any, List, Optional
 from fastapi import UploadFile
-from src.db.session import get_db
+from fastapi.responses import StreamingResponse
+from src.core.config import settings
+from src.core.pagination import decode_cursor
+from src.db.neo4j_async import async_db
+from src.storage.minio import async_storage
+from src.services.bulk import write_in_batches
 import uuid
 from datetime import datetime
 
@@ -19,76 +24,83 @@ class DocumentService:
             "status": "draft"
         }
         
-        with get_db() as session:
-            # Créer le document dans Neo4j
-            query = """
-            CREATE (d:Document {
-                id: $id,
-                name: $name,
-                description: $description,
-                created_at: $created_at,
-                status: $status
+        # Créer le document dans Neo4j
+        await async_db.create_document_draft(document_data)
+        return document_data
+
+    @staticmethod
+    async def create_documents_bulk(
+        documents: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Crée des documents en masse, par lots écrits avec une seule requête UNWIND.
+        """
+        created_at = datetime.utcnow().isoformat()
+        rows = [
+            (index, {
+                "id": str(uuid.uuid4()),
+                "name": document.get("name", "Unnamed Document"),
+                "description": document.get("description", ""),
+                "created_at": created_at,
+                "status": "draft"
             })
-            RETURN d
-            """
-            result = session.run(query, **document_data)
-            return document_data
+            for index, document in enumerate(documents)
+        ]
+        return await write_in_batches(
+            rows,
+            async_db.create_documents_bulk,
+            batch_size or settings.NEO4J_BULK_BATCH_SIZE,
+            "Document non créé"
+        )
 
     @staticmethod
-    async def list_documents() -> List[Dict[str, Any]]:
+    def list_documents(
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Liste tous les documents.
+        Liste les documents page par page, du plus récent au plus ancien.
         """
-        with get_db() as session:
-            query = """
-            MATCH (d:Document)
-            RETURN d
-            """
-            result = session.run(query)
-            return [dict(record["d"]) for record in result]
+        after_created_at, after_id = decode_cursor(cursor)
+        return async_db.iter_documents(limit, after_created_at, after_id, fields)
 
     @staticmethod
     async def get_document(document_id: str) -> Dict[str, Any]:
         """
         Récupère un document par son ID.
         """
-        with get_db() as session:
-            query = """
-            MATCH (d:Document {id: $id})
-            RETURN d
-            """
-            result = session.run(query, id=document_id)
-            record = result.single()
-            if record:
-                return dict(record["d"])
-            return None
+        return await async_db.get_document(document_id)
 
     @staticmethod
     async def upload_file(document_id: str, file: UploadFile) -> Dict[str, Any]:
         """
         Télécharge un fichier pour un document.
         """
-        # Lire le contenu du fichier
-        content = await file.read()
+        # Envoyer le fichier vers MinIO par morceaux, sans le charger en mémoire
+        file_size = await async_storage.get_upload_size(file)
+        minio_key = await async_storage.upload_file(file)
         
-        with get_db() as session:
-            # Mettre à jour le document avec les informations du fichier
-            query = """
-            MATCH (d:Document {id: $id})
-            SET d.filename = $filename,
-                d.content_type = $content_type,
-                d.file_size = $file_size,
-                d.updated_at = $updated_at
-            RETURN d
-            """
-            result = session.run(query,
-                id=document_id,
-                filename=file.filename,
-                content_type=file.content_type,
-                file_size=len(content),
-                updated_at=datetime.utcnow().isoformat()
-            )
-            record = result.single()
-            if record:
-                return dict(record["d"])
-            return None 
\ No newline at end of file
+        # Mettre à jour le document avec les informations du fichier
+        return await async_db.update_document_file(document_id, {
+            "filename": file.filename,
+            "content_type": file.content_type,
+            "file_size": file_size,
+            "minio_key": minio_key,
+            "updated_at": datetime.utcnow().isoformat()
+        })
+
+    @staticmethod
+    async def download_file(document_id: str, range_header: Optional[str] = None) -> Optional[StreamingResponse]:
+        """
+        Renvoie le fichier d'un document sous forme de flux (requêtes Range prises en charge).
+        """
+        document = await async_db.get_document(document_id)
+        if not document or not document.get("minio_key"):
+            return None
+        return await async_storage.download_response(
+            document["minio_key"],
+            range_header,
+            filename=document.get("filename")
+        )
@@ -1,53 +1,170 @@
-from typing import Optional
+from typing import AsyncIterator, Callable, List, Optional, Tuple, Union
 from fastapi import UploadFile
-import io
-from pdfminer.high_level import extract_text_to_fp
-from pdfminer.layout import LAParams
-from pdfminer.converter import TextConverter
-from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+from starlette.concurrency import run_in_threadpool
+from src.core.config import settings
+from src.core.metrics import registry
+from src.core.process_pool import ProcessPool
+from src.services.pdf_cache import pdf_text_cache
+from src.services.pdf_worker import extract_pages_worker
+from src.storage.minio import async_storage
+import asyncio
+import os
+import tempfile
+import time
+
+PDFSource = Union[bytes, str, UploadFile]
+
+# Pool de processus partagé pour l'extraction de texte
+pdf_pool = ProcessPool(settings.PDF_WORKERS)
+
+pdf_batch_duration = registry.histogram(
+    "pdf_extraction_batch_duration_seconds",
+    "Durée d'extraction d'un lot de pages PDF dans le pool de processus"
+)
+pdf_pages_extracted = registry.counter(
+    "pdf_pages_extracted",
+    "Pages PDF extraites, par origine (cache ou extraction)",
+    ["source"]
+)
+
+class PDFExtractionTimeout(Exception):
+    pass
+
+def _write_temp_pdf(pdf_content: bytes) -> str:
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    with os.fdopen(fd, "wb") as f:
+        f.write(pdf_content)
+    return path
+
+def parse_page_range(pages: Optional[str]) -> Tuple[int, Optional[int]]:
+    """
+    Convertit une plage de pages ("3", "2-10", "5-") en (première, dernière),
+    numérotées à partir de 1 ; la dernière page vaut None si elle est ouverte.
+    """
+    if not pages:
+        return 1, None
+    try:
+        first, separator, last = str(pages).partition("-")
+        first_page = int(first) if first.strip() else 1
+        if not separator:
+            return first_page, first_page
+        last_page = int(last) if last.strip() else None
+    except ValueError:
+        raise ValueError(f"Plage de pages invalide: {pages}")
+    if first_page < 1 or (last_page is not None and last_page < first_page):
+        raise ValueError(f"Plage de pages invalide: {pages}")
+    return first_page, last_page
 
 class PDFService:
     @staticmethod
-    async def extract_text_from_pdf(pdf_file: UploadFile) -> str:
+    async def load_pdf(source: PDFSource) -> bytes:
+        """
+        Retourne le contenu d'un PDF fourni sous forme d'octets, de clé MinIO
+        ou d'UploadFile.
+        """
+        if isinstance(source, bytes):
+            return source
+        if isinstance(source, str):
+            return b"".join([chunk async for chunk in async_storage.iter_file(source)])
+        return await source.read()
+
+    @staticmethod
+    async def extract_text_from_pdf(source: PDFSource, max_pages: Optional[int] = None) -> str:
         """
-        Extrait le texte d'un fichier PDF.
+        Extrait le texte d'un fichier PDF dans le pool de processus, sans
+        bloquer la boucle d'événements.
         
         Args:
-            pdf_file: Le fichier PDF à traiter
+            source: Le contenu du PDF, ou sa clé dans MinIO
+            max_pages: Nombre maximal de pages à traiter (par défaut PDF_MAX_PAGES)
             
         Returns:
             str: Le texte extrait du PDF
+
+        Raises:
+            PDFExtractionTimeout: Si l'extraction d'un lot de pages dépasse PDF_TIMEOUT_SECONDS
         """
-        # Créer un buffer pour stocker le texte extrait
-        output_string = io.StringIO()
-        
-        # Configurer les paramètres d'extraction
-        laparams = LAParams()
-        rsrcmgr = PDFResourceManager()
-        device = TextConverter(rsrcmgr, output_string, laparams=laparams)
-        
-        # Lire le contenu du fichier PDF
-        pdf_content = await pdf_file.read()
-        
-        # Créer un buffer pour le contenu PDF
-        pdf_buffer = io.BytesIO(pdf_content)
-        
-        # Extraire le texte
-        interpreter = PDFPageInterpreter(rsrcmgr, device)
-        extract_text_to_fp(
-            pdf_buffer,
-            output_string,
-            codec='utf-8',
-            laparams=laparams,
-            output_type='text'
-        )
-        
-        # Fermer les ressources
-        device.close()
-        output_string.close()
-        
-        # Retourner le texte extrait
-        return output_string.getvalue()
+        pages = [page async for page in PDFService.iter_pdf_pages(source, last_page=max_pages or None)]
+        return "".join(pages)
+
+    @staticmethod
+    async def iter_pdf_pages(
+        source: PDFSource,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+        until: Optional[Callable[[str], bool]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Extrait le texte page par page, par lots de PDF_STREAM_BATCH_PAGES pages
+        traités dans le pool de processus.
+
+        Args:
+            source: Le contenu du PDF, ou sa clé dans MinIO
+            first_page: Première page à extraire (à partir de 1)
+            last_page: Dernière page à extraire (par défaut, la fin du document
+                dans la limite de PDF_MAX_PAGES)
+            until: Prédicat appelé sur le texte de chaque page ; l'extraction
+                s'arrête après la première page pour laquelle il est vrai
+
+        Yields:
+            str: Le texte de chaque page, terminé par un saut de page
+        """
+        pdf_content = await PDFService.load_pdf(source)
+        if settings.PDF_MAX_PAGES:
+            last_page = min(last_page or settings.PDF_MAX_PAGES, settings.PDF_MAX_PAGES)
+
+        # Document déjà extrait : une empreinte et une lecture suffisent
+        cache_key = await pdf_text_cache.key_for(pdf_content)
+        cached = await pdf_text_cache.get(cache_key)
+        if cached is not None:
+            for text in cached[first_page - 1:last_page]:
+                pdf_pages_extracted.inc(source="cache")
+                yield text
+                if until is not None and until(text):
+                    return
+            return
+
+        batch_size = settings.PDF_STREAM_BATCH_PAGES
+        # Seule une extraction complète du document est mise en cache
+        extracted: Optional[List[str]] = [] if first_page == 1 else None
+
+        # Le contenu est écrit une fois dans un fichier temporaire : chaque lot
+        # ne transmet au processus que son chemin
+        pdf_path = await run_in_threadpool(_write_temp_pdf, pdf_content)
+        try:
+            page = first_page
+            while last_page is None or page <= last_page:
+                count = batch_size if last_page is None else min(batch_size, last_page - page + 1)
+                start = time.perf_counter()
+                try:
+                    texts = await pdf_pool.run(
+                        extract_pages_worker, pdf_path, page - 1, count,
+                        timeout=settings.PDF_TIMEOUT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    raise PDFExtractionTimeout(
+                        f"L'extraction des pages {page} à {page + count - 1} a dépassé "
+                        f"{settings.PDF_TIMEOUT_SECONDS} secondes"
+                    )
+                pdf_batch_duration.observe(time.perf_counter() - start)
+                pdf_pages_extracted.inc(len(texts), source="extraction")
+                end_of_document = len(texts) < count
+                if extracted is not None:
+                    extracted.extend(texts)
+                    if end_of_document:
+                        # Mettre en cache avant de rendre les dernières pages,
+                        # l'appelant pouvant s'arrêter avant la fin
+                        await pdf_text_cache.set(cache_key, extracted)
+                for text in texts:
+                    yield text
+                    if until is not None and until(text):
+                        return
+                if end_of_document:
+                    return
+                page += count
+        finally:
+            os.unlink(pdf_path)
 
-# Exporter la méthode statique pour une utilisation directe
-extract_text_from_pdf = PDFService.extract_text_from_pdf 
\ No newline at end of file
+# Exporter les méthodes statiques pour une utilisation directe
+extract_text_from_pdf = PDFService.extract_text_from_pdf
+iter_pdf_pages = PDFService.iter_pdf_pages
@@ -0,0 +1,103 @@
+from typing import Any, Dict, List, Optional
+from starlette.concurrency import run_in_threadpool
+from src.core.cache import DiskLRUCache
+from src.core.config import settings
+from src.services.pdf_worker import laparams_fingerprint
+from src.storage.minio import AsyncMinIOStorage, async_storage
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+class PDFTextCache:
+    """
+    Cache du texte extrait des PDF, adressé par contenu.
+
+    La clé combine le SHA-256 du fichier et l'empreinte des LAParams : un même
+    document n'est analysé qu'une fois, quel que soit son nom ou son origine.
+    Le texte et la position de début de chaque page sont stockés dans MinIO
+    sous derived/pdf-text/, avec un cache LRU sur disque local devant.
+    """
+    def __init__(self, storage: AsyncMinIOStorage, disk: DiskLRUCache, prefix: str = "derived/pdf-text/"):
+        self.storage = storage
+        self.disk = disk
+        self.prefix = prefix
+        self.laparams = laparams_fingerprint()
+        self.disk_hits = 0
+        self.storage_hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def key_for(self, pdf_content: bytes) -> str:
+        digest = await run_in_threadpool(lambda: hashlib.sha256(pdf_content).hexdigest())
+        return f"{digest}-{self.laparams}"
+
+    async def get(self, key: str) -> Optional[List[str]]:
+        """
+        Retourne le texte de chaque page, ou None si le document n'est pas en cache.
+        """
+        try:
+            data = await run_in_threadpool(self.disk.get, key)
+            if data is not None:
+                self.disk_hits += 1
+                return self._decode(data)
+            data = await self.storage.get_bytes(f"{self.prefix}{key}.json")
+            if data is not None:
+                self.storage_hits += 1
+                await run_in_threadpool(self.disk.set, key, data)
+                return self._decode(data)
+        except Exception as e:
+            # Le cache ne doit jamais empêcher l'extraction
+            self.errors += 1
+            logger.error(f"Erreur lors de la lecture du cache de texte PDF {key}: {str(e)}")
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, pages: List[str]) -> None:
+        """
+        Enregistre le texte complet d'un document dans MinIO et sur disque.
+        """
+        data = self._encode(pages)
+        try:
+            await self.storage.put_bytes(f"{self.prefix}{key}.json", data, "application/json")
+            await run_in_threadpool(self.disk.set, key, data)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Erreur lors de l'écriture du cache de texte PDF {key}: {str(e)}")
+
+    def _encode(self, pages: List[str]) -> bytes:
+        offsets = []
+        position = 0
+        for page in pages:
+            offsets.append(position)
+            position += len(page)
+        return json.dumps({
+            "laparams": self.laparams,
+            "page_offsets": offsets,
+            "text": "".join(pages)
+        }).encode("utf-8")
+
+    @staticmethod
+    def _decode(data: bytes) -> List[str]:
+        payload = json.loads(data)
+        text = payload["text"]
+        bounds = payload["page_offsets"] + [len(text)]
+        return [text[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.disk_hits + self.storage_hits
+        lookups = hits + self.misses
+        return {
+            "disk_hits": self.disk_hits,
+            "storage_hits": self.storage_hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "disk": self.disk.stats()
+        }
+
+pdf_text_cache = PDFTextCache(
+    async_storage,
+    DiskLRUCache(settings.PDF_CACHE_DIR, settings.PDF_CACHE_DISK_MAX_BYTES)
+)
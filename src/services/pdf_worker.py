@@ -0,0 +1,45 @@
+"""
+Fonctions exécutées dans les processus du pool d'extraction PDF.
+
+Ce module n'importe que pdfminer pour que le démarrage des processus reste
+léger : il ne doit pas dépendre de la configuration ni des clients MinIO/Neo4j.
+"""
+from typing import List
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LAParams, LTTextContainer
+import hashlib
+import json
+
+
+def make_laparams() -> LAParams:
+    """
+    Paramètres d'analyse de mise en page utilisés pour toutes les extractions.
+    """
+    return LAParams()
+
+
+def laparams_fingerprint() -> str:
+    """
+    Empreinte des paramètres d'analyse, incluse dans la clé du cache de texte.
+    """
+    options = json.dumps(vars(make_laparams()), sort_keys=True, default=str)
+    return hashlib.sha256(options.encode("utf-8")).hexdigest()[:16]
+
+
+def extract_pages_worker(pdf_path: str, first_page: int, page_count: int) -> List[str]:
+    """
+    Extrait le texte de page_count pages à partir de first_page (index 0).
+
+    Le PDF est lu depuis un fichier local : seul son chemin est transmis au
+    processus, pas son contenu. Retourne moins de page_count éléments si le
+    document se termine avant.
+    """
+    pages = []
+    page_numbers = range(first_page, first_page + page_count)
+    with open(pdf_path, "rb") as pdf_file:
+        for layout in extract_pages(pdf_file, page_numbers=page_numbers, laparams=make_laparams()):
+            text = "".join(
+                element.get_text() for element in layout if isinstance(element, LTTextContainer)
+            )
+            pages.append(text + "\f")
+    return pages
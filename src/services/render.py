@@ -0,0 +1,142 @@
+from typing import Any, Callable, Dict, List, Set
+from jinja2 import Environment, TemplateNotFound, meta
+from minio.error import S3Error
+from starlette.concurrency import run_in_threadpool
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.process_pool import ProcessPool
+from src.services.render_worker import html_to_pdf_worker
+from src.services.template import TemplateProcessor
+from src.storage.minio import async_storage
+import asyncio
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Pool de processus partagé pour la mise en page WeasyPrint
+render_pool = ProcessPool(settings.RENDER_WORKERS)
+
+# Empreinte de chaque template (avec ses dépendances) et fonctions de
+# vérification de leur date de modification
+template_hash_cache = TTLCache(settings.TEMPLATE_CACHE_MAX_ENTRIES)
+
+class RenderTimeout(Exception):
+    pass
+
+class RenderService:
+    """
+    Génère des PDF à partir de templates Jinja2 : template → HTML → PDF.
+
+    Le résultat est stocké dans MinIO sous derived/render/, à une clé dérivée
+    du contenu du template et du contexte : un même rendu n'est calculé qu'une
+    fois.
+    """
+    def __init__(self, prefix: str = "derived/render/"):
+        self.template_processor = TemplateProcessor()
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _hash_sources(
+        env: Environment,
+        template_name: str,
+        digest: Any,
+        seen: Set[str],
+        uptodates: List[Callable[[], bool]]
+    ) -> None:
+        # Le template et, récursivement, ceux qu'il étend, inclut ou importe
+        if template_name in seen:
+            return
+        seen.add(template_name)
+        source, _, uptodate = env.loader.get_source(env, template_name)
+        if uptodate is not None:
+            uptodates.append(uptodate)
+        digest.update(template_name.encode("utf-8") + b"\0" + source.encode("utf-8") + b"\0")
+        for referenced in meta.find_referenced_templates(env.parse(source)):
+            # None : nom calculé à l'exécution, impossible à résoudre ici
+            if referenced is None:
+                continue
+            try:
+                RenderService._hash_sources(env, referenced, digest, seen, uptodates)
+            except TemplateNotFound:
+                # {% include ... ignore missing %}
+                continue
+
+    def template_hash(self, template_name: str) -> str:
+        """
+        Empreinte du template et des templates qu'il référence, recalculée
+        seulement quand l'un de ces fichiers a été modifié (date de
+        modification vérifiée par le loader).
+        """
+        cached = template_hash_cache.get(template_name)
+        if cached is not None:
+            template_hash, uptodates = cached
+            if all(uptodate() for uptodate in uptodates):
+                return template_hash
+            template_hash_cache.invalidate(template_name)
+        env = self.template_processor.env
+        digest = hashlib.sha256()
+        uptodates: List[Callable[[], bool]] = []
+        self._hash_sources(env, template_name, digest, set(), uptodates)
+        template_hash = digest.hexdigest()
+        template_hash_cache.set(template_name, (template_hash, uptodates))
+        return template_hash
+
+    def render_key(self, template_name: str, context: Dict[str, Any]) -> str:
+        template_hash = self.template_hash(template_name)
+        context_json = json.dumps(context, sort_keys=True, default=str)
+        context_hash = hashlib.sha256(context_json.encode("utf-8")).hexdigest()
+        return f"{self.prefix}{template_hash}-{context_hash}.pdf"
+
+    async def render_pdf(self, template_name: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Rend un template en PDF et l'enregistre dans MinIO.
+
+        Args:
+            template_name: Le nom du template HTML
+            context: Le contexte du template
+
+        Returns:
+            Dict: La clé MinIO du PDF, sa taille, son nombre de pages (si
+                calculé) et si le rendu provenait du cache
+
+        Raises:
+            RenderTimeout: Si la mise en page dépasse RENDER_TIMEOUT_SECONDS
+        """
+        object_name = await run_in_threadpool(self.render_key, template_name, context)
+        try:
+            stat = await async_storage.stat_file(object_name)
+            self.hits += 1
+            return {"object_name": object_name, "size": stat.size, "pages": None, "cached": True}
+        except S3Error as e:
+            if e.code != "NoSuchKey":
+                raise
+        self.misses += 1
+
+        html = await run_in_threadpool(self.template_processor.process_template, template_name, context)
+        try:
+            pdf_content, pages = await render_pool.run(
+                html_to_pdf_worker,
+                html,
+                settings.TEMPLATE_DIR,
+                timeout=settings.RENDER_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            raise RenderTimeout(
+                f"Le rendu de {template_name} a dépassé {settings.RENDER_TIMEOUT_SECONDS} secondes"
+            )
+        await async_storage.put_bytes(object_name, pdf_content, "application/pdf")
+        return {"object_name": object_name, "size": len(pdf_content), "pages": pages, "cached": False}
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+render_service = RenderService()
@@ -0,0 +1,17 @@
+"""
+Conversion HTML → PDF exécutée dans les processus du pool de rendu.
+
+WeasyPrint est importé dans la fonction : seuls les processus du pool
+chargent la bibliothèque et ses dépendances natives.
+"""
+from typing import Optional, Tuple
+
+
+def html_to_pdf_worker(html: str, base_url: Optional[str] = None) -> Tuple[bytes, int]:
+    """
+    Met en page un document HTML et retourne le PDF et son nombre de pages.
+    """
+    from weasyprint import HTML
+
+    document = HTML(string=html, base_url=base_url).render()
+    return document.write_pdf(), len(document.pages)
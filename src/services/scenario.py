@@ -1,28 +1,31 @@
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterable, AsyncIterator, List, Dict, Any, Optional
 from fastapi import UploadFile
-from src.services.pdf import extract_text_from_pdf
-from src.services.web import WebAutomation
+from starlette.concurrency import run_in_threadpool
+from src.services.pdf import iter_pdf_pages
 from src.services.template import TemplateProcessor
 from src.core.config import settings
+from src.core.cache import TTLCache
+from src.core.pagination import decode_cursor
+from src.db.neo4j_async import async_db
+import copy
 import json
 import uuid
 from datetime import datetime
 from src.db import get_storage
 import io
 
+# Scénarios déjà lus dans MinIO, associés à l'ETag de l'objet
+scenario_cache = TTLCache(settings.SCENARIO_CACHE_MAX_ENTRIES, settings.SCENARIO_CACHE_TTL)
+
 class ScenarioService:
     def __init__(self):
-        self.web_automation = WebAutomation()
         self.template_processor = TemplateProcessor()
         self.storage = get_storage()
         self.bucket = settings.MINIO_BUCKET
 
     async def create_scenario_from_pdf(self, pdf_file: UploadFile) -> Dict[str, Any]:
-        # Extraire le texte du PDF
-        text = await extract_text_from_pdf(pdf_file)
-        
-        # Analyser le texte pour extraire les étapes du scénario
-        scenario_data = self._parse_scenario_text(text)
+        # Analyser le texte du PDF, page par page, pour extraire les étapes du scénario
+        scenario_data = await self._parse_scenario_text(iter_pdf_pages(await pdf_file.read()))
         
         # Créer un ID unique pour le scénario
         scenario_id = str(uuid.uuid4())
@@ -42,7 +45,7 @@ class ScenarioService:
         
         return scenario
 
-    def _parse_scenario_text(self, text: str) -> Dict[str, Any]:
+    async def _parse_scenario_text(self, pages: AsyncIterable[str]) -> Dict[str, Any]:
         # Exemple de format attendu dans le PDF :
         # Nom du scénario: [nom]
         # Description: [description]
@@ -50,7 +53,6 @@ class ScenarioService:
         # 1. [type]: [détails]
         # 2. [type]: [détails]
         
-        lines = text.split('\n')
         scenario = {
             "name": "",
             "description": "",
@@ -58,115 +60,147 @@ class ScenarioService:
         }
         
         current_section = None
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        async for page in pages:
+            for line in page.split('\n'):
+                line = line.strip()
+                if not line:
+                    continue
                 
-            if line.startswith("Nom du scénario:"):
-                scenario["name"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Description:"):
-                scenario["description"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Étapes:"):
-                current_section = "steps"
-            elif current_section == "steps" and line[0].isdigit():
-                step_parts = line.split(":", 1)
-                if len(step_parts) == 2:
-                    step_type = step_parts[0].split(".", 1)[1].strip()
-                    step_details = step_parts[1].strip()
-                    scenario["steps"].append({
-                        "type": step_type,
-                        "details": json.loads(step_details)
-                    })
+                if line.startswith("Nom du scénario:"):
+                    scenario["name"] = line.split(":", 1)[1].strip()
+                elif line.startswith("Description:"):
+                    scenario["description"] = line.split(":", 1)[1].strip()
+                elif line.startswith("Étapes:"):
+                    current_section = "steps"
+                elif current_section == "steps" and line[0].isdigit():
+                    step_parts = line.split(":", 1)
+                    if len(step_parts) == 2:
+                        step_type = step_parts[0].split(".", 1)[1].strip()
+                        step_details = step_parts[1].strip()
+                        scenario["steps"].append({
+                            "type": step_type,
+                            "details": json.loads(step_details)
+                        })
         
         return scenario
 
-    async def execute_scenario(self, scenario_id: str) -> Dict[str, Any]:
-        # Récupérer le scénario depuis Neo4j
-        # scenario = self._get_from_neo4j(scenario_id)
-        
-        # TODO: Implémenter la récupération depuis Neo4j
-        scenario = {
-            "id": scenario_id,
-            "steps": []
-        }
-        
-        results = []
-        for step in scenario["steps"]:
-            if step["type"] == "web":
-                result = await self._execute_web_step(step["details"])
-            elif step["type"] == "template":
-                result = await self._execute_template_step(step["details"])
-            else:
-                result = {"error": f"Type de step non supporté: {step['type']}"}
-            
-            results.append(result)
-        
-        return {
-            "scenario_id": scenario_id,
-            "results": results,
-            "status": "completed",
-            "completed_at": datetime.utcnow().isoformat()
-        }
-
-    async def _execute_web_step(self, details: Dict[str, Any]) -> Dict[str, Any]:
-        try:
-            await self.web_automation.navigate(details["url"])
-            for action in details.get("actions", []):
-                if action["type"] == "click":
-                    await self.web_automation.click(action["selector"])
-                elif action["type"] == "fill":
-                    await self.web_automation.fill(action["selector"], action["value"])
-                elif action["type"] == "submit":
-                    await self.web_automation.submit(action["selector"])
-            
-            return {"status": "success", "message": "Web step executed successfully"}
-        except Exception as e:
-            return {"status": "error", "message": str(e)}
+    def list_scenarios(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        tag: Optional[str] = None,
+        status: Optional[str] = None,
+        created_by: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Liste les scénarios depuis le catalogue Neo4j, sans lire leur contenu
+        dans MinIO. Les étapes ne sont chargées que par get_scenario.
+        """
+        after_created_at, after_id = decode_cursor(cursor)
+        return async_db.iter_scenarios(
+            limit, after_created_at, after_id, fields,
+            tag=tag, status=status, created_by=created_by
+        )
 
-    async def _execute_template_step(self, details: Dict[str, Any]) -> Dict[str, Any]:
+    async def get_scenario(self, scenario_id: str) -> Optional[dict]:
+        scenario_key = f"scenarios/{scenario_id}.json"
         try:
-            result = await self.template_processor.process_template(
-                details["template_name"],
-                details.get("variables", {})
-            )
-            return {"status": "success", "result": result}
-        except Exception as e:
-            return {"status": "error", "message": str(e)}
+            # Une requête HEAD suffit quand la version en cache est encore à jour
+            stat = await run_in_threadpool(self.storage.stat_object, self.bucket, scenario_key)
+            etag = stat.etag
+        except Exception:
+            scenario_cache.invalidate(scenario_id)
+            return None
 
-    async def list_scenarios(self) -> List[dict]:
-        try:
-            scenarios = []
-            objects = self.storage.list_objects(self.bucket, prefix="scenarios/")
-            for obj in objects:
-                data = self.storage.get_object(self.bucket, obj.object_name)
-                scenario = json.loads(data.read().decode('utf-8'))
-                scenarios.append(scenario)
-            return scenarios
-        except Exception as e:
-            print(f"Erreur lors de la récupération des scénarios: {str(e)}")
-            return []
+        cached = scenario_cache.get(scenario_id, validate=lambda entry: entry[0] == etag)
+        if cached is not None:
+            return copy.deepcopy(cached[1])
 
-    async def get_scenario(self, scenario_id: str) -> Optional[dict]:
         try:
-            scenario_key = f"scenarios/{scenario_id}.json"
-            data = self.storage.get_object(self.bucket, scenario_key)
-            return json.loads(data.read().decode('utf-8'))
+            scenario, etag = await run_in_threadpool(self._read_scenario_object, scenario_key, etag)
         except Exception:
             return None
+        scenario_cache.set(scenario_id, (etag, scenario))
+        return copy.deepcopy(scenario)
 
     async def create_scenario(self, scenario_data: dict) -> dict:
         scenario_id = str(uuid.uuid4())
         scenario_data["id"] = scenario_id
-        scenario_key = f"scenarios/{scenario_id}.json"
-        scenario_json = json.dumps(scenario_data)
-        data = io.BytesIO(scenario_json.encode('utf-8'))
+        scenario_data.setdefault("created_at", datetime.utcnow().isoformat())
+        scenario_data.setdefault("status", "draft")
+        await self._save_scenario(scenario_data)
+        return scenario_data
+
+    async def update_scenario(self, scenario_id: str, update_data: dict) -> Optional[dict]:
+        existing = await self.get_scenario(scenario_id)
+        if not existing:
+            return None
+        scenario_data = {**existing, **update_data, "id": scenario_id}
+        scenario_data["updated_at"] = datetime.utcnow().isoformat()
+        await self._save_scenario(scenario_data)
+        return scenario_data
+
+    async def rebuild_catalog(self) -> int:
+        """
+        Reconstruit le catalogue Neo4j à partir des scénarios stockés dans MinIO.
+
+        Returns:
+            int: Le nombre de scénarios indexés
+        """
+        count = 0
+        objects = await run_in_threadpool(
+            lambda: list(self.storage.list_objects(self.bucket, prefix="scenarios/"))
+        )
+        for obj in objects:
+            if not obj.object_name.endswith(".json"):
+                continue
+            scenario, _ = await run_in_threadpool(self._read_scenario_object, obj.object_name)
+            await async_db.upsert_scenario_summary(self._catalog_entry(scenario))
+            count += 1
+        return count
+
+    def _read_scenario_object(self, scenario_key: str, etag: Optional[str] = None) -> tuple:
+        """
+        Lit un scénario dans MinIO (appel bloquant, à exécuter dans le pool de
+        threads) et retourne (scénario, ETag).
+        """
+        response = self.storage.get_object(self.bucket, scenario_key)
+        try:
+            scenario = json.loads(response.read().decode('utf-8'))
+            etag = (response.headers.get("ETag") or etag or "").strip('"')
+        finally:
+            response.close()
+            response.release_conn()
+        return scenario, etag
+
+    async def _save_scenario(self, scenario_data: dict) -> None:
+        scenario_key = f"scenarios/{scenario_data['id']}.json"
+        scenario_json = json.dumps(scenario_data).encode('utf-8')
         
-        self.storage.put_object(
+        await run_in_threadpool(
+            self.storage.put_object,
             self.bucket,
             scenario_key,
-            data,
+            io.BytesIO(scenario_json),
             len(scenario_json)
         )
         
-        return scenario_data 
\ No newline at end of file
+        scenario_cache.invalidate(scenario_data["id"])
+        
+        # Mettre à jour le catalogue utilisé pour les listes
+        await async_db.upsert_scenario_summary(self._catalog_entry(scenario_data))
+
+    @staticmethod
+    def _catalog_entry(scenario: dict) -> Dict[str, Any]:
+        return {
+            "id": scenario["id"],
+            "name": scenario.get("name"),
+            "description": scenario.get("description"),
+            "tags": scenario.get("tags") or [],
+            "status": scenario.get("status"),
+            "created_by": scenario.get("created_by"),
+            "created_at": scenario.get("created_at"),
+            "updated_at": scenario.get("updated_at"),
+            "steps_count": len(scenario.get("steps") or [])
+        }
@@ -0,0 +1,146 @@
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+from src.core.metrics import registry
+from src.core.tracing import span
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+step_duration = registry.histogram(
+    "scenario_step_duration_seconds",
+    "Durée d'exécution des étapes de scénario",
+    ["step_type", "status"]
+)
+
+StepExecutor = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+def step_key(step: Dict[str, Any], index: int) -> Any:
+    """
+    Identifiant d'une étape pour depends_on : son champ order, ou sa position (à partir de 1).
+    """
+    order = step.get("order")
+    return order if order is not None else index + 1
+
+def build_dependencies(steps: List[Dict[str, Any]]) -> List[Set[int]]:
+    """
+    Calcule, pour chaque étape, les positions des étapes dont elle dépend.
+
+    Si aucune étape ne déclare depends_on, les étapes s'enchaînent dans
+    l'ordre de la liste, comme avant l'introduction des dépendances.
+
+    Raises:
+        ValueError: Si une dépendance est inconnue, si deux étapes ont le même
+            identifiant ou si les dépendances forment un cycle
+    """
+    if not any(step.get("depends_on") is not None for step in steps):
+        return [{index - 1} if index else set() for index in range(len(steps))]
+
+    positions: Dict[Any, int] = {}
+    for index, step in enumerate(steps):
+        key = step_key(step, index)
+        if key in positions:
+            raise ValueError(f"Plusieurs étapes ont l'ordre {key}")
+        positions[key] = index
+
+    dependencies = []
+    for index, step in enumerate(steps):
+        required = set()
+        for key in step.get("depends_on") or []:
+            if key not in positions:
+                raise ValueError(f"L'étape {step_key(step, index)} dépend d'une étape inconnue: {key}")
+            required.add(positions[key])
+        dependencies.append(required)
+
+    # Détection de cycle (tri topologique de Kahn)
+    remaining = {index: set(required) for index, required in enumerate(dependencies)}
+    while remaining:
+        ready = [index for index, required in remaining.items() if not required]
+        if not ready:
+            keys = sorted(str(step_key(steps[index], index)) for index in remaining)
+            raise ValueError(f"Dépendances circulaires entre les étapes: {', '.join(keys)}")
+        for index in ready:
+            del remaining[index]
+        for required in remaining.values():
+            required.difference_update(ready)
+
+    return dependencies
+
+async def run_steps(
+    steps: List[Dict[str, Any]],
+    execute: StepExecutor,
+    max_concurrency: int,
+    fail_fast: bool = True
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Exécute les étapes en parallèle dès que leurs dépendances sont terminées.
+
+    Args:
+        steps: Les étapes du scénario
+        execute: La coroutine qui exécute une étape et retourne son résultat
+        max_concurrency: Nombre maximal d'étapes exécutées simultanément
+        fail_fast: Arrêter l'exécution (et annuler les étapes en cours) dès
+            qu'une étape retourne le statut "error" ; sinon une étape en échec
+            débloque les étapes qui en dépendent, comme une étape terminée
+
+    Returns:
+        Tuple: (un résultat par étape, dans l'ordre des étapes, les étapes non
+            exécutées ayant le statut "skipped" ; True si une étape a échoué)
+    """
+    dependencies = build_dependencies(steps)
+    results: List[Any] = [None] * len(steps)
+    pending = set(range(len(steps)))
+    completed: Set[int] = set()
+    running: Dict[asyncio.Task, int] = {}
+    failed = False
+
+    async def run_one(step: Dict[str, Any]) -> Dict[str, Any]:
+        step_type = str(step.get("type"))
+        start = time.perf_counter()
+        with span("scenario.step", step_type=step_type, order=step.get("order")):
+            try:
+                result = await execute(step)
+            except Exception as e:
+                logger.error(f"Erreur lors de l'exécution de l'étape: {str(e)}")
+                result = {"type": step.get("type"), "status": "error", "error": str(e)}
+        # Un résultat sans statut mais avec une erreur compte comme un échec
+        status = result.setdefault("status", "error" if "error" in result else "success")
+        step_duration.observe(time.perf_counter() - start, step_type=step_type, status=status)
+        return result
+
+    try:
+        while pending or running:
+            if not (failed and fail_fast):
+                # Démarrer les étapes prêtes, dans l'ordre de la liste
+                for index in sorted(pending):
+                    if len(running) >= max_concurrency:
+                        break
+                    if dependencies[index] <= completed:
+                        pending.discard(index)
+                        running[asyncio.ensure_future(run_one(steps[index]))] = index
+            if not running:
+                # Étapes restantes bloquées par une étape en échec
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda t: running[t]):
+                index = running.pop(task)
+                results[index] = task.result()
+                if results[index].get("status") == "error":
+                    failed = True
+                    if fail_fast:
+                        continue
+                completed.add(index)
+
+            if failed and fail_fast:
+                break
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    return [
+        result if result is not None else {"type": steps[index].get("type"), "status": "skipped"}
+        for index, result in enumerate(results)
+    ], failed
@@ -1,19 +1,103 @@
-from typing import Dict, Any
-from jinja2 import Template, Environment, FileSystemLoader
+from collections import deque
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Deque, Dict, Iterator, Optional
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from starlette.concurrency import run_in_threadpool
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.storage.minio import async_storage
+import asyncio
+import csv
+import hashlib
+import io
+import json
 import os
+import shutil
+import tempfile
+import threading
+import uuid
+import zipfile
+
+# Environnements partagés par tout le processus, un par répertoire de templates
+_environments: Dict[str, Environment] = {}
+_environments_lock = threading.Lock()
+
+# Environnement des templates fournis sous forme de chaîne : mêmes options
+# que jinja2.Template (pas d'échappement automatique)
+_string_environment = Environment()
+
+# Templates compilés depuis une chaîne, indexés par le SHA-256 de leur source
+template_cache = TTLCache(settings.TEMPLATE_CACHE_MAX_ENTRIES)
+
+def get_environment(template_dir: str = settings.TEMPLATE_DIR) -> Environment:
+    """
+    Retourne l'environnement Jinja2 partagé pour un répertoire de templates.
+
+    Les templates compilés sont conservés par l'environnement et leur bytecode
+    est écrit sur disque, ce qui évite de les recompiler après un redémarrage.
+    """
+    environment = _environments.get(template_dir)
+    if environment is not None:
+        return environment
+    with _environments_lock:
+        environment = _environments.get(template_dir)
+        if environment is None:
+            os.makedirs(settings.TEMPLATE_BYTECODE_CACHE_DIR, exist_ok=True)
+            environment = Environment(
+                loader=FileSystemLoader(template_dir),
+                autoescape=True,
+                cache_size=settings.TEMPLATE_CACHE_MAX_ENTRIES,
+                bytecode_cache=FileSystemBytecodeCache(settings.TEMPLATE_BYTECODE_CACHE_DIR)
+            )
+            _environments[template_dir] = environment
+    return environment
+
+def compile_string(template_string: str) -> Template:
+    """
+    Compile une chaîne de caractères en template, en réutilisant la version
+    déjà compilée d'une source identique.
+    """
+    key = hashlib.sha256(template_string.encode("utf-8")).hexdigest()
+    template: Optional[Template] = template_cache.get(key)
+    if template is None:
+        template = _string_environment.from_string(template_string)
+        template_cache.set(key, template)
+    return template
+
+def read_contexts(file_data: BinaryIO, input_format: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lit des contextes de rendu ligne par ligne depuis un fichier NDJSON
+    (un objet JSON par ligne) ou CSV (une ligne d'en-tête). Fonction bloquante,
+    à itérer depuis le pool de threads.
+
+    Raises:
+        ValueError: Si le format est inconnu ou si une ligne est invalide
+    """
+    text = io.TextIOWrapper(file_data, encoding="utf-8", newline="")
+    if input_format == "csv":
+        yield from csv.DictReader(text)
+    elif input_format == "ndjson":
+        for line_number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                context = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Ligne {line_number} invalide: {str(e)}")
+            if not isinstance(context, dict):
+                raise ValueError(f"Ligne {line_number} invalide: un objet JSON est attendu")
+            yield context
+    else:
+        raise ValueError(f"Format d'entrée non supporté: {input_format}")
 
 class TemplateProcessor:
-    def __init__(self, template_dir: str = "templates"):
+    def __init__(self, template_dir: str = settings.TEMPLATE_DIR):
         """
         Initialise le processeur de templates.
         
         Args:
             template_dir: Le répertoire contenant les templates
         """
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=True
-        )
+        self.env = get_environment(template_dir)
         
     def process_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """
@@ -40,5 +124,91 @@ class TemplateProcessor:
         Returns:
             str: Le contenu traité du template
         """
-        template = Template(template_string)
-        return template.render(**context) 
\ No newline at end of file
+        template = compile_string(template_string)
+        return template.render(**context)
+
+    async def render_batch(
+        self,
+        template_name: str,
+        contexts: AsyncIterable[Dict[str, Any]],
+        window: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Rend un template pour chaque contexte, dans le pool de threads.
+
+        Au plus window rendus sont en cours ou en attente d'être consommés :
+        la mémoire utilisée dépend de la fenêtre, pas de la taille du lot.
+        Les résultats sont produits dans l'ordre des contextes.
+
+        Yields:
+            Dict: {"index", "status": "success", "output"} ou
+                {"index", "status": "error", "error"}
+        """
+        template = self.env.get_template(template_name)
+        window = window or settings.TEMPLATE_BATCH_WINDOW
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            index = 0
+            async for context in contexts:
+                pending.append(asyncio.ensure_future(
+                    run_in_threadpool(self._render_row, template, index, context)
+                ))
+                index += 1
+                if len(pending) >= window:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _render_row(template: Template, index: int, context: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return {"index": index, "status": "success", "output": template.render(**context)}
+        except Exception as e:
+            return {"index": index, "status": "error", "error": str(e)}
+
+    @staticmethod
+    def _copy_to_archive(archive: zipfile.ZipFile, name: str, file_data: BinaryIO) -> None:
+        with archive.open(name, "w") as entry:
+            shutil.copyfileobj(file_data, entry)
+
+    async def render_batch_archive(
+        self,
+        template_name: str,
+        contexts: AsyncIterable[Dict[str, Any]],
+        window: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Rend un lot de documents dans une archive zip enregistrée dans MinIO.
+
+        L'archive est construite dans un fichier temporaire ; les erreurs de
+        rendu sont listées dans errors.ndjson.
+
+        Returns:
+            Dict: La clé MinIO de l'archive et le nombre de documents rendus ou en erreur
+        """
+        extension = os.path.splitext(template_name)[1] or ".txt"
+        rendered = 0
+        errors = 0
+        with tempfile.TemporaryFile() as archive_file:
+            with zipfile.ZipFile(archive_file, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                with tempfile.TemporaryFile() as error_log:
+                    async for row in self.render_batch(template_name, contexts, window):
+                        if row["status"] == "success":
+                            await run_in_threadpool(
+                                archive.writestr, f"{row['index'] + 1:06d}{extension}", row["output"]
+                            )
+                            rendered += 1
+                        else:
+                            error_log.write((json.dumps(row) + "\n").encode("utf-8"))
+                            errors += 1
+                    if errors:
+                        error_log.seek(0)
+                        await run_in_threadpool(self._copy_to_archive, archive, "errors.ndjson", error_log)
+            length = archive_file.tell()
+            archive_file.seek(0)
+            object_name = f"renders/{uuid.uuid4()}.zip"
+            await async_storage.put_file(object_name, archive_file, length, "application/zip")
+        return {"object_name": object_name, "rendered": rendered, "errors": errors}
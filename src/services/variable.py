@@ -1,84 +1,71 @@
-from typing import List, Optional
-from src.db.session import get_db
-from src.models.variable import VariableCreate, VariableUpdate
+from typing import Any, AsyncIterator, Dict, List, Optional
+from pydantic import ValidationError
+from src.core.pagination import decode_cursor
+from src.db.neo4j_async import async_db
+from src.models.variable import VariableBulkItem, VariableCreate, VariableUpdate
+from src.services.bulk import write_in_batches
 from src.core.config import settings
+import uuid
 
 class VariableService:
     @staticmethod
     async def create_variable(variable: VariableCreate) -> dict:
-        with get_db() as session:
-            result = session.run(
-                """
-                CREATE (v:Variable {
-                    name: $name,
-                    value: $value,
-                    description: $description,
-                    created_at: datetime(),
-                    updated_at: datetime()
-                })
-                RETURN v
-                """,
-                name=variable.name,
-                value=variable.value,
-                description=variable.description
-            )
-            return dict(result.single()["v"])
+        return await async_db.create_named_variable({
+            "id": str(uuid.uuid4()),
+            "name": variable.name,
+            "value": variable.value,
+            "description": variable.description
+        })
 
     @staticmethod
-    async def list_variables() -> List[dict]:
-        with get_db() as session:
-            result = session.run(
-                """
-                MATCH (v:Variable)
-                RETURN v
-                ORDER BY v.created_at DESC
-                """
-            )
-            return [dict(record["v"]) for record in result]
+    async def create_variables_bulk(
+        variables: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Crée des variables en masse, par lots écrits avec une seule requête UNWIND.
+        Les lignes invalides ou rattachées à un document inexistant sont signalées
+        individuellement.
+        """
+        rows = []
+        invalid = []
+        for index, variable in enumerate(variables):
+            try:
+                item = VariableBulkItem.model_validate(variable)
+            except ValidationError as e:
+                invalid.append({"index": index, "error": str(e)})
+                continue
+            rows.append((index, {"id": str(uuid.uuid4()), **item.model_dump()}))
+
+        result = await write_in_batches(
+            rows,
+            async_db.create_variables_bulk,
+            batch_size or settings.NEO4J_BULK_BATCH_SIZE,
+            "Document non trouvé"
+        )
+        result["errors"] = sorted(invalid + result["errors"], key=lambda error: error["index"])
+        return result
+
+    @staticmethod
+    def list_variables(
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> AsyncIterator[dict]:
+        after_created_at, after_id = decode_cursor(cursor)
+        return async_db.iter_variables(limit, after_created_at, after_id, fields)
 
     @staticmethod
     async def get_variable(variable_id: str) -> Optional[dict]:
-        with get_db() as session:
-            result = session.run(
-                """
-                MATCH (v:Variable)
-                WHERE v.name = $variable_id
-                RETURN v
-                """,
-                variable_id=variable_id
-            )
-            record = result.single()
-            return dict(record["v"]) if record else None
+        return await async_db.get_variable_by_name(variable_id)
 
     @staticmethod
     async def update_variable(variable_id: str, variable: VariableUpdate) -> Optional[dict]:
-        with get_db() as session:
-            result = session.run(
-                """
-                MATCH (v:Variable)
-                WHERE v.name = $variable_id
-                SET v.value = $value,
-                    v.description = $description,
-                    v.updated_at = datetime()
-                RETURN v
-                """,
-                variable_id=variable_id,
-                value=variable.value,
-                description=variable.description
-            )
-            record = result.single()
-            return dict(record["v"]) if record else None
+        return await async_db.update_variable_by_name(variable_id, {
+            "value": variable.value,
+            "description": variable.description
+        })
 
     @staticmethod
     async def delete_variable(variable_id: str) -> bool:
-        with get_db() as session:
-            result = session.run(
-                """
-                MATCH (v:Variable)
-                WHERE v.name = $variable_id
-                DELETE v
-                RETURN count(v) as deleted
-                """,
-                variable_id=variable_id
-            )
-            return result.single()["deleted"] > 0 
\ No newline at end of file
+        return await async_db.delete_variable_by_name(variable_id)
@@ -0,0 +1,65 @@
+from typing import Any, Dict, List, Set
+from src.db.neo4j_async import async_db
+import copy
+import re
+
+# Référence à une variable : {{ nom }}
+PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*\}\}")
+
+class VariableResolver:
+    """
+    Résout les variables d'un scénario pour une exécution.
+
+    Toutes les variables du scénario (variable_ids et noms référencés par
+    {{ nom }} dans les étapes) sont lues en une seule requête Neo4j, puis
+    conservées pour toute la durée de l'exécution.
+    """
+    def __init__(self):
+        self.values: Dict[str, Any] = {}
+
+    async def load(self, scenario: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Charge les variables du scénario et retourne leurs valeurs par nom.
+        """
+        ids = list(scenario.get("variable_ids") or [])
+        names = sorted(self.referenced_names(scenario.get("steps", [])))
+        if ids or names:
+            rows = await async_db.get_variables_by_ids_or_names(ids, names)
+            self.values = {row["name"]: row["value"] for row in rows if row.get("name")}
+        return self.values
+
+    @staticmethod
+    def referenced_names(value: Any) -> Set[str]:
+        if isinstance(value, str):
+            return set(PLACEHOLDER.findall(value))
+        if isinstance(value, dict):
+            return set().union(*(VariableResolver.referenced_names(item) for item in value.values()))
+        if isinstance(value, list):
+            return set().union(*(VariableResolver.referenced_names(item) for item in value))
+        return set()
+
+    def substitute(self, value: Any) -> Any:
+        """
+        Remplace les références {{ nom }} aux variables connues ; les autres
+        expressions (variables de contexte des templates) sont laissées telles quelles.
+        """
+        if isinstance(value, str):
+            if "{{" not in value:
+                return value
+            return PLACEHOLDER.sub(
+                lambda match: str(self.values[match.group(1)]) if match.group(1) in self.values else match.group(0),
+                value
+            )
+        if isinstance(value, dict):
+            return {key: self.substitute(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.substitute(item) for item in value]
+        return value
+
+    def resolve_steps(self, steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Retourne une copie des étapes où les références aux variables sont remplacées.
+        """
+        if not self.values:
+            return copy.deepcopy(steps)
+        return [self.substitute(step) for step in steps]
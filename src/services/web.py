@@ -1,23 +1,38 @@
 from typing import Dict, Any, Optional
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import BrowserContext, Page
+from src.services.browser_pool import BrowserPool, browser_pool
 import logging
 
 logger = logging.getLogger(__name__)
 
 class WebAutomation:
-    def __init__(self):
-        self.browser: Optional[Browser] = None
+    def __init__(self, pool: BrowserPool = browser_pool, context: Optional[BrowserContext] = None):
+        """
+        Args:
+            pool: Le pool où emprunter un contexte isolé
+            context: Un contexte déjà emprunté par l'appelant (partagé par les
+                étapes d'une exécution) ; il n'est pas fermé par close()
+        """
+        self.pool = pool
+        self.context: Optional[BrowserContext] = context
         self.page: Optional[Page] = None
+        self._owns_context = context is None
+        self._context_manager = None
 
     async def __aenter__(self):
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=True)
-        self.page = await self.browser.new_page()
+        if self._owns_context:
+            # Contexte isolé emprunté au pool de navigateurs déjà lancés
+            self._context_manager = self.pool.context()
+            self.context = await self._context_manager.__aenter__()
+        try:
+            self.page = await self.context.new_page()
+        except BaseException:
+            await self.close()
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.browser:
-            await self.browser.close()
+        await self.close()
 
     async def navigate(self, url: str) -> None:
         """
@@ -85,9 +100,16 @@ class WebAutomation:
 
     async def close(self) -> None:
         """
-        Ferme le navigateur.
-        """
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
-            self.page = None 
\ No newline at end of file
+        Ferme la page et, s'il a été emprunté par cette instance, rend le
+        contexte au pool de navigateurs.
+        """
+        page = self.page
+        self.page = None
+        if page is not None and not self._owns_context:
+            await page.close()
+        if self._context_manager:
+            context_manager = self._context_manager
+            self._context_manager = None
+            self.context = None
+            self.page = None
+            await context_manager.__aexit__(None, None, None) 
\ No newline at end of file
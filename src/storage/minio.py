@@ -1,9 +1,22 @@
 from minio import Minio
 from minio.error import S3Error
-from typing import Optional, BinaryIO
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool, iterate_in_threadpool
+from typing import AsyncIterator, Optional, BinaryIO, Tuple
+import io
+import os
 import uuid
 from ..core.config import settings
+from ..core.metrics import instrument_methods, registry
 
+minio_call_duration = registry.histogram(
+    "minio_call_duration_seconds",
+    "Durée des appels à MinIO, par méthode",
+    ["operation"]
+)
+
+@instrument_methods(minio_call_duration)
 class MinIOStorage:
     def __init__(self):
         self.client = Minio(
@@ -68,5 +81,181 @@ class MinIOStorage:
             print(f"Error generating URL: {e}")
             return None
 
+def parse_range_header(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Convertit un en-tête HTTP Range en intervalle (début, fin) inclusif.
+
+    Seules les requêtes portant sur un intervalle unique sont prises en charge ;
+    les autres formes sont ignorées et le fichier complet est renvoyé.
+    """
+    if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+        return None
+    start_str, _, end_str = range_header[len("bytes="):].strip().partition("-")
+    try:
+        if start_str:
+            start = int(start_str)
+            end = int(end_str) if end_str else size - 1
+        else:
+            # Suffixe : les N derniers octets
+            start = max(size - int(end_str), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    end = min(end, size - 1)
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
+
+@instrument_methods(minio_call_duration)
+class AsyncMinIOStorage:
+    """
+    Interface asynchrone au-dessus de MinIOStorage.
+
+    Le client minio est bloquant : chaque appel est déporté dans le pool de
+    threads de Starlette, et les transferts se font par morceaux pour garder
+    une mémoire constante quelle que soit la taille des fichiers.
+    """
+    def __init__(self, sync_storage: MinIOStorage):
+        self.storage = sync_storage
+        self.client = sync_storage.client
+        self.bucket = sync_storage.bucket
+        self.chunk_size = settings.MINIO_CHUNK_SIZE
+
+    async def upload_file(self, file: UploadFile, object_name: Optional[str] = None) -> str:
+        """Upload an UploadFile to MinIO by streaming it with a known length"""
+        object_name = object_name or f"{uuid.uuid4()}_{file.filename}"
+        length = await self.get_upload_size(file)
+        await run_in_threadpool(
+            self.client.put_object,
+            self.bucket,
+            object_name,
+            file.file,
+            length=length,
+            content_type=file.content_type or "application/octet-stream",
+            part_size=settings.MINIO_PART_SIZE
+        )
+        return object_name
+
+    @staticmethod
+    async def get_upload_size(file: UploadFile) -> int:
+        """Return the size of an upload without reading it into memory"""
+        if file.size is not None:
+            return file.size
+        size = await run_in_threadpool(file.file.seek, 0, os.SEEK_END)
+        await file.seek(0)
+        return size
+
+    async def put_bytes(
+        self,
+        object_name: str,
+        data: bytes,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        """Store an in-memory payload under a fixed object name"""
+        await run_in_threadpool(
+            self.client.put_object,
+            self.bucket,
+            object_name,
+            io.BytesIO(data),
+            length=len(data),
+            content_type=content_type
+        )
+        return object_name
+
+    async def put_file(
+        self,
+        object_name: str,
+        file_data: BinaryIO,
+        length: int,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        """Stream a local file object to MinIO under a fixed object name"""
+        await run_in_threadpool(
+            self.client.put_object,
+            self.bucket,
+            object_name,
+            file_data,
+            length=length,
+            content_type=content_type,
+            part_size=settings.MINIO_PART_SIZE
+        )
+        return object_name
+
+    async def get_bytes(self, object_name: str) -> Optional[bytes]:
+        """Read a whole object, or return None if it does not exist"""
+        try:
+            return b"".join([chunk async for chunk in self.iter_file(object_name)])
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            raise
+
+    async def stat_file(self, object_name: str):
+        return await run_in_threadpool(self.client.stat_object, self.bucket, object_name)
+
+    async def delete_file(self, object_name: str) -> bool:
+        return await run_in_threadpool(self.storage.delete_file, object_name)
+
+    async def iter_file(self, object_name: str, offset: int = 0, length: int = 0) -> AsyncIterator[bytes]:
+        """Stream an object (or a byte range of it) in chunks"""
+        response = await run_in_threadpool(
+            self.client.get_object,
+            self.bucket,
+            object_name,
+            offset=offset,
+            length=length
+        )
+        try:
+            async for chunk in iterate_in_threadpool(response.stream(self.chunk_size)):
+                yield chunk
+        finally:
+            response.close()
+            response.release_conn()
+
+    async def download_response(
+        self,
+        object_name: str,
+        range_header: Optional[str] = None,
+        filename: Optional[str] = None
+    ) -> StreamingResponse:
+        """Build a StreamingResponse for an object, honouring HTTP Range requests"""
+        try:
+            stat = await self.stat_file(object_name)
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                raise HTTPException(status_code=404, detail="File not found")
+            raise
+        size = stat.size
+        headers = {"Accept-Ranges": "bytes"}
+        if stat.etag:
+            headers["ETag"] = f'"{stat.etag}"'
+        if filename:
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+        byte_range = parse_range_header(range_header, size)
+        if byte_range is None:
+            headers["Content-Length"] = str(size)
+            return StreamingResponse(
+                self.iter_file(object_name),
+                media_type=stat.content_type,
+                headers=headers
+            )
+
+        start, end = byte_range
+        length = end - start + 1
+        headers["Content-Length"] = str(length)
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        return StreamingResponse(
+            self.iter_file(object_name, offset=start, length=length),
+            status_code=206,
+            media_type=stat.content_type,
+            headers=headers
+        )
+
 # Create a global storage instance
-storage = MinIOStorage() 
\ No newline at end of file
+storage = MinIOStorage()
+async_storage = AsyncMinIOStorage(storage) 
\ No newline at end of file
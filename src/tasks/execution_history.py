@@ -0,0 +1,157 @@
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from src.core.config import settings
+from src.db.neo4j_async import async_db
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ExecutionRecorder:
+    """
+    Enregistre l'historique des exécutions dans Neo4j en écriture différée.
+
+    record() se contente d'ajouter l'exécution à un tampon en mémoire ; une
+    tâche de fond l'écrit par lots UNWIND, toutes les flush_interval secondes
+    ou dès que batch_size exécutions sont en attente. L'enregistrement
+    n'ajoute donc rien à la durée d'une exécution.
+    """
+    def __init__(self, batch_size: int, flush_interval: float, max_buffered: int, max_result_chars: int):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.max_result_chars = max_result_chars
+        self._buffer: List[Dict[str, Any]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+        self.recorded = 0
+        self.dropped = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._running = True
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            # Réveiller la tâche plutôt que l'annuler : une écriture en cours se termine
+            self._running = False
+            self._get_wakeup().set()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        # Écrire ce qui reste avant l'arrêt
+        await self.flush()
+
+    def record(self, execution: Dict[str, Any]) -> None:
+        """
+        Ajoute une exécution terminée au tampon, sans attendre son écriture.
+        """
+        if len(self._buffer) >= self.max_buffered:
+            self.dropped += 1
+            logger.error(f"Tampon d'historique plein, exécution {execution.get('execution_id')} non enregistrée")
+            return
+        self._buffer.append(self._to_row(execution))
+        if len(self._buffer) >= self.batch_size:
+            self._get_wakeup().set()
+
+    async def flush(self) -> None:
+        while self._buffer:
+            batch = self._buffer[:self.batch_size]
+            del self._buffer[:self.batch_size]
+            try:
+                self.recorded += await async_db.record_executions(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                logger.error(f"Erreur lors de l'enregistrement de {len(batch)} exécutions: {str(e)}")
+
+    async def _flush_loop(self) -> None:
+        wakeup = self._get_wakeup()
+        while self._running:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            await self.flush()
+
+    def _get_wakeup(self) -> asyncio.Event:
+        # Créé à la première utilisation pour être lié à la boucle en cours
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        return self._wakeup
+
+    def _to_row(self, execution: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "execution_id": execution["execution_id"],
+            "scenario_id": execution["scenario_id"],
+            "status": execution["status"],
+            "started_at": self._timestamp(execution.get("started_at")),
+            "completed_at": self._timestamp(execution.get("completed_at")),
+            "error": execution.get("error"),
+            "steps": [
+                {
+                    "index": index,
+                    "type": step.get("type"),
+                    "status": step.get("status"),
+                    "result": self._serialize(step.get("result")),
+                    "error": (step.get("error") or step.get("message")) if step.get("status") == "error" else None
+                }
+                for index, step in enumerate(execution.get("results") or [])
+            ]
+        }
+
+    def _serialize(self, value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        serialized = json.dumps(value, default=str)
+        return serialized[:self.max_result_chars]
+
+    @staticmethod
+    def _timestamp(value: Any) -> Optional[str]:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "buffered": len(self._buffer),
+            "recorded": self.recorded,
+            "dropped": self.dropped,
+            "failed": self.failed
+        }
+
+def execution_from_history(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convertit une exécution lue dans Neo4j au format ExecutionResult.
+    """
+    results = []
+    for step in record.get("steps", []):
+        result = {"type": step.get("type"), "status": step.get("status")}
+        if step.get("result") is not None:
+            try:
+                result["result"] = json.loads(step["result"])
+            except ValueError:
+                # Résultat tronqué à l'enregistrement
+                result["result"] = step["result"]
+        if step.get("error"):
+            result["error"] = step["error"]
+        results.append(result)
+    return {
+        "execution_id": record["id"],
+        "scenario_id": record.get("scenario_id"),
+        "status": record.get("status"),
+        "results": results,
+        "started_at": record.get("started_at"),
+        "completed_at": record.get("completed_at"),
+        "error": record.get("error")
+    }
+
+execution_recorder = ExecutionRecorder(
+    settings.EXECUTION_HISTORY_BATCH_SIZE,
+    settings.EXECUTION_HISTORY_FLUSH_INTERVAL,
+    settings.EXECUTION_HISTORY_MAX_BUFFERED,
+    settings.EXECUTION_HISTORY_MAX_RESULT_CHARS
+)
@@ -0,0 +1,120 @@
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.tasks.scenarios import ScenarioRunner
+from src.tasks.execution_history import execution_recorder
+import asyncio
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+class QueueFullError(Exception):
+    pass
+
+class ExecutionQueue:
+    """
+    File d'exécution des scénarios en arrière-plan.
+
+    Les exécutions sont mises en file et traitées par un nombre limité de
+    workers asyncio ; leur état, au format ExecutionResult, est conservé en
+    mémoire pour être consulté via GET /executions/{execution_id}.
+    """
+    def __init__(self, concurrency: int, max_queued: int, max_results: int, result_ttl: float):
+        self.concurrency = concurrency
+        self.max_queued = max_queued
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._results = TTLCache(max_results, result_ttl)
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._workers = [
+            asyncio.create_task(self._worker(index))
+            for index in range(self.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def enqueue(
+        self,
+        scenario_id: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        scenario: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Met une exécution en file et retourne immédiatement son état initial.
+
+        Le scénario déjà chargé par l'appelant est transmis au worker, qui ne
+        le relit pas.
+
+        Raises:
+            QueueFullError: Si la file a atteint sa taille maximale
+        """
+        if self._queue is None:
+            await self.start()
+        execution = {
+            "execution_id": str(uuid.uuid4()),
+            "scenario_id": scenario_id,
+            "status": "queued",
+            "results": [],
+            "started_at": datetime.utcnow(),
+            "completed_at": None,
+            "error": None
+        }
+        try:
+            self._queue.put_nowait((execution["execution_id"], parameters or {}, scenario))
+        except asyncio.QueueFull:
+            raise QueueFullError("La file d'exécution est pleine")
+        self._results.set(execution["execution_id"], execution)
+        return dict(execution)
+
+    def get(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        execution = self._results.get(execution_id)
+        return dict(execution) if execution else None
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            execution_id, parameters, scenario = await self._queue.get()
+            try:
+                await self._run(execution_id, parameters, scenario)
+            except Exception as e:
+                logger.error(f"Erreur du worker d'exécution {index}: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(
+        self,
+        execution_id: str,
+        parameters: Dict[str, Any],
+        scenario: Optional[Dict[str, Any]] = None
+    ) -> None:
+        execution = self._results.get(execution_id)
+        if execution is None:
+            return
+        execution["status"] = "in_progress"
+        execution["started_at"] = datetime.utcnow()
+
+        result = await ScenarioRunner().run(execution["scenario_id"], parameters, scenario)
+
+        execution["results"] = result.get("steps", [])
+        execution["status"] = result["status"]
+        if result["status"] == "failed":
+            failed_steps = [step for step in execution["results"] if step.get("status") == "error"]
+            execution["error"] = result.get("error") or (failed_steps[0].get("error") if failed_steps else None)
+        execution["completed_at"] = datetime.utcnow()
+        execution_recorder.record(execution)
+
+execution_queue = ExecutionQueue(
+    settings.EXECUTION_CONCURRENCY,
+    settings.EXECUTION_MAX_QUEUED,
+    settings.EXECUTION_MAX_RESULTS,
+    settings.EXECUTION_RESULT_TTL
+)
@@ -1,32 +1,71 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from contextlib import AsyncExitStack
+from playwright.async_api import BrowserContext
 from src.services.scenario import ScenarioService
-from src.services.pdf import PDFService
+from src.services.pdf import PDFService, parse_page_range
 from src.services.template import TemplateProcessor
+from src.services.render import render_service
+from src.services.web import WebAutomation
+from src.services.browser_pool import browser_pool
+from src.services.step_scheduler import run_steps
+from src.services.variable_resolver import VariableResolver
 from src.core.config import settings
+from src.core.metrics import registry
+from src.core.tracing import span
 import asyncio
 import logging
+import re
+import time
 
 logger = logging.getLogger(__name__)
 
+execution_duration = registry.histogram(
+    "scenario_execution_duration_seconds",
+    "Durée totale des exécutions de scénario",
+    ["status"]
+)
+
 class ScenarioRunner:
     def __init__(self):
         self.scenario_service = ScenarioService()
         self.pdf_service = PDFService()
         self.template_processor = TemplateProcessor()
 
-    async def run(self, scenario_id: str) -> Dict[str, Any]:
+    async def run(
+        self,
+        scenario_id: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        scenario: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Exécute un scénario spécifique.
         
         Args:
             scenario_id: L'ID du scénario à exécuter
+            parameters: Paramètres d'exécution, ajoutés au contexte des templates
+                (prioritaires sur les variables du scénario)
+            scenario: Le scénario déjà chargé par l'appelant (évite une
+                seconde lecture)
             
         Returns:
             Dict[str, Any]: Les résultats de l'exécution du scénario
         """
+        start = time.perf_counter()
+        with span("scenario.execution", scenario_id=scenario_id):
+            results = await self._run(scenario_id, parameters, scenario)
+        execution_duration.observe(time.perf_counter() - start, status=results["status"])
+        return results
+
+    async def _run(
+        self,
+        scenario_id: str,
+        parameters: Optional[Dict[str, Any]],
+        scenario: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         try:
-            # Récupérer le scénario
-            scenario = await self.scenario_service.get_scenario(scenario_id)
+            # Récupérer le scénario, sauf s'il a déjà été chargé par l'appelant
+            if scenario is None:
+                scenario = await self.scenario_service.get_scenario(scenario_id)
             if not scenario:
                 raise ValueError(f"Scénario {scenario_id} non trouvé")
 
@@ -37,19 +76,30 @@ class ScenarioRunner:
                 "steps": []
             }
 
-            # Exécuter chaque étape du scénario
-            for step in scenario["steps"]:
-                step_result = await self._execute_step(step)
-                results["steps"].append(step_result)
-
-                # Si une étape échoue, arrêter l'exécution
-                if step_result["status"] == "error":
-                    results["status"] = "failed"
-                    break
+            # Résoudre les variables du scénario en une requête : elles sont
+            # substituées dans les étapes et ajoutées au contexte des templates
+            resolver = VariableResolver()
+            variables = await resolver.load(scenario)
+            steps = resolver.resolve_steps(scenario["steps"])
+            context = {**variables, **(parameters or {})}
 
-            # Si toutes les étapes sont réussies
-            if results["status"] != "failed":
-                results["status"] = "completed"
+            # Exécuter les étapes, en parallèle lorsque leurs dépendances
+            # (depends_on) le permettent ; la première erreur arrête l'exécution
+            max_parallel = scenario.get("max_parallel_steps") or settings.SCENARIO_MAX_PARALLEL_STEPS
+            async with AsyncExitStack() as stack:
+                # Un seul contexte de navigateur pour toute l'exécution : les
+                # étapes web partagent cookies et session, il est rendu au pool
+                # à la fin de l'exécution
+                browser_context = None
+                if any(step.get("type") == "web" for step in steps):
+                    browser_context = await stack.enter_async_context(browser_pool.context())
+                results["steps"], failed = await run_steps(
+                    steps,
+                    lambda step: self._execute_step(step, context, browser_context),
+                    max_parallel
+                )
+            # Mêmes statuts que ExecutionResult et l'historique des exécutions
+            results["status"] = "failed" if failed else "success"
 
             return results
 
@@ -57,30 +107,64 @@ class ScenarioRunner:
             logger.error(f"Erreur lors de l'exécution du scénario {scenario_id}: {str(e)}")
             return {
                 "scenario_id": scenario_id,
-                "status": "error",
+                "status": "failed",
                 "error": str(e)
             }
 
-    async def _execute_step(self, step: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _step_details(step: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Paramètres d'une étape : son champ details (modèle Step de l'API) ou,
+        pour les scénarios décrits sans details, l'étape elle-même.
+        """
+        details = step.get("details")
+        return details if isinstance(details, dict) else step
+
+    @staticmethod
+    def _step_context(details: Dict[str, Any]) -> Dict[str, Any]:
+        # "context" pour les étapes décrites sans details, "variables" dans details
+        return {**(details.get("variables") or {}), **(details.get("context") or {})}
+
+    async def _execute_step(
+        self,
+        step: Dict[str, Any],
+        parameters: Dict[str, Any],
+        browser_context: Optional[BrowserContext] = None
+    ) -> Dict[str, Any]:
         """
         Exécute une étape individuelle du scénario.
         
         Args:
             step: Les détails de l'étape à exécuter
+            parameters: Les paramètres d'exécution du scénario
+            browser_context: Le contexte de navigateur de l'exécution, pour les
+                étapes web
             
         Returns:
             Dict[str, Any]: Le résultat de l'exécution de l'étape
         """
         try:
             step_type = step.get("type")
+            details = self._step_details(step)
             
             if step_type == "pdf":
-                # Traitement d'un fichier PDF
-                pdf_file = step.get("file")
+                # Traitement d'un fichier PDF stocké dans MinIO
+                pdf_file = details.get("file")
                 if not pdf_file:
                     raise ValueError("Fichier PDF manquant dans l'étape")
                     
-                text = await self.pdf_service.extract_text_from_pdf(pdf_file)
+                # Plage de pages ("1-5") et arrêt anticipé sur une expression régulière
+                first_page, last_page = parse_page_range(details.get("pages"))
+                until = re.compile(details["until"]) if details.get("until") else None
+                pages = []
+                async for page in self.pdf_service.iter_pdf_pages(
+                    pdf_file,
+                    first_page,
+                    last_page,
+                    until=until.search if until else None
+                ):
+                    pages.append(page)
+                text = "".join(pages)
                 return {
                     "type": "pdf",
                     "status": "success",
@@ -89,8 +173,8 @@ class ScenarioRunner:
                 
             elif step_type == "template":
                 # Traitement d'un template
-                template_name = step.get("template")
-                context = step.get("context", {})
+                template_name = details.get("template") or details.get("template_name")
+                context = {**parameters, **self._step_context(details)}
                 
                 if not template_name:
                     raise ValueError("Nom du template manquant dans l'étape")
@@ -102,6 +186,42 @@ class ScenarioRunner:
                     "result": result
                 }
                 
+            elif step_type == "render":
+                # Rendu d'un template en PDF, enregistré dans MinIO
+                template_name = details.get("template") or details.get("template_name")
+                context = {**parameters, **self._step_context(details)}
+                
+                if not template_name:
+                    raise ValueError("Nom du template manquant dans l'étape")
+                    
+                result = await render_service.render_pdf(template_name, context)
+                return {
+                    "type": "render",
+                    "status": "success",
+                    "result": result
+                }
+                
+            elif step_type == "web":
+                # Navigation puis actions dans une page du contexte de l'exécution
+                url = details.get("url")
+                if not url:
+                    raise ValueError("URL manquante dans l'étape")
+                    
+                async with WebAutomation(context=browser_context) as web_automation:
+                    await web_automation.navigate(url)
+                    for action in details.get("actions", []):
+                        if action["type"] == "click":
+                            await web_automation.click(action["selector"])
+                        elif action["type"] == "fill":
+                            await web_automation.fill(action["selector"], action["value"])
+                        elif action["type"] == "submit":
+                            await web_automation.submit(action["selector"])
+                return {
+                    "type": "web",
+                    "status": "success",
+                    "message": "Web step executed successfully"
+                }
+                
             else:
                 raise ValueError(f"Type d'étape non supporté: {step_type}")
 
@@ -111,4 +231,4 @@ class ScenarioRunner:
                 "type": step.get("type"),
                 "status": "error",
                 "error": str(e)
-            } 
\ No newline at end of file
+            }
@@ -0,0 +1,179 @@
+import asyncio
+
+import pytest
+
+from src.services.step_scheduler import build_dependencies, run_steps
+
+
+def _executor(executed):
+    async def execute(step):
+        executed.append(step["name"])
+        await asyncio.sleep(0)
+        if step.get("fail"):
+            return {"type": step["type"], "status": "error", "error": "échec"}
+        return {"type": step["type"], "status": "success"}
+    return execute
+
+
+def test_continue_after_failed_step_without_fail_fast():
+    steps = [
+        {"name": "a", "type": "web", "fail": True},
+        {"name": "b", "type": "web"},
+        {"name": "c", "type": "web"},
+    ]
+    executed = []
+    results, failed = asyncio.run(run_steps(steps, _executor(executed), 4, fail_fast=False))
+
+    assert failed
+    assert executed == ["a", "b", "c"]
+    assert [result["status"] for result in results] == ["error", "success", "success"]
+
+
+def test_fail_fast_marks_unrun_steps_as_skipped():
+    steps = [
+        {"name": "a", "type": "web"},
+        {"name": "b", "type": "web", "fail": True},
+        {"name": "c", "type": "template"},
+    ]
+    executed = []
+    results, failed = asyncio.run(run_steps(steps, _executor(executed), 4))
+
+    assert failed
+    assert executed == ["a", "b"]
+    assert [result["status"] for result in results] == ["success", "error", "skipped"]
+    assert results[2]["type"] == "template"
+
+
+def test_result_without_status_counts_as_failure():
+    async def execute(step):
+        return {"error": "Type de step non supporté"}
+
+    results, failed = asyncio.run(run_steps([{"type": "unknown"}], execute, 1, fail_fast=False))
+
+    assert failed
+    assert results[0]["status"] == "error"
+
+
+def _tracking_executor(state, delays=None):
+    async def execute(step):
+        state["running"] += 1
+        state["max_running"] = max(state["max_running"], state["running"])
+        await asyncio.sleep((delays or {}).get(step["order"], 0.01))
+        state["running"] -= 1
+        state["finished"].append(step["order"])
+        return {"type": step["type"], "status": "success", "order": step["order"]}
+    return execute
+
+
+def _state():
+    return {"running": 0, "max_running": 0, "finished": []}
+
+
+def test_independent_branches_run_concurrently():
+    steps = [
+        {"order": 1, "type": "pdf", "depends_on": []},
+        {"order": 2, "type": "pdf", "depends_on": []},
+        {"order": 3, "type": "template", "depends_on": [1, 2]},
+    ]
+    state = _state()
+    results, failed = asyncio.run(run_steps(steps, _tracking_executor(state), 4))
+
+    assert not failed
+    assert state["max_running"] == 2
+    assert state["finished"][-1] == 3
+    assert [result["order"] for result in results] == [1, 2, 3]
+
+
+def test_results_follow_step_order_not_completion_order():
+    steps = [
+        {"order": 1, "type": "pdf", "depends_on": []},
+        {"order": 2, "type": "pdf", "depends_on": []},
+    ]
+    state = _state()
+    results, _ = asyncio.run(run_steps(steps, _tracking_executor(state, {1: 0.05, 2: 0.0}), 4))
+
+    assert state["finished"] == [2, 1]
+    assert [result["order"] for result in results] == [1, 2]
+
+
+def test_max_concurrency_caps_running_steps():
+    steps = [{"order": order, "type": "pdf", "depends_on": []} for order in range(1, 7)]
+    state = _state()
+    results, failed = asyncio.run(run_steps(steps, _tracking_executor(state), 2))
+
+    assert not failed
+    assert state["max_running"] == 2
+    assert sorted(state["finished"]) == [1, 2, 3, 4, 5, 6]
+
+
+def test_build_dependencies_maps_orders_to_positions():
+    steps = [
+        {"order": 10, "type": "pdf", "depends_on": []},
+        {"order": 20, "type": "pdf"},
+        {"order": 30, "type": "template", "depends_on": [10, 20]},
+    ]
+
+    assert build_dependencies(steps) == [set(), set(), {0, 1}]
+
+
+def test_build_dependencies_rejects_cycles():
+    steps = [
+        {"order": 1, "type": "pdf", "depends_on": [3]},
+        {"order": 2, "type": "pdf", "depends_on": [1]},
+        {"order": 3, "type": "pdf", "depends_on": [2]},
+    ]
+
+    with pytest.raises(ValueError, match="circulaires"):
+        build_dependencies(steps)
+
+
+def test_build_dependencies_rejects_unknown_dependency():
+    steps = [
+        {"order": 1, "type": "pdf", "depends_on": []},
+        {"order": 2, "type": "pdf", "depends_on": [5]},
+    ]
+
+    with pytest.raises(ValueError, match="inconnue"):
+        build_dependencies(steps)
+
+
+def test_build_dependencies_rejects_duplicate_orders():
+    steps = [
+        {"order": 1, "type": "pdf", "depends_on": []},
+        {"order": 1, "type": "pdf", "depends_on": []},
+    ]
+
+    with pytest.raises(ValueError):
+        build_dependencies(steps)
+
+
+def test_fail_fast_skips_downstream_steps():
+    steps = [
+        {"order": 1, "name": "a", "type": "pdf", "depends_on": [], "fail": True},
+        {"order": 2, "name": "b", "type": "template", "depends_on": [1]},
+        {"order": 3, "name": "c", "type": "render", "depends_on": [2]},
+    ]
+    executed = []
+    results, failed = asyncio.run(run_steps(steps, _executor(executed), 4))
+
+    assert failed
+    assert executed == ["a"]
+    assert [result["status"] for result in results] == ["error", "skipped", "skipped"]
+    assert [result["type"] for result in results] == ["pdf", "template", "render"]
+
+
+def test_fail_fast_cancels_running_branch():
+    async def execute(step):
+        if step["order"] == 1:
+            return {"type": step["type"], "status": "error", "error": "échec"}
+        await asyncio.sleep(10)
+        return {"type": step["type"], "status": "success"}
+
+    steps = [
+        {"order": 1, "type": "pdf", "depends_on": []},
+        {"order": 2, "type": "pdf", "depends_on": []},
+    ]
+    results, failed = asyncio.run(asyncio.wait_for(run_steps(steps, execute, 4), 2))
+
+    assert failed
+    assert [result["status"] for result in results] == ["error", "skipped"]